@@ -0,0 +1 @@
+"""Benchmarks using in-memory fake WebDriver, run as ``python -m benchmarks.<name>`` from the repository root"""
@@ -0,0 +1,55 @@
+"""Element lookups made while accessing every element of a collection
+
+Indexed access (``rows[i]`` for every index) is compared with iteration and filtering,
+which resolve the collection only once.
+"""
+import time
+
+from pyasli.browsers import BrowserSession
+from tests.fake_driver import FakeExecutor, table_page
+
+SIZES = (10, 100, 1000)
+_LOOKUPS = ("findElement", "findElements", "findChildElement", "findChildElements", "script:resolve")
+
+
+def _indexed(rows):
+    return [rows[i].text for i in range(len(rows))]
+
+
+def _iterated(rows):
+    return [row.text for row in rows]
+
+
+def _filtered(rows):
+    return len(rows.filter(lambda row: row.text.endswith("0")))
+
+
+SCENARIOS = {"indexed": _indexed, "iterated": _iterated, "filtered": _filtered}
+
+
+def measure(size: int, scenario) -> tuple[int, int, float]:
+    """Return number of lookups, number of found element references and seconds spent"""
+    executor = FakeExecutor({"/table": table_page(size)})
+    browser = BrowserSession(log_level=None)
+    browser.setup_browser("chrome", remote=True, command_executor=executor)
+    browser.open("/table")
+    rows = browser.element("#table").elements("tr.row")
+    executor.commands.clear()
+    executor.found = 0
+    start = time.perf_counter()
+    scenario(rows)
+    spent = time.perf_counter() - start
+    browser.close_all_windows()
+    return sum(executor.commands[command] for command in _LOOKUPS), executor.found, spent
+
+
+def main():
+    print(f"{'items':>6} {'scenario':>10} {'lookups':>8} {'found':>9} {'seconds':>8}")
+    for size in SIZES:
+        for name, scenario in SCENARIOS.items():
+            lookups, found, spent = measure(size, scenario)
+            print(f"{size:>6} {name:>10} {lookups:>8} {found:>9} {spent:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Memory taken by wrappers of a large collection
+
+Elements are created by indexing (lazy wrappers only, no lookups) and by iteration
+(wrappers together with found web element references). Memory is measured with :mod:`tracemalloc`.
+"""
+import tracemalloc
+
+from pyasli.browsers import BrowserSession
+from tests.fake_driver import FakeExecutor, table_page
+
+SIZE = 10_000
+
+
+def _indexed(rows):
+    return [rows[i] for i in range(SIZE)]
+
+
+def _iterated(rows):
+    return list(rows)
+
+
+SCENARIOS = {"indexed": _indexed, "iterated": _iterated}
+
+
+def measure(scenario) -> tuple[int, int]:
+    """Return bytes allocated by elements kept alive and peak allocation during the scenario"""
+    executor = FakeExecutor({"/table": table_page(SIZE)})
+    browser = BrowserSession(log_level=None)
+    browser.setup_browser("chrome", remote=True, command_executor=executor)
+    browser.open("/table")
+    rows = browser.element("#table").elements("tr.row")
+    tracemalloc.start()
+    elements = scenario(rows)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(elements) == SIZE
+    browser.close_all_windows()
+    return current, peak
+
+
+def main():
+    print(f"{'scenario':>10} {'kept, KiB':>10} {'peak, KiB':>10} {'per element, B':>15}")
+    for name, scenario in SCENARIOS.items():
+        current, peak = measure(scenario)
+        print(f"{name:>10} {current / 1024:>10.0f} {peak / 1024:>10.0f} {current / SIZE:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
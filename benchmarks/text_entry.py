@@ -0,0 +1,55 @@
+"""Setting large texts with keyboard emulation and by script
+
+Runs against in-memory fake WebDriver by default, which shows only the number of round trips.
+Keystroke emulation cost is visible only in a real browser: ``python -m benchmarks.text_entry chrome``
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from pyasli.browsers import BrowserSession
+from tests.fake_driver import FakeExecutor
+
+SIZES = (1_000, 10_000, 200_000)
+_PAGE = ("html", {}, [("body", {}, [("textarea", {"id": "area"}, [])])])
+_DATA_URL = "data:text/html,<textarea id='area'></textarea>"
+
+
+def _session(browser_name: str | None) -> BrowserSession:
+    if browser_name is None:
+        session = BrowserSession(log_level=None)
+        session.setup_browser("chrome", remote=True, command_executor=FakeExecutor({"/area": _PAGE}))
+        session.open("/area")
+        return session
+    session = BrowserSession(browser_name, log_level=None)
+    session.options.headless = True
+    session.open(_DATA_URL)
+    return session
+
+
+def measure(session: BrowserSession, size: int, typed) -> tuple[int, float]:
+    """Return number of round trips and seconds spent setting text of given size"""
+    area = session.element("#area")
+    area.get_actual()
+    session.round_trips.clear()
+    start = time.perf_counter()
+    area.set_text("x" * size, typed=typed)
+    spent = time.perf_counter() - start
+    return sum(session.round_trips.values()), spent
+
+
+def main():
+    session = _session(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"{'chars':>8} {'mode':>8} {'round trips':>12} {'seconds':>8}")
+    try:
+        for size in SIZES:
+            for mode, typed in (("typed", True), ("script", False)):
+                trips, spent = measure(session, size, typed)
+                print(f"{size:>8} {mode:>8} {trips:>12} {spent:>8.3f}")
+    finally:
+        session.close_all_windows()
+
+
+if __name__ == "__main__":
+    main()
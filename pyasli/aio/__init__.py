@@ -0,0 +1,5 @@
+"""Asyncio flavour of browser and elements"""
+
+# Those imports are here to simplify access
+from .browser_session import AsyncBrowserSession  # noqa: F401
+from .elements import AsyncElement, AsyncElementCollection  # noqa: F401
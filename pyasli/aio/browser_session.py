@@ -0,0 +1,104 @@
+"""Asyncio browser management"""
+from __future__ import annotations
+
+import logging
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING, Any
+
+from pyasli.aio.elements import AsyncElement, AsyncElementCollection, AsyncFindElementsMixin
+from pyasli.aio.webdriver import AsyncWebDriver
+from pyasli.browsers.browser_session import URL, BrowserLocatorStrategy, _url_with_base
+from pyasli.elements.searchable import Searchable
+from pyasli.exceptions import NoBrowserException
+
+if TYPE_CHECKING:
+    from pyasli.bys import CssSelectorOrBy
+
+
+class AsyncBrowserSession(Searchable, AsyncFindElementsMixin, AbstractAsyncContextManager):
+    """Lazy asynchronous WebDriver session
+
+    Session talks to remote end (e.g. Selenium Grid or chromedriver) using W3C WebDriver HTTP protocol,
+    so single event loop can drive many sessions at once
+    """
+
+    _actual: AsyncWebDriver | None = None
+    __is_browser__ = True
+    base_url: str = None
+
+    @property
+    def browser(self) -> AsyncBrowserSession:
+        """Browser of browser is self XD"""
+        return self  # pragma: no cover
+
+    def __init__(self, command_executor: str, capabilities: dict | None = None, base_url=None):
+        """Init new lazy browser session
+
+        :param str command_executor: URL of WebDriver remote end, e.g. `http://localhost:4444/wd/hub`
+        :param dict | None capabilities: Capabilities required from the session, Chrome is used by default
+        :param str | None base_url: Base URL of tested website, if any
+        """
+        super().__init__(BrowserLocatorStrategy(self))
+        self.command_executor = command_executor
+        self.capabilities = capabilities or {"browserName": "chrome"}
+        self.browser_name = self.capabilities.get("browserName", "remote")
+        self.base_url = base_url
+        self.logger = logging.getLogger(f"{__name__}.{self.browser_name}")
+
+    async def __init_browser(self):
+        """Start new remote session"""
+        if self._actual is not None:
+            return
+        self.logger.debug("Starting %s session at %s", self.browser_name, self.command_executor)
+        driver = AsyncWebDriver(self.command_executor)
+        await driver.start_session(self.capabilities)
+        self._actual = driver
+
+    async def open(self, url: str):  # noqa: A003
+        """Open given URL"""
+        await self.__init_browser()
+        url = _url_with_base(self.base_url, url)
+        self.logger.debug('Open page at "%s"', url)
+        await self._actual.get(url)
+
+    def element(self, by: CssSelectorOrBy) -> AsyncElement:
+        """Find single element by locator (css selector by default)"""
+        # pylint: disable=useless-super-delegation
+        return super().element(by)
+
+    def elements(self, by: CssSelectorOrBy) -> AsyncElementCollection:
+        """Find multiple elements by locator (css selector by default)"""
+        # pylint: disable=useless-super-delegation
+        return super().elements(by)
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Execute synchronous JS in the browser"""
+        driver = await self.get_actual()
+        return await driver.execute_script(script, *args)
+
+    async def close_window(self):
+        """Close current browser window"""
+        self.logger.debug("Closing current browser window")
+        driver = await self.get_actual()
+        await driver.close()
+
+    async def close_all_windows(self):
+        """Close all browser windows and delete the session"""
+        self.logger.debug("Closing current all browser windows and quitting")
+        if self._actual is not None:
+            driver, self._actual = self._actual, None
+            await driver.quit()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close_all_windows()
+
+    async def url(self) -> URL:
+        """Get current page URL"""
+        driver = await self.get_actual()
+        return URL(await driver.current_url(), self.base_url)
+
+    async def get_actual(self) -> AsyncWebDriver:
+        """Get WebDriver client"""
+        if self._actual is None:
+            raise NoBrowserException("No browser is started")
+        return self._actual
@@ -0,0 +1,362 @@
+"""Asyncio flavour of lazy elements
+
+Elements use the same locator chain as synchronous ones, but resolve it with non-blocking WebDriver client
+"""
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any
+
+import wrapt
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pyasli import conditions
+from pyasli.bys import CssSelectorOrBy, by_xpath
+from pyasli.elements.elements import _css_to_by
+from pyasli.elements.locators import (
+    ConditionLocator,
+    FilteredCollectionLocator,
+    FindElementLocator,
+    IndexElementLocator,
+    MultipleElementLocator,
+    SingleElementLocator,
+    SlicedElementLocator,
+    SubElementLocator,
+)
+from pyasli.elements.scripts import build_script, compile_by, predicate_of
+from pyasli.elements.searchable import LocatorStrategy, Searchable
+from pyasli.wait import PollingPolicy, async_poll, deadline, wait_deadline
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from pyasli.aio.webdriver import AsyncWebElement
+
+_CHECK_PREDICATE = "return __preds[0](arguments[0]);"
+
+
+def _w3c_by(by: tuple[str, str]) -> tuple[str, str]:
+    """Convert locator to one of W3C location strategies"""
+    compiled = compile_by(by)
+    if compiled is None:  # e.g. link text
+        return by
+    how, what = compiled
+    return (By.CSS_SELECTOR if how == "css" else By.XPATH), what
+
+
+async def _search_in_context(context: Searchable, method: str, by: tuple, _retry=True) -> list[AsyncWebElement]:
+    actual = await context.get_actual()
+    if not isinstance(actual, list):
+        actual = [actual]
+    result = []
+    for elem in actual:
+        try:
+            found = await getattr(elem, method)(*_w3c_by(by))
+        except StaleElementReferenceException:
+            if not _retry:
+                raise
+            context.__cached__ = None
+            return await _search_in_context(context, method, by, _retry=False)
+        except NoSuchElementException:
+            continue
+        if isinstance(found, list):
+            result.extend(found)
+        else:
+            result.append(found)
+            break  # only first found element is used
+    if not result:
+        raise NoSuchElementException(f"Nothing found using locator {by}")
+    return result
+
+
+async def _resolve_condition(locator: ConditionLocator) -> list[AsyncWebElement]:
+    collection = locator._collection  # noqa: SLF001
+    matching = []
+    for element in await collection.snapshot():
+        if await check(locator._condition, element):  # noqa: SLF001
+            matching.append(element.__cached__)
+            if isinstance(locator, FindElementLocator):
+                break
+    return matching
+
+
+async def resolve(locator: LocatorStrategy) -> AsyncWebElement | list[AsyncWebElement]:
+    """Resolve locator chain using asynchronous WebDriver client"""
+    # pylint: disable=protected-access
+    if isinstance(locator, SubElementLocator):
+        whole = await resolve(locator._whole)  # noqa: SLF001
+        if isinstance(locator, SlicedElementLocator):
+            return whole[locator._sub]  # noqa: SLF001
+        try:
+            return whole[locator._sub]  # noqa: SLF001
+        except IndexError:
+            raise NoSuchElementException(f"No element matching {locator!r}") from None
+    if isinstance(locator, ConditionLocator):
+        matching = await _resolve_condition(locator)
+        if isinstance(locator, FilteredCollectionLocator):
+            return matching
+        if not matching:
+            raise NoSuchElementException(f"No element matching {locator!r}")
+        return matching[0]
+    if isinstance(locator, MultipleElementLocator):
+        return await _search_in_context(locator.context, "find_elements", locator.by)
+    found = await _search_in_context(locator.context, "find_element", locator.by)
+    return found[0]
+
+
+async def check(condition: Callable, element: AsyncElement | AsyncElementCollection) -> bool:
+    """Check condition for element
+
+    Conditions having browser-side predicate are checked with single script,
+    combinations of conditions (see :func:`pyasli.conditions.and_`) are checked part by part,
+    others are called with the element and awaited if needed
+    """
+    predicate = predicate_of(condition)
+    if predicate is not None and isinstance(element, AsyncElement):
+        return await element.evaluate(predicate)
+    combination = getattr(condition, "combination", None)
+    if combination is not None:
+        operator, parts = combination
+        if operator == "not":
+            return not await check(parts[0], element)
+        stop_on = operator == "or"  # `and` stops on the first failed part, `or` on the first passed one
+        for part in parts:
+            if await check(part, element) is stop_on:
+                return stop_on
+        return not stop_on
+    result = condition(element)
+    if inspect.isawaitable(result):
+        result = await result
+    return bool(result)
+
+
+@wrapt.decorator
+async def _should_exist(wrapped, instance: AsyncElement = None, args=(), kwargs=None):
+    """Wait for element existence before running the method, retry once if element has gone stale"""
+    if instance is None:
+        instance = args[0]
+
+    async def _exists(_el):
+        return await _el.exists
+
+    await instance.assure(_exists)
+    try:
+        return await wrapped(*args, **kwargs)
+    except StaleElementReferenceException:
+        instance.__cached__ = None  # invalidate cache
+        return await wrapped(*args, **kwargs)
+
+
+class AsyncFindElementsMixin:
+    """Adding `element` and `elements` methods to class"""
+
+    def element(self, by: CssSelectorOrBy) -> AsyncElement:
+        """Search for single child element"""
+        return AsyncElement(SingleElementLocator(_css_to_by(by), self))
+
+    def elements(self, by: CssSelectorOrBy) -> AsyncElementCollection:
+        """Search for multiple child elements"""
+        return AsyncElementCollection(MultipleElementLocator(_css_to_by(by), self))
+
+
+class AsyncElement(Searchable, AsyncFindElementsMixin):
+    """Single lazy element, properties and methods should be awaited"""
+
+    async def get_actual(self) -> AsyncWebElement:
+        """Get element, check if it's cached"""
+        if self.__cached__ is None:
+            self.__cached__ = await self._search()
+        return self.__cached__
+
+    async def _search(self) -> AsyncWebElement:
+        return await resolve(self._locator)
+
+    async def evaluate(self, predicate: str) -> bool:
+        """Check browser-side predicate for freshly found element (`null` if it is missing)"""
+        try:
+            self.__cached__ = await self._search()
+        except NoSuchElementException:
+            self.__cached__ = None
+        driver = await self.browser.get_actual()
+        return await driver.execute_script(build_script(_CHECK_PREDICATE, (predicate,), "check"), self.__cached__)
+
+    async def __wait_for_condition(self, condition, timeout, exception_cls, polling):
+        with deadline(timeout):
+            async for _ in async_poll(polling, timeout):
+                if await check(condition, self):
+                    self.browser.logger.debug("Condition %s reached for element %s", condition.__name__, self)
+                    return
+        raise exception_cls(f"Condition {condition.__name__} is not reached in {timeout} seconds for {self}")
+
+    async def assure(self, condition, timeout=5, polling: PollingPolicy = None):
+        """Make sure that element matches condition or raises :class:`TimeoutError`"""
+        await self.__wait_for_condition(condition, timeout, TimeoutError, polling)
+
+    async def should(self, condition, timeout=5, polling: PollingPolicy = None):
+        """Make sure that element matches condition or raises :class:`AssertionError`"""
+        await self.__wait_for_condition(condition, timeout, AssertionError, polling)
+
+    should_be = should
+
+    @property
+    def exists(self) -> Awaitable[bool]:
+        """Check if element exists in dom"""
+        return self._exists()
+
+    async def _exists(self) -> bool:
+        try:
+            self.__cached__ = await self._search()  # found element will be used by following action
+        except NoSuchElementException:
+            return False
+        return True
+
+    @property
+    def visible(self) -> Awaitable[bool]:
+        """Check if element is visible"""
+        return self.evaluate(conditions.visible.js)
+
+    @property
+    def hidden(self) -> Awaitable[bool]:
+        """Check if element is hidden"""
+        return self.evaluate(conditions.hidden.js)
+
+    @property
+    @_should_exist
+    async def enabled(self) -> bool:
+        """Return element enabled state"""
+        return await self.evaluate(conditions.enabled.js)
+
+    @property
+    def disabled(self) -> Awaitable[bool]:
+        """Return element disabled state"""
+        return self._disabled()
+
+    async def _disabled(self) -> bool:
+        return not await self.enabled
+
+    @property
+    @_should_exist
+    async def text(self) -> str:
+        """Get element text"""
+        return await (await self.get_actual()).text()
+
+    @_should_exist
+    async def set_text(self, value: str):
+        """Set element text (if possible)"""
+        actual = await self.get_actual()
+        await actual.clear()
+        await actual.send_keys(value)
+
+    @property
+    def value(self) -> Awaitable[Any]:
+        """Get element @value attribute"""
+        return self.get_attribute("value")
+
+    @property
+    @_should_exist
+    async def selected(self) -> bool:
+        """Return element selected state"""
+        return await (await self.get_actual()).is_selected()
+
+    @property
+    @_should_exist
+    async def tag_name(self) -> str:
+        """Get element tag name"""
+        return await (await self.get_actual()).tag_name()
+
+    @property
+    @_should_exist
+    async def size(self) -> dict:
+        """Element size"""
+        rect = await (await self.get_actual()).rect()
+        return {"height": rect["height"], "width": rect["width"]}
+
+    @_should_exist
+    async def get_attribute(self, name: str) -> str | None:
+        """Get element attribute value"""
+        return await (await self.get_actual()).get_attribute(name)
+
+    @_should_exist
+    async def click(self):
+        """Click element"""
+        await (await self.get_actual()).click()
+
+    @_should_exist
+    async def clear(self):
+        """Clear input field"""
+        await (await self.get_actual()).clear()
+
+    @property
+    def parent(self) -> AsyncElement:
+        """Return parent element of given one"""
+        return self.element(by_xpath("./.."))
+
+    def __repr__(self):
+        return f"Element by: {self._locator!r}"
+
+
+class AsyncElementCollection(Searchable, AsyncFindElementsMixin):
+    """Collection of lazy elements"""
+
+    _locator: MultipleElementLocator
+
+    def __init__(self, locator: MultipleElementLocator):
+        super().__init__(locator)
+
+    async def get_actual(self) -> list[AsyncWebElement]:
+        """Get elements, check if they are cached"""
+        if self.__cached__ is None:
+            self.__cached__ = await self._search()
+        return self.__cached__
+
+    async def _search(self) -> list[AsyncWebElement]:
+        return await resolve(self._locator)
+
+    def __getitem__(self, index: int | slice) -> AsyncElement | AsyncElementCollection:
+        if isinstance(index, slice):
+            return AsyncElementCollection(SlicedElementLocator(self._locator, index))
+        return AsyncElement(IndexElementLocator(self._locator, index))
+
+    async def length(self) -> int:
+        """Number of elements currently matching the locator"""
+        try:
+            return len(await self._search())
+        except NoSuchElementException:
+            return 0
+
+    async def snapshot(self) -> list[AsyncElement]:
+        """Resolve collection once and return elements bound to found web elements"""
+        found = await self._search()
+        elements = []
+        for index, actual in enumerate(found):
+            element = AsyncElement(IndexElementLocator(self._locator, index))
+            element.__cached__ = actual
+            elements.append(element)
+        return elements
+
+    async def __aiter__(self) -> AsyncIterator[AsyncElement]:
+        for element in await self.snapshot():
+            yield element
+
+    def filter(self, condition: Callable[[AsyncElement], Any]) -> AsyncElementCollection:  # noqa: A003
+        """Filter list of collection elements filtered by condition applied to `AsyncElement`"""
+        return AsyncElementCollection(FilteredCollectionLocator(self, condition))
+
+    def find(self, condition: Callable[[AsyncElement], Any]) -> AsyncElement:
+        """Find single collection element by condition"""
+        return AsyncElement(FindElementLocator(self, condition))
+
+    async def assure_all(self, condition, timeout=5, exception=TimeoutError, polling: PollingPolicy = None):
+        """Assure condition matches for all elements"""
+        with wait_deadline(timeout, [self]):
+            full_length = await self.length()
+            matching = 0
+            async for _ in async_poll(polling, timeout):
+                matching = await self.filter(condition).length()
+                if matching == full_length:
+                    return
+        raise exception(f"{full_length - matching} elements are not matching condition")
+
+    def __repr__(self):
+        return f"Element Collection by: {self._locator!r}"
@@ -0,0 +1,267 @@
+"""Non-blocking W3C WebDriver client"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import ssl
+from typing import Any
+from urllib.parse import urlsplit
+
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+_ERROR_HANDLER = ErrorHandler()
+
+
+class AsyncHttpClient:
+    """Minimal HTTP/1.1 JSON client with single keep-alive connection
+
+    Requests are sent one by one, so single client should be used by single session only
+    """
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self._secure = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port or (443 if self._secure else 80)
+        self._prefix = parts.path.rstrip("/")
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> bool:
+        """Open connection if there is no one, return `True` if existing connection is reused"""
+        if self._writer is not None:
+            return True
+        ssl_context = ssl.create_default_context() if self._secure else None
+        self._reader, self._writer = await asyncio.open_connection(self._host, self._port, ssl=ssl_context)
+        return False
+
+    async def close(self):
+        """Close connection"""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is None:
+            return
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+    async def _read_body(self, headers: dict[str, str]) -> bytes:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                size = int((await self._reader.readline()).split(b";")[0], 16)
+                chunk = await self._reader.readexactly(size + 2)  # chunk is followed by CRLF
+                if size == 0:
+                    return body
+                body += chunk[:-2]
+        if "content-length" in headers:
+            return await self._reader.readexactly(int(headers["content-length"]))
+        body = await self._reader.read()  # no length: body lasts until connection is closed
+        await self.close()
+        return body
+
+    async def _exchange(self, request: bytes) -> tuple[int, bytes]:
+        reused = await self._connect()
+        self._writer.write(request)
+        await self._writer.drain()
+        status_line = await self._reader.readline()
+        if not status_line:
+            await self.close()
+            if reused:  # server has closed idle keep-alive connection, request was not processed
+                return await self._exchange(request)
+            raise ConnectionResetError("Connection closed by WebDriver server")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = (await self._reader.readline()).decode("latin-1")
+            if not line.strip():
+                break
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        body = await self._read_body(headers)
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, body
+
+    async def request(self, method: str, path: str, payload: dict | None = None) -> Any:
+        """Send request and return `value` of JSON response
+
+        :raises WebDriverException: matching error returned by WebDriver server
+        """
+        body = b"" if payload is None else json.dumps(payload).encode("utf8")
+        head = (
+            f"{method} {self._prefix}{path} HTTP/1.1\r\n"
+            f"Host: {self._host}:{self._port}\r\n"
+            "Accept: application/json\r\n"
+            "Content-Type: application/json;charset=UTF-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        async with self._lock:
+            try:
+                status, data = await self._exchange(head.encode("latin-1") + body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                raise
+        text = data.decode("utf8")
+        if status >= 400:  # noqa: PLR2004
+            _ERROR_HANDLER.check_response({"status": status, "value": text})
+        return json.loads(text)["value"] if text else None
+
+
+class AsyncWebElement:
+    """Reference to element of remote browser"""
+
+    def __init__(self, driver: AsyncWebDriver, element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    def __eq__(self, other):
+        return isinstance(other, AsyncWebElement) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"<AsyncWebElement {self.id}>"
+
+    async def _execute(self, method: str, command: str, payload: dict | None = None) -> Any:
+        return await self.driver.execute(method, f"/element/{self.id}{command}", payload)
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        """Find first child element"""
+        found = await self._execute("POST", "/element", {"using": by, "value": value})
+        return self.driver.unwrap(found)
+
+    async def find_elements(self, by: str, value: str) -> list[AsyncWebElement]:
+        """Find all child elements"""
+        found = await self._execute("POST", "/elements", {"using": by, "value": value})
+        return self.driver.unwrap(found)
+
+    async def click(self):
+        """Click element"""
+        await self._execute("POST", "/click", {})
+
+    async def clear(self):
+        """Clear editable element"""
+        await self._execute("POST", "/clear", {})
+
+    async def send_keys(self, text: str):
+        """Type text to element"""
+        await self._execute("POST", "/value", {"text": text})
+
+    async def text(self) -> str:
+        """Rendered element text"""
+        return await self._execute("GET", "/text")
+
+    async def tag_name(self) -> str:
+        """Element tag name"""
+        return await self._execute("GET", "/name")
+
+    async def get_attribute(self, name: str) -> str | None:
+        """Element attribute value"""
+        return await self._execute("GET", f"/attribute/{name}")
+
+    async def get_property(self, name: str) -> Any:
+        """Element property value"""
+        return await self._execute("GET", f"/property/{name}")
+
+    async def is_selected(self) -> bool:
+        """Element selected state"""
+        return await self._execute("GET", "/selected")
+
+    async def is_enabled(self) -> bool:
+        """Element enabled state"""
+        return await self._execute("GET", "/enabled")
+
+    async def rect(self) -> dict:
+        """Element position and size"""
+        return await self._execute("GET", "/rect")
+
+
+class AsyncWebDriver:
+    """Client of single remote WebDriver session"""
+
+    session_id: str = None
+
+    def __init__(self, command_executor: str):
+        self._client = AsyncHttpClient(command_executor)
+
+    async def start_session(self, capabilities: dict) -> dict:
+        """Create new session, return its capabilities"""
+        result = await self._client.request("POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        self.session_id = result["sessionId"]
+        return result["capabilities"]
+
+    async def quit(self):  # noqa: A003
+        """Delete the session and close connection"""
+        try:
+            await self.execute("DELETE", "")
+        finally:
+            self.session_id = None
+            await self._client.close()
+
+    async def execute(self, method: str, command: str, payload: dict | None = None) -> Any:
+        """Execute session command"""
+        return await self._client.request(method, f"/session/{self.session_id}{command}", payload)
+
+    def wrap(self, value: Any) -> Any:
+        """Convert element references in script arguments to W3C format"""
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        return value
+
+    def unwrap(self, value: Any) -> Any:
+        """Convert W3C element references in response to :class:`AsyncWebElement`"""
+        if isinstance(value, list):
+            return [self.unwrap(item) for item in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self.unwrap(item) for key, item in value.items()}
+        return value
+
+    async def get(self, url: str):
+        """Navigate to URL"""
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self) -> str:
+        """URL of current page"""
+        return await self.execute("GET", "/url")
+
+    async def close(self):
+        """Close current window"""
+        await self.execute("DELETE", "/window")
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        """Find first element on the page"""
+        return self.unwrap(await self.execute("POST", "/element", {"using": by, "value": value}))
+
+    async def find_elements(self, by: str, value: str) -> list[AsyncWebElement]:
+        """Find all elements on the page"""
+        return self.unwrap(await self.execute("POST", "/elements", {"using": by, "value": value}))
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Execute synchronous JS in the browser"""
+        result = await self.execute("POST", "/execute/sync", {"script": script, "args": self.wrap(list(args))})
+        return self.unwrap(result)
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        """Execute asynchronous JS in the browser"""
+        result = await self.execute("POST", "/execute/async", {"script": script, "args": self.wrap(list(args))})
+        return self.unwrap(result)
+
+    async def set_timeouts(self, **timeouts: int):
+        """Set session timeouts in milliseconds (`script`, `pageLoad`, `implicit`)"""
+        await self.execute("POST", "/timeouts", timeouts)
+
+    async def screenshot(self) -> str:
+        """Page screenshot as base64-encoded PNG"""
+        return await self.execute("GET", "/screenshot")
@@ -7,6 +7,7 @@ import logging
 import os
 import re
 import warnings
+from collections import Counter
 from contextlib import AbstractContextManager
 from logging.handlers import TimedRotatingFileHandler
 from typing import TYPE_CHECKING, Any, NamedTuple
@@ -21,15 +22,23 @@ from selenium.webdriver import (
     IeOptions,
     Remote,
 )
+from selenium.webdriver.remote.command import Command
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import IEDriverManager
 
+from pyasli.elements.actions import ActionBatch
 from pyasli.elements.elements import Element, ElementCollection, FindElementsMixin
+from pyasli.elements.frozen import FrozenState
+from pyasli.elements.identity import IdentityMap
+from pyasli.elements.locator_ir import LocatorIR
+from pyasli.elements.lookup_cache import LookupCache
 from pyasli.elements.searchable import LocatorStrategy, Searchable
-from pyasli.exceptions import NoBrowserException, Screenshotable
+from pyasli.exceptions import FrozenPageError, NoBrowserException, Screenshotable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
     from selenium.webdriver.remote.webdriver import WebDriver
 
     from pyasli.bys import CssSelectorOrBy
@@ -61,14 +70,25 @@ _FULL_URL_RE = re.compile(r"http(s)?://.+")
 # noinspection PyTypeChecker
 class BrowserLocatorStrategy(LocatorStrategy):
     """Root level locator strategy"""
+
+    __slots__ = ()
     context: BrowserSession  # pylint: disable=used-before-assignment
 
     def get(self) -> Any:
         """Return actual browser"""
         raise NotImplementedError  # should not be used
 
-    def __repr__(self) -> str:
-        return self.context.browser_name.capitalize()
+    def chain_steps(self, use_cache=True) -> tuple[None, tuple]:  # noqa: ARG002
+        """Browser is the root of all steps"""
+        return None, ()
+
+    @property
+    def ir(self) -> LocatorIR:
+        """Chain root, not cached as browser can be set up again"""
+        return self._build_ir()
+
+    def _build_ir(self) -> LocatorIR:
+        return LocatorIR("browser", (self.context.browser_name.capitalize(),))
 
     def __init__(self, browser_session: BrowserSession):
         super().__init__(None, browser_session)
@@ -87,6 +107,37 @@ class BrowserSession(Searchable, FindElementsMixin, AbstractContextManager, Scre
 
     base_url: str = None
 
+    # check conditions having browser-side predicate in browser instead of Python polling
+    browser_side_waits = False
+    # run element actions on cached web element, checking existence only if it has gone stale or missing
+    trust_cache = False
+    # resolve chains of several locators with single script instead of a search per locator
+    flatten_chains = True
+    # find elements by scripts, reusing found elements while DOM is not changed, see `LookupCache`
+    cache_lookups = False
+    # share found web elements between wrappers of equal locators, see `identity_map`
+    share_handles = True
+    # number of times element action is retried after element has gone stale
+    stale_retries = 3
+    # element interactions collected by current `batch_actions` block
+    action_batch: ActionBatch | None = None
+    # pinned lookups and reads of current `frozen` block
+    frozen_state: FrozenState | None = None
+    # texts of at least this length are set by script instead of keyboard emulation, `None` to always type
+    bulk_text_threshold = 1024
+    # max length of text part sent by single script when text is set by script
+    bulk_text_chunk = 256 * 1024
+    # total seconds waits for elements of the session may take, e.g. per test, `None` for no limit;
+    # element `assure`/`should`, `assure_all` and `pyasli.wait` functions are limited, see `wait_deadline`
+    wait_budget: float | None = None
+    # seconds taken by outermost waits for elements of the session, counted against `wait_budget`,
+    # reset it to start new budget
+    waited = 0.0
+    # seconds for which element snapshot is used by element properties
+    snapshot_ttl = 0.5
+    # number of page-changing actions done, element snapshots taken before the last one are not used
+    page_changes = 0
+
     @property
     def browser(self) -> BrowserSession:
         """Browser of browser is self XD"""
@@ -105,6 +156,11 @@ class BrowserSession(Searchable, FindElementsMixin, AbstractContextManager, Scre
         :param int | None log_level: Level of used logger or `None` for no logging.
         """
         super().__init__(BrowserLocatorStrategy(self))
+        self.round_trips = Counter()  # WebDriver commands sent by the session, by command name
+        self.events = Counter()  # internal pyasli events, e.g. trusted cache hits and misses
+        self.stale_recoveries = Counter()  # recoveries from stale elements, by page URL
+        self.lookup_cache = LookupCache(self.events)
+        self.identity_map = IdentityMap()
         self.setup_browser(browser)
         self.base_url = base_url
         # setup logging
@@ -167,23 +223,103 @@ class BrowserSession(Searchable, FindElementsMixin, AbstractContextManager, Scre
         if browser_cls is Remote:
             self._actual = Remote(desired_capabilities=self.desired_capabilities, options=self.options,
                                   **self._other_options)
+        else:
+            driver_path = _MANAGER_MAPPING[self.browser_name]().install()
+            self._actual = browser_cls(executable_path=driver_path, options=self.options,
+                                       desired_capabilities=self.desired_capabilities, **self._other_options)
+        self._count_round_trips(self._actual)
+
+    def _count_round_trips(self, webdriver: Remote):
+        """Count every command sent to the WebDriver in `round_trips`
+
+        Driver is wrapped only once, commands of the driver set again are counted by the session it's set to last
+        """
+        if hasattr(webdriver.execute, "session"):  # already counted
+            webdriver.execute.session = self
             return
-        driver_path = _MANAGER_MAPPING[self.browser_name]().install()
-        self._actual = browser_cls(executable_path=driver_path, options=self.options,
-                                   desired_capabilities=self.desired_capabilities, **self._other_options)
+        execute = webdriver.execute
+
+        def _execute(driver_command, params=None):
+            _execute.session.round_trips[driver_command] += 1
+            return execute(driver_command, params)
+
+        _execute.session = self
+        webdriver.execute = _execute
 
     def set_driver(self, webdriver: Remote):
         """Override lazy driver initialization with already initialized webdriver"""
         warnings.warn("To be deleted, target usage is not defined", DeprecationWarning, stacklevel=2)
 
         self.logger.debug("Set driver to %s ", webdriver)
-        if self._actual is not None:
+        if self._actual is not None and self._actual is not webdriver:
             self.logger.debug("Driver already running, quit first")
             self._actual.quit()
         self._actual = webdriver
+        self.lookup_cache.clear()
+        self.identity_map.clear()
+        self._count_round_trips(webdriver)
+
+    @contextlib.contextmanager
+    def script_timeout(self, timeout: float) -> Iterator[None]:
+        """Block in which async scripts are allowed to run for at least `timeout` seconds
+
+        Script timeout of the session is raised only if it's shorter and restored on block exit,
+        so timeout of other async scripts is not changed
+        """
+        driver = self.get_actual()
+        previous = driver.execute(Command.GET_TIMEOUTS)["value"].get("script")  # milliseconds, `None` for no limit
+        if previous is None or previous >= timeout * 1000:
+            yield
+            return
+        driver.set_script_timeout(timeout)
+        try:
+            yield
+        finally:
+            driver.set_script_timeout(previous / 1000)
+
+    @contextlib.contextmanager
+    def frozen(self) -> Iterator[None]:
+        """Block of read-only checks of the page which is not changing
+
+        Inside the block the first found elements and the first read values of element properties
+        are used by all following reads, condition waits make a single check.
+        Page-changing actions raise :class:`FrozenPageError`. Everything is released on block exit.
+        Nested blocks share state of the outer one.
+        """
+        if self.frozen_state is not None:
+            yield
+            return
+        self.frozen_state = state = FrozenState()
+        try:
+            yield
+        finally:
+            self.frozen_state = None
+            state.release()
+
+    @contextlib.contextmanager
+    def batch_actions(self) -> Iterator[ActionBatch]:
+        """Block of element interactions sent to the browser as a single actions request
+
+        `click`, `double_click`, `hover`, `right_click` and `move_to` of elements inside the block
+        are collected, modifier keys and pauses can be added to the yielded batch.
+        On block exit not cached elements are found with a single script and all the actions are performed at once.
+        Batched `move_to` does not scroll the element into view separately from the pointer move.
+        Nothing is performed if the block raises. Nested blocks share the outer batch.
+        """
+        if self.action_batch is not None:
+            yield self.action_batch
+            return
+        self.action_batch = batch = ActionBatch(self)
+        try:
+            yield batch
+        finally:
+            self.action_batch = None
+        batch.perform()
 
     def open(self, url: str):  # noqa: A003
         """Open given URL"""
+        if self.frozen_state is not None:
+            raise FrozenPageError(f"Page can't be opened inside frozen block: {url}")
         self.__init_browser()
 
         if self.base_url and not _FULL_URL_RE.fullmatch(url):
@@ -191,6 +327,9 @@ class BrowserSession(Searchable, FindElementsMixin, AbstractContextManager, Scre
                 url = f"/{url}"
             url = f"{self.base_url}{url}"
         self.logger.debug('Open page at "%s"', url)
+        self.page_changes += 1
+        self.lookup_cache.clear()
+        self.identity_map.clear()
         self._actual.get(url)
 
     def element(self, by: CssSelectorOrBy) -> Element:
@@ -203,6 +342,19 @@ class BrowserSession(Searchable, FindElementsMixin, AbstractContextManager, Scre
         # pylint: disable=useless-super-delegation
         return super().elements(by)
 
+    def fill(self, values: Mapping[CssSelectorOrBy, Any], typed: Iterable[CssSelectorOrBy] = ()):
+        """Set values of form fields found by locators (css selectors by default) with a single script call
+
+        Text fields get string values, checkboxes get booleans, radio buttons get either boolean
+        or value of the radio button of the same group to be checked, selects get option value or text
+        (or list of them for multiple select). Input and change events are fired for every field.
+        `typed` fields and fields with locators which can't be resolved in the browser are set with element actions:
+        checkboxes and radio buttons are clicked, text fields are cleared for `None`.
+
+        :param typed: Locators of text fields filled with keyboard emulation, one field at a time
+        """
+        self._fill(values, typed)
+
     def add_cookie(self, cookie_dict: dict):
         """Add cookies to cookie storage"""
         self._check_running()
@@ -225,6 +377,8 @@ class BrowserSession(Searchable, FindElementsMixin, AbstractContextManager, Scre
         if self._actual is not None:
             self._actual.quit()
             self._actual = None
+            self.lookup_cache.clear()
+            self.identity_map.clear()
 
     @property
     def url(self) -> URL:
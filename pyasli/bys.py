@@ -1,9 +1,9 @@
 """Locator techniques"""
-from typing import Union
+from typing import Tuple, Union
 
 from selenium.webdriver.common.by import By
 
-ByLocator = tuple[str, str]
+ByLocator = Tuple[str, str]
 
 CssSelectorOrBy = Union[str, ByLocator]
 
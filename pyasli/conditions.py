@@ -1,6 +1,16 @@
 """List of helpers with commonly used conditions"""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pyasli.elements.elements import Element, ElementCondition
+from pyasli.elements.scripts import js_string, predicate_of
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyasli.elements.elements import ElementCollection
 
 # pylint: disable=invalid-name
 
@@ -37,26 +47,85 @@ def __missing(element: Element):
     return not element.exists
 
 
-def __clickable(element: Element) -> bool:
-    """Check if element available for interaction"""
-    return __visible(element) and __enabled(element)
-
-
-def __rename(fnc, name):
+def __rename(fnc, name, js=None):
     fnc.__name__ = name
+    fnc.operator = None  # named condition reads as a single operand of combinations
+    if js is not None:
+        fnc.js = js  # browser-side predicate of `el` (`null` for missing element)
     return fnc
 
 
+_NOT_NULL = "el !== null && "
+
+
+def __operand_name(condition, operator: str) -> str:
+    """Condition name as operand of `operator`, combination of other operator is put in brackets"""
+    if getattr(condition, "operator", None) in (None, operator):
+        return condition.__name__
+    return f"({condition.__name__})"
+
+
+def __combine(operator: str, conditions: tuple[Callable, ...], check: Callable) -> ElementCondition:
+    """Build condition combining `conditions` with boolean `operator`
+
+    If every condition has browser-side predicate, they are composed into single predicate,
+    so element is found and checked by a single script instead of a round trip per condition.
+    Element having fresh snapshot is checked by the conditions, which read its values from the snapshot.
+    `combination` attribute of the result keeps the operator and combined conditions
+    """
+    predicates = [predicate_of(condition) for condition in conditions]
+    if None in predicates:
+        js = None
+    elif operator == "not":
+        js = f"!({predicates[0]})"
+    elif operator == "and" and all(predicate.startswith(_NOT_NULL) for predicate in predicates):
+        js = _NOT_NULL + " && ".join(f"({predicate[len(_NOT_NULL):]})" for predicate in predicates)
+    else:
+        js = f" {'&&' if operator == 'and' else '||'} ".join(f"({predicate})" for predicate in predicates)
+
+    def _combined(element):
+        if js is not None and isinstance(element, Element) and element.fresh_snapshot is None:
+            return element.evaluate(js)
+        return check(element)
+
+    if operator == "not":
+        _combined.__name__ = f"not {__operand_name(conditions[0], operator)}"
+    else:
+        _combined.__name__ = f" {operator} ".join(__operand_name(condition, operator) for condition in conditions)
+    _combined.operator = operator
+    _combined.combination = operator, conditions
+    if js is not None:
+        _combined.js = js
+    return _combined
+
+
+def and_(*conditions: ElementCondition) -> ElementCondition:
+    """All of conditions are matched"""
+    return __combine("and", conditions, lambda element: all(condition(element) for condition in conditions))
+
+
+def or_(*conditions: ElementCondition) -> ElementCondition:
+    """Any of conditions is matched"""
+    return __combine("or", conditions, lambda element: any(condition(element) for condition in conditions))
+
+
+def not_(condition: ElementCondition) -> ElementCondition:
+    """Condition is not matched"""
+    return __combine("not", (condition,), lambda element: not condition(element))
+
+
 # looks stupid, but this way PyCharm won't add brackets automatically
-visible = __rename(__visible, "visible")
-hidden = __rename(__hidden, "hidden")
-exist = __rename(__exists, "exist")
-missing = __rename(__missing, "missing")
-enabled = __rename(__enabled, "enabled")
-disabled = __rename(__disabled, "disabled")
-clickable = __rename(__clickable, "clickable")
+visible = __rename(__visible, "visible", "el !== null && __isShown(el)")
+hidden = __rename(__hidden, "hidden", "el === null || !__isShown(el)")
+exist = __rename(__exists, "exist", "el !== null")
+missing = __rename(__missing, "missing", "el === null")
+enabled = __rename(__enabled, "enabled", "el !== null && __enabled(el)")
+disabled = __rename(__disabled, "disabled", "el !== null && !__enabled(el)")
+clickable = __rename(and_(visible, enabled), "clickable")
 
 
+# text conditions have no browser-side predicate: text read in the browser differs from WebDriver element text
+# (e.g. in non-breaking spaces and whitespace around line breaks), so they are always checked with `Element.text`
 def text_is(text: str) -> ElementCondition:
     """Element text is"""
 
@@ -78,3 +147,40 @@ def have_text(text: str) -> ElementCondition:
 
 
 has_text = have_text  # backward compatibility
+
+
+def have_attribute(name: str, value: str | None = None) -> ElementCondition:
+    """Element has attribute, equal to `value` if it's given"""
+
+    def _has_attribute(element):
+        actual = element.get_attribute(name)
+        return actual is not None if value is None else actual == value
+
+    if value is None:
+        _has_attribute.__name__ = f"have_attribute '{name}'"
+        _has_attribute.js = f"el !== null && __getAttribute(el, {js_string(name)}) !== null"
+    else:
+        _has_attribute.__name__ = f"have_attribute '{name}'='{value}'"
+        _has_attribute.js = f"el !== null && __getAttribute(el, {js_string(name)}) === {js_string(value)}"
+    return _has_attribute
+
+
+def have_css_class(name: str) -> ElementCondition:
+    """Element has CSS class"""
+
+    def _has_css_class(element):
+        return name in (element.get_attribute("class") or "").split()
+
+    _has_css_class.__name__ = f"have_css_class '{name}'"
+    _has_css_class.js = f"el !== null && el.classList.contains({js_string(name)})"
+    return _has_css_class
+
+
+def have_size(size: int) -> Callable[[ElementCollection], bool]:
+    """Collection has exactly `size` elements"""
+
+    def _has_size(collection):
+        return len(collection) == size
+
+    _has_size.__name__ = f"have_size {size}"
+    return _has_size
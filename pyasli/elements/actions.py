@@ -0,0 +1,126 @@
+"""Element interactions sent as a single W3C actions request"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver import ActionChains
+
+from pyasli.conditions import exist
+from pyasli.elements.recovery import recover
+from pyasli.elements.scripts import locate_script
+
+if TYPE_CHECKING:
+    from pyasli.elements.elements import Element
+
+# element action -> `ActionChains` method doing it
+_CHAIN_METHODS = {
+    "click": "click",
+    "double_click": "double_click",
+    "hover": "move_to_element",
+    "move_to": "move_to_element",
+    "right_click": "context_click",
+}
+# actions which scroll the element into view first, the same way they do outside of the batch
+_SCROLLED_ACTIONS = {"click", "move_to"}
+
+
+class ActionBatch:
+    """Interactions collected by `BrowserSession.batch_actions` block
+
+    Elements used by the batch are found in bulk right before the batch is performed
+    """
+
+    def __init__(self, browser):
+        self._browser = browser
+        self._steps: list[tuple[str, Element | None, tuple]] = []
+        self._scrolled: dict[int, Element] = {}  # elements scrolled into view before the batch is performed
+
+    def __len__(self):
+        return len(self._steps)
+
+    def add(self, action: str, element: Element):
+        """Add element action, one of `click`, `double_click`, `hover`, `move_to` or `right_click`"""
+        self._steps.append((_CHAIN_METHODS[action], element, ()))
+        if action in _SCROLLED_ACTIONS:
+            self._scrolled[id(element)] = element
+
+    def key_down(self, key: str) -> ActionBatch:
+        """Press modifier key, e.g. `Keys.CONTROL`"""
+        self._steps.append(("key_down", None, (key,)))
+        return self
+
+    def key_up(self, key: str) -> ActionBatch:
+        """Release modifier key"""
+        self._steps.append(("key_up", None, (key,)))
+        return self
+
+    def pause(self, seconds: float) -> ActionBatch:
+        """Pause between actions"""
+        self._steps.append(("pause", None, (seconds,)))
+        return self
+
+    def _elements(self) -> list[Element]:
+        elements = {}
+        for _, element, _ in self._steps:
+            if element is not None:
+                elements.setdefault(id(element), element)
+        return list(elements.values())
+
+    def _locate(self, elements: list[Element]):
+        """Find web elements of all not cached elements and scroll elements of scrolled actions into view
+
+        Elements resolvable in the browser are found and scrolled with a single script,
+        other elements are waited for and found the same way other element actions do
+        """
+        targets = {}  # element -> start element, steps and whether it's scrolled
+        for element in elements:
+            scroll = id(element) in self._scrolled
+            if element.__cached__ is not None:
+                if scroll:
+                    targets[element] = element.__cached__, (), scroll
+                continue
+            steps = element.locator.steps()
+            if steps is not None:  # elements which can't be resolved in the browser are found below
+                targets[element] = None, steps, scroll
+        if targets:
+            script, steps_args = locate_script([steps for _, steps, _ in targets.values()])
+            arguments = [
+                [start, steps_arg, scroll] for (start, _, scroll), steps_arg in zip(targets.values(), steps_args)
+            ]
+            found = self._browser.get_actual().execute_script(script, arguments)
+            for element, actual in zip(targets, found):
+                element.__cached__ = actual
+        for element in elements:
+            if element.__cached__ is None:  # wait for missing element the same way other actions do
+                element.assure(exist)
+                actual = element.get_actual()
+                if id(element) in self._scrolled:
+                    _ = actual.location_once_scrolled_into_view
+
+    def _chain(self) -> ActionChains:
+        chain = ActionChains(self._browser.get_actual())
+        for method, element, args in self._steps:
+            target: tuple[Any, ...] = args if element is None else (element.get_actual(), *args)
+            getattr(chain, method)(*target)
+        return chain
+
+    def perform(self):
+        """Find all used elements and perform collected actions with a single request
+
+        Elements are found again once if any of them has gone stale
+        """
+        if not self._steps:
+            return
+        elements = self._elements()
+        try:
+            self._locate(elements)
+            self._chain().perform()
+        except StaleElementReferenceException:
+            for element in elements:
+                recover(element)
+            self._locate(elements)
+            self._chain().perform()
+        self._steps.clear()
+        self._scrolled.clear()
+
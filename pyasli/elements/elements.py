@@ -1,15 +1,17 @@
 """WebElement wrappers"""
 from __future__ import annotations
 
-import time
-from collections.abc import Callable, Sequence
-from typing import TYPE_CHECKING
+import itertools
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable
 
 import wrapt
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
 from selenium.webdriver import ActionChains
 
 from pyasli.bys import ByLocator, CssSelectorOrBy, by_css, by_xpath
+from pyasli.elements.identity import SharesHandles
 from pyasli.elements.locators import (
     FilteredCollectionLocator,
     FindElementLocator,
@@ -18,42 +20,139 @@ from pyasli.elements.locators import (
     SingleElementLocator,
     SlicedElementLocator,
 )
+from pyasli.elements.recovery import recover
+from pyasli.elements.scripts import (
+    column_script,
+    compile_by,
+    entry_script,
+    evaluate_script,
+    fill_script,
+    forget_script,
+    js_string,
+    predicate_of,
+    resolve_script,
+    scroll_script,
+    snapshot_script,
+    stream_script,
+    table_script,
+    wait_script,
+)
 from pyasli.elements.searchable import Searchable
-from pyasli.exceptions import NoBrowserException, Screenshotable, screenshot_on_fail
-from pyasli.wait import wait_for
+from pyasli.elements.snapshots import ElementSnapshot, ElementState, Rect
+from pyasli.elements.tables import Table
+from pyasli.exceptions import FrozenPageError, NoBrowserException, Screenshotable, screenshot_on_fail
+from pyasli.wait import PollingPolicy, in_deadline, poll, wait_deadline, wait_until
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
 
+_SCRIPT_TIMEOUT_MARGIN = 5  # seconds given to browser-side wait in addition to the wait timeout
+
 
 @wrapt.decorator
 def _stale_retry(wrapped, instance: Element = None, args=None, kwargs=None):
+    """Retry method if element has gone stale, finding it again from the deepest valid cached ancestor
+
+    Number of retries is limited by `BrowserSession.stale_retries`
+    """
     if instance is None:
         instance = args[0]
 
-    try:
-        return wrapped(*args, **kwargs)
-    except StaleElementReferenceException:
-        instance.__cached__ = None  # invalidate cache
-        return wrapped(*args, **kwargs)
+    for _ in range(instance.browser.stale_retries):
+        try:
+            return wrapped(*args, **kwargs)
+        except StaleElementReferenceException:  # noqa: PERF203
+            recover(instance)
+    return wrapped(*args, **kwargs)
 
 
 @wrapt.decorator
 def _should_exist(wrapped, instance: Element = None, args=(), kwargs=None):
     """Check for element existence before run method
 
-    This decorator uses `assure`, so screenshot will be taken automatically on fail
+    This decorator uses `assure`, so screenshot will be taken automatically on fail.
+    If element trusts its cache, cached element is used without the check
+    until it has gone stale or missing.
     """
     if instance is None:
         instance = args[0]
 
-    def _exists(_el):
-        return _el.exists
+    browser = instance.browser
+    if instance.trusts_cache and instance.__cached__ is not None:
+        try:
+            result = wrapped(*args, **kwargs)
+        except (StaleElementReferenceException, NoSuchElementException):
+            instance.__cached__ = None
+            browser.events["trusted_cache_miss"] += 1
+        else:
+            browser.events["trusted_cache_hit"] += 1
+            return result
 
     instance.assure(_exists)
     return wrapped(*args, **kwargs)
 
 
+def _exists(element: Element) -> bool:
+    return element.exists
+
+
+def _from_snapshot(getter: Callable[..., object]):
+    """Return value from fresh element snapshot instead of calling method, if it's captured there
+
+    `getter` is called with the snapshot and method arguments and raises :class:`KeyError` if value is not captured
+    """
+
+    @wrapt.decorator
+    def _wrapper(wrapped, instance: Element = None, args=(), kwargs=None):
+        element, getter_args = (args[0], args[1:]) if instance is None else (instance, args)
+        snapshot = element.fresh_snapshot
+        if snapshot is not None:
+            try:
+                return getter(snapshot, *getter_args)
+            except KeyError:
+                pass
+        return wrapped(*args, **kwargs)
+
+    return _wrapper
+
+
+@wrapt.decorator
+def _frozen_read(wrapped, instance: Element = None, args=(), kwargs=None):
+    """Return the first value read inside `BrowserSession.frozen` block on repeated reads"""
+    element, read_args = (args[0], args[1:]) if instance is None else (instance, args)
+    frozen = element.browser.frozen_state
+    if frozen is None:
+        return wrapped(*args, **kwargs)
+    return frozen.read(element, wrapped.__name__, read_args, lambda: wrapped(*args, **kwargs))
+
+
+@wrapt.decorator
+def _changes_page(wrapped, instance: Element = None, args=(), kwargs=None):
+    """Mark method as changing the page, so element snapshots taken before are not fresh anymore
+
+    Such methods can't be used inside `BrowserSession.frozen` block
+    """
+    if instance is None:
+        instance = args[0]
+    browser = instance.browser
+    if browser.frozen_state is not None:
+        raise FrozenPageError(f"{wrapped.__name__} changes the page, it can't be used in frozen block ({instance})")
+    browser.page_changes += 1
+    return wrapped(*args, **kwargs)
+
+
+@wrapt.decorator
+def _batched(wrapped, instance: Element = None, args=(), kwargs=None):
+    """Add element interaction to the active `BrowserSession.batch_actions` batch instead of performing it"""
+    if instance is None:
+        instance = args[0]
+    batch = instance.browser.action_batch
+    if batch is None:
+        return wrapped(*args, **kwargs)
+    batch.add(wrapped.__name__, instance)
+    return None
+
+
 def _css_to_by(by: CssSelectorOrBy) -> ByLocator:
     if isinstance(by, tuple):
         return by
@@ -63,6 +162,8 @@ def _css_to_by(by: CssSelectorOrBy) -> ByLocator:
 class FindElementsMixin:
     """Adding `element` and `elements` methods to class"""
 
+    __slots__ = ()
+
     def element(self, by: CssSelectorOrBy) -> Element:
         """Search for single child element"""
         by = _css_to_by(by)
@@ -73,43 +174,143 @@ class FindElementsMixin:
         by = _css_to_by(by)
         return ElementCollection(MultipleElementLocator(by, self))
 
-
-class Element(Searchable, FindElementsMixin, Screenshotable):
+    @_changes_page
+    @_stale_retry
+    def _fill(self, values: Mapping[CssSelectorOrBy, Any], typed: Iterable[CssSelectorOrBy] = ()):
+        """Set values of fields found in this context, see :meth:`BrowserSession.fill`"""
+        typed = {_css_to_by(by) for by in typed}
+        fields = {}
+        for locator, value in values.items():
+            by = _css_to_by(locator)
+            compiled = compile_by(by)
+            if compiled is None or by in typed:  # element actions
+                _fill_field(self.element(by), value, typed=by in typed)
+            else:
+                fields[by] = ["find", *compiled], value
+        missing = self.__fill_in_browser(fields)
+        if missing:  # wait for missing fields the same way other actions do
+            for by in missing:
+                self.element(by).assure(_exists)
+            missing = self.__fill_in_browser({by: fields[by] for by in missing})
+        if missing:
+            raise NoSuchElementException(f"No fields (or radio buttons with given values) found by {missing} in {self}")
+
+    def __fill_in_browser(self, fields: dict[ByLocator, tuple[list, Any]]) -> list[ByLocator]:
+        """Set field values with a single script, return locators of missing fields
+
+        Radio button fields with no radio button of given value in the group are missing too
+        """
+        if not fields:
+            return []
+        actual = self.__cached__
+        chain = (actual, ()) if actual is not None else self.locator.chain_steps()
+        if chain is None:  # locator chain can't be resolved in the browser
+            chain = self.get_actual(), ()
+        start, steps = chain
+        script, steps_arg = fill_script(steps)
+        locators = list(fields)
+        missing = self.browser.get_actual().execute_script(script, start, steps_arg, list(fields.values()))
+        return [locators[index] for index in missing]
+
+
+class Element(SharesHandles, Searchable, FindElementsMixin, Screenshotable):
     """Single lazy element"""
 
+    __slots__ = ("_snapshot", "_trust_cache")
+    _snapshot: tuple[ElementSnapshot, int] | None  # last snapshot and browser `page_changes` at its moment
+    _trust_cache: bool | None  # `None` to follow `BrowserSession.trust_cache`
+
+    def __init__(self, locator: SingleElementLocator):
+        super().__init__(locator)
+        self._snapshot = None
+        self._trust_cache = None
+
     @property
     def log_path(self):
         return self.browser.log_path
 
+    def __wait_in_browser(self, condition, timeout) -> bool | None:
+        """Wait for condition inside the browser, return `None` if it can't be done there"""
+        predicate = predicate_of(condition)
+        steps = self._locator.steps()
+        if predicate is None or steps is None:
+            return None
+        script, steps_arg = wait_script(steps, predicate)
+        browser = self.browser
+        try:
+            with browser.script_timeout(timeout + _SCRIPT_TIMEOUT_MARGIN):
+                return browser.get_actual().execute_async_script(script, steps_arg, timeout)
+        except WebDriverException:  # e.g. page was reloaded during the wait
+            browser.logger.debug("Browser-side wait failed, falling back to polling", exc_info=True)
+            return None
+
     @screenshot_on_fail
-    def __wait_for_condition(self, condition, timeout, exception_cls):
-        exception = exception_cls(f"Condition {condition.__name__} is not reached in {timeout} seconds for {self}")
+    def __wait_for_condition(self, condition, timeout, exception_cls, polling, in_browser):
+        browser = self.browser
+        if in_browser is None:
+            in_browser = browser.browser_side_waits
+        if browser.frozen_state is not None:  # page is not changing, so the condition is checked once
+            timeout, in_browser = 0, False
+        outermost = not in_deadline()  # nested waits are limited by the outer one, not by the budget
         try:
-            wait_for(self, condition, timeout, exception)
+            with wait_deadline(timeout, [self]) as left:
+                reached = self.__wait_in_browser(condition, left) if in_browser else None
+                if reached is None:
+                    reached = wait_until(self, condition, left, polling)
+            if not reached:  # message describing the element is built only for failed waits
+                message = f"Condition {condition.__name__} is not reached in {timeout} seconds for {self}"
+                if outermost and left < timeout:
+                    message = f"{message}, {left:.3f} seconds were left of {browser.wait_budget} seconds wait budget"
+                raise exception_cls(message)
         except Exception:
-            self.browser.logger.exception("Waiting for condition failed")
+            browser.logger.exception("Waiting for condition failed")
             raise
-        self.browser.logger.debug("Condition %s reached for element %s", condition.__name__, self)
+        browser.logger.debug("Condition %s reached for element %s", condition.__name__, self)
+
+    def assure(self, condition, timeout=5, polling: PollingPolicy = None, in_browser=None):
+        """Make sure that element matches condition or raises :class:`TimeoutError`
+
+        :param polling: Polling policy used for waiting, default one from :mod:`pyasli.wait` if not set
+        :param in_browser: Wait for the condition inside the browser in a single call,
+            `BrowserSession.browser_side_waits` is used if not set
+        """
+        self.__wait_for_condition(condition, timeout, TimeoutError, polling, in_browser)
 
-    def assure(self, condition, timeout=5):
-        """Make sure that element matches condition or raises :class:`TimeoutError`"""
-        self.__wait_for_condition(condition, timeout, TimeoutError)
+    def should(self, condition, timeout=5, polling: PollingPolicy = None, in_browser=None):
+        """Make sure that element matches condition or raises :class:`AssertionError`
 
-    def should(self, condition, timeout=5):
-        """Make sure that element matches condition or raises :class:`AssertionError`"""
-        self.__wait_for_condition(condition, timeout, AssertionError)
+        :param polling: Polling policy used for waiting, default one from :mod:`pyasli.wait` if not set
+        :param in_browser: Wait for the condition inside the browser in a single call,
+            `BrowserSession.browser_side_waits` is used if not set
+        """
+        self.__wait_for_condition(condition, timeout, AssertionError, polling, in_browser)
 
     should_be = should
 
+    @property
+    def trusts_cache(self) -> bool:
+        """Whether cached web element is used by actions without checking element existence first"""
+        if self._trust_cache is None:
+            return self.browser.trust_cache
+        return self._trust_cache
+
     def get_actual(self) -> WebElement:
         """Get element, check if it's cached or already dead"""
         if self.browser.get_actual() is None:
             raise NoBrowserException("No browser exist")
         return super().get_actual()
 
+    def _search(self) -> WebElement:
+        frozen = self.browser.frozen_state
+        if frozen is None:
+            return super()._search()
+        return frozen.resolve(self, super()._search)
+
     def _actions(self):
         return ActionChains(self.browser.get_actual())
 
+    @_changes_page
+    @_batched
     @_stale_retry
     @_should_exist
     def move_to(self):
@@ -117,24 +318,32 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
         _ = self.get_actual().location_once_scrolled_into_view
         self._actions().move_to_element(self.get_actual()).perform()
 
+    @_changes_page
+    @_batched
     @_stale_retry
     @_should_exist
     def click(self):
         """Click web element"""
         self._actions().click(self.get_actual()).perform()
 
+    @_changes_page
+    @_batched
     @_stale_retry
     @_should_exist
     def double_click(self):
         """Make double click on the element"""
         self._actions().double_click(self.get_actual()).perform()
 
+    @_changes_page
+    @_batched
     @_stale_retry
     @_should_exist
     def hover(self):
         """Hover over element"""
         self._actions().move_to_element(self.get_actual()).perform()
 
+    @_changes_page
+    @_batched
     @_stale_retry
     @_should_exist
     def right_click(self):
@@ -142,6 +351,7 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
         self._actions().context_click(self.get_actual()).perform()
 
     @property
+    @_frozen_read
     @_stale_retry
     @_should_exist
     def text(self) -> str:
@@ -149,12 +359,30 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
         return self.get_actual().text
 
     @text.setter
+    def text(self, value: str):
+        """Set element text (if possible), see :meth:`set_text`"""
+        self.set_text(value)
+
+    @_changes_page
     @_stale_retry
     @_should_exist
-    def text(self, value: str):
-        """Set element text (if possible)"""
-        self.clear()
-        self.get_actual().send_keys(value)
+    def set_text(self, value: str, *, typed: bool | None = None):
+        """Set element text
+
+        :param typed: Type the text with keyboard emulation or set it by script, firing only input and change events.
+            By default texts not shorter than `BrowserSession.bulk_text_threshold` are set by script.
+        """
+        if typed is None:
+            threshold = self.browser.bulk_text_threshold
+            typed = threshold is None or len(value) < threshold
+        if typed:
+            self.clear()
+            self.get_actual().send_keys(value)
+            return
+        script, chunk, actual = entry_script(), self.browser.bulk_text_chunk, self.get_actual()
+        for start in range(0, max(len(value), 1), chunk):
+            last = start + chunk >= len(value)
+            self.browser.get_actual().execute_script(script, actual, value[start:start + chunk], start > 0, last)
 
     @property
     def value(self):
@@ -162,10 +390,12 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
         return self.get_attribute("value")
 
     @property
+    @_frozen_read
+    @_from_snapshot(lambda snapshot: snapshot.visible)
     @_stale_retry
     def visible(self):
         """Check if element is visible"""
-        if not self.exists:
+        if not (self.trusts_cache and self.__cached__ is not None) and not self.exists:
             return False
         return self.get_actual().is_displayed()
 
@@ -179,13 +409,29 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
     def exists(self):
         """Check if element exists in dom"""
         try:
-            self._search()
+            self.__cached__ = self._search()  # found element is going to be used right after the check
         except NoSuchElementException:
+            self.__cached__ = None
             return False
 
         return True
 
+    @_frozen_read
+    @_stale_retry
+    def evaluate(self, predicate: str) -> bool:
+        """Check browser-side predicate for freshly found element (`null` if it is missing)
+
+        Element is found and checked with a single script if its locator chain can be resolved in the browser
+        """
+        script, steps_arg = evaluate_script(self._locator.steps(), predicate)
+        actual = None
+        if steps_arg is None and self.exists:
+            actual = self.__cached__
+        return self.browser.get_actual().execute_script(script, actual, steps_arg)
+
     @property
+    @_frozen_read
+    @_from_snapshot(lambda snapshot: snapshot.selected)
     @_stale_retry
     @_should_exist
     def selected(self):
@@ -193,30 +439,120 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
         return self.get_actual().is_selected()
 
     @property
+    @_frozen_read
+    @_from_snapshot(lambda snapshot: snapshot.tag_name)
     @_stale_retry
     @_should_exist
     def tag_name(self):
         """Get element tag name"""
         return self.get_actual().tag_name
 
+    @_frozen_read
+    @_from_snapshot(ElementSnapshot.get_attribute)
     @_stale_retry
     @_should_exist
     def get_attribute(self, name: str):
         """Get WebElement attribute value"""
         return self.get_actual().get_attribute(name)
 
+    @_changes_page
     @_stale_retry
     @_should_exist
     def clear(self):
         """Clear input field"""
         self.get_actual().clear()
 
+    def fill_form(self, values: Mapping[CssSelectorOrBy, Any], typed: Iterable[CssSelectorOrBy] = ()):
+        """Set values of fields found inside the element with a single script call, see :meth:`BrowserSession.fill`"""
+        self._fill(values, typed)
+
+    @_stale_retry
+    def snapshot(self, attributes: Iterable[str] = ()) -> ElementSnapshot:
+        """Capture element state with a single script call
+
+        Element properties and conditions use the snapshot while it is fresh:
+        not older than `BrowserSession.snapshot_ttl` and no page-changing element action is done after it's taken
+
+        :param attributes: Names of additional attributes to be captured
+        """
+        state = self.__run_on_element(snapshot_script, list(attributes))
+        snapshot = ElementSnapshot.from_state(state)
+        self._snapshot = snapshot, self.browser.page_changes
+        return snapshot
+
+    def __run_on_element(self, script_of: Callable, *arguments) -> Any:
+        """Run script for the element and return its result, caching the element found by the script
+
+        Script is built by `script_of` for the steps of the element (empty ones for cached element),
+        it returns `null` for missing element or the element and the result otherwise
+        """
+        captured = self.__run_resolved(script_of, arguments)
+        if captured is None:  # wait for missing element the same way other actions do
+            self.assure(_exists)
+            captured = self.__run_resolved(script_of, arguments)
+        if captured is None:
+            raise NoSuchElementException(f"No element found by {self._locator!r}")
+        self.__cached__, result = captured
+        return result
+
+    def __run_resolved(self, script_of: Callable, arguments: tuple) -> list | None:
+        """Run script, resolving the element in the browser if it's not cached"""
+        actual = self.__cached__
+        steps = () if actual is not None else self._locator.steps()
+        if steps is None:  # locator chain can't be resolved in the browser
+            self.assure(_exists)
+            actual, steps = self.__cached__, ()
+        script, steps_arg = script_of(steps)
+        return self.browser.get_actual().execute_script(script, actual, steps_arg, *arguments)
+
+    @_stale_retry
+    def __table_part(self, cell: str, first: int, count: int | None, pending: list) -> dict:
+        column, argument = ("texts", None) if cell == "text" else ("attributes", cell)
+        return self.__run_on_element(lambda steps: table_script(steps, column), argument, first, count, pending)
+
+    def table(self, cell="text") -> Table:
+        """Read headers and body of the table element with a single script call
+
+        :param cell: `text` to read cell texts or name of the cell attribute to read
+        """
+        return Table.from_part(self.__table_part(cell, 0, None, []))
+
+    def table_rows(self, cell="text", size=100) -> Iterator[tuple[Any, ...]]:
+        """Yield body rows of the table element, reading them by chunks of `size` rows
+
+        Rows are the same as :attr:`Table.rows` of :meth:`table` result, padded to the number of headers.
+        """
+        if size < 1:
+            raise ValueError(f"Chunk size should be positive, got {size}")
+        first, pending = 0, []
+        while True:
+            part = self.__table_part(cell, first, size, pending)
+            width = len(part["headers"])
+            for row in part["rows"]:
+                yield (*row, *[None] * (width - len(row)))
+            first, pending = first + size, part["pending"]
+            if first >= part["total"]:
+                return
+
+    @property
+    def fresh_snapshot(self) -> ElementSnapshot | None:
+        """Last element snapshot if it is still fresh, `None` otherwise"""
+        if self._snapshot is None:
+            return None
+        snapshot, page_changes = self._snapshot
+        browser = self.browser
+        if page_changes != browser.page_changes or snapshot.age > browser.snapshot_ttl:
+            return None
+        return snapshot
+
     # TODO: re-enable if become useful
     # @_should_exit
     # def get_property(self, name):
     #     """Gets the given property of the element"""
 
     @property
+    @_frozen_read
+    @_from_snapshot(lambda snapshot: snapshot.enabled)
     @_stale_retry
     @_should_exist
     def enabled(self):
@@ -235,6 +571,8 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
         return not self.enabled
 
     @property
+    @_frozen_read
+    @_from_snapshot(lambda snapshot: snapshot.size)
     @_stale_retry
     @_should_exist
     def size(self):
@@ -284,7 +622,7 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
 
     def __getattr__(self, item) -> str:
         """Return value of element attribute with given name as string"""
-        if item in dir(self):
+        if item.startswith("__") or hasattr(type(self), item):  # e.g. protocol lookups or unset slots
             prop = type(self).__getattribute__(self, item)
             raise AttributeError(f"Some shit here: {prop}")
 
@@ -294,25 +632,186 @@ class Element(Searchable, FindElementsMixin, Screenshotable):
 ElementCondition = Callable[[Element], bool]
 
 
-class ElementCollection(Searchable, FindElementsMixin, Sequence):  # pylint: disable=inherit-non-class
+def _fill_field(field: Element, value: Any, *, typed: bool):
+    """Set value of the field with element actions
+
+    Checkbox or radio button is clicked to get boolean value, field is cleared for `None`, text is set otherwise
+    """
+    if isinstance(value, bool):
+        if field.selected != value:
+            field.click()
+    elif value is None:
+        field.clear()
+    else:
+        field.set_text(str(value), typed=True if typed else None)
+
+
+def _keyed(key: str, value: str) -> ElementCondition:
+    """Condition of element having `key` attribute equal to `value`"""
+
+    def _condition(element: Element) -> bool:
+        return element.get_attribute(key) == value
+
+    _condition.__name__ = f"{key}={value!r}"
+    _condition.js = f"el !== null && el.getAttribute({js_string(key)}) === {js_string(value)}"
+    return _condition
+
+
+# field of `ElementCollection.stream` -> column of browser-side values and converter of the value, if any
+_STREAM_FIELDS = {
+    "text": ("texts", None),
+    "rect": ("rects", lambda rect: Rect(**rect)),
+    "state": ("states", lambda state: ElementState(**state)),
+}
+
+
+class ElementCollection(SharesHandles, Searchable, FindElementsMixin, Sequence):  # pylint: disable=inherit-non-class
     """Collection of lazy elements"""
 
+    __slots__ = ()
     _locator: MultipleElementLocator
 
     def __init__(self, locator: MultipleElementLocator):  # all hail type hints
         super().__init__(locator)
 
     def __getitem__(self, index: int | slice) -> Element | ElementCollection:
+        """Get lazy element or sub-collection, missing index is reported only when the element is used"""
         if isinstance(index, slice):
             return ElementCollection(SlicedElementLocator(self._locator, index))
-        length = len(self)
-        if 0 <= index < length:
-            return Element(IndexElementLocator(self._locator, index))
-        raise IndexError(f"Collection index {index} is out of range (0..{length})")
+        return Element(IndexElementLocator(self._locator, index))
+
+    def _search(self) -> list[WebElement]:
+        frozen = self.browser.frozen_state
+        if frozen is None:
+            return super()._search()
+        return frozen.resolve(self, super()._search)
 
     def __len__(self) -> int:
         return len(self.get_actual())
 
+    def __iter__(self) -> Iterator[Element]:
+        """Iterate over elements of the collection found once
+
+        Yielded elements use found web elements until they have gone stale, then they are searched again by index
+        """
+        self.__cached__ = found = self._search()
+        for index, actual in enumerate(found):
+            yield self.__found_element(index, actual)
+
+    def __found_element(self, index: int, actual: WebElement) -> Element:
+        """Element by index using found web element until it has gone stale"""
+        element = Element(IndexElementLocator(self._locator, index))
+        element.__cached__ = actual
+        element._trust_cache = True  # noqa: SLF001
+        return element
+
+    def __pages(self, size: int, script_of: Callable, *arguments) -> Iterator[tuple[int, list]]:
+        """Run script for consecutive slices of up to `size` collection elements, yield slice offset and result
+
+        Slices are selected in the browser, so every response is bounded by `size`.
+        Collection which can't be found in the browser is found whole once and its slices are sent to the script.
+        """
+        if size < 1:
+            raise ValueError(f"Chunk size should be positive, got {size}")
+        driver = self.browser.get_actual()
+        steps = self._locator.steps()
+        if steps is None:
+            try:
+                found = self.get_actual()
+            except NoSuchElementException:
+                return
+            script, steps_arg = script_of(())
+            for offset in range(0, len(found), size):
+                yield offset, driver.execute_script(script, found[offset:offset + size], steps_arg, *arguments)
+            return
+        for offset in itertools.count(0, size):
+            script, steps_arg = script_of((*steps, ("slice", offset, offset + size, None)))
+            page = driver.execute_script(script, None, steps_arg, *arguments)
+            if page:
+                yield offset, page
+            if len(page) < size:
+                return
+
+    def iter_chunks(self, size=100) -> Iterator[list[Element]]:
+        """Iterate over collection elements in lists of up to `size` elements
+
+        Every chunk is found by a separate lookup, so no more than `size` web elements are transferred at once.
+        Elements use found web elements until they have gone stale, same as ones yielded by iteration.
+        """
+        for offset, found in self.__pages(size, resolve_script):
+            yield [self.__found_element(offset + i, actual) for i, actual in enumerate(found)]
+
+    def stream(self, fields: Sequence[str] = ("text",), size=100) -> Iterator[dict[str, Any]]:
+        """Yield values of `fields` for every collection element, reading them by chunks of `size` elements
+
+        Field is one of `text`, `rect`, `state` or name of the element attribute.
+        Values of every chunk are read with a single script, no web elements are transferred.
+        """
+        arguments = [[_STREAM_FIELDS[field][0], None] if field in _STREAM_FIELDS else ["attributes", field]
+                     for field in fields]
+        columns = [column for column, _ in arguments]
+        converters = [_STREAM_FIELDS.get(field, (None, None))[1] for field in fields]
+        for _, rows in self.__pages(size, lambda steps: stream_script(steps, columns), arguments):
+            for row in rows:
+                yield {
+                    field: value if convert is None else convert(value)
+                    for field, convert, value in zip(fields, converters, row)
+                }
+
+    def __fresh_items(self, key: str, token: str) -> list[tuple[WebElement, str]]:
+        """Items of the collection not seen before with the same token and their `key` attribute values"""
+        steps = self._locator.steps()
+        start = None
+        if steps is None:  # collection can't be found in the browser, so it's found whole every time
+            try:
+                start, steps = self._search(), ()
+            except NoSuchElementException:
+                return []
+        script, steps_arg = scroll_script(steps)
+        found, values = self.browser.get_actual().execute_script(script, start, steps_arg, key, token)
+        return list(zip(found, values))
+
+    def scroll_through(self, key="id", limit: int | None = None, timeout=1.0,
+                       polling: PollingPolicy | None = None) -> Iterator[Element]:
+        """Iterate over items of virtualised (infinitely scrolled) list, scrolling to the last yielded item
+
+        Items are identified by `key` attribute, every item is yielded once and items without the attribute are
+        skipped. Newly rendered items are detected in the browser. Iteration stops after `limit` items or when
+        no new items are rendered in `timeout` seconds after scrolling.
+
+        Yielded element is searched by its `key` attribute value, so it stays usable after the list is re-rendered.
+        """
+        token = uuid.uuid4().hex
+        count = 0
+        try:
+            while limit is None or count < limit:
+                fresh = []
+                for _ in poll(polling, timeout):
+                    fresh = self.__fresh_items(key, token)
+                    if fresh:
+                        break
+                if not fresh:
+                    return
+                for actual, value in fresh:
+                    element = Element(FindElementLocator(self, _keyed(key, value)))
+                    element.__cached__ = actual
+                    element._trust_cache = True  # noqa: SLF001
+                    yield element
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+                element.move_to()
+        finally:
+            self.browser.get_actual().execute_script(forget_script(), token)
+
+    def __reversed__(self) -> Iterator[Element]:
+        return reversed(list(self))
+
+    def index(self, value, start=0, stop=None) -> int:
+        """Return first index of value, :class:`ValueError` if there's no such value"""
+        elements = list(self)
+        return elements.index(value, start, len(elements) if stop is None else stop)
+
     def __repr__(self):
         return f"Element Collection by: {repr(self._locator)}"
 
@@ -324,13 +823,46 @@ class ElementCollection(Searchable, FindElementsMixin, Sequence):  # pylint: dis
         """Find single collection element by condition"""
         return Element(FindElementLocator(self, condition))
 
-    def assure_all(self, condition, timeout=5, exception=TimeoutError):
+    @_stale_retry
+    def __column(self, column: str, argument: str | None = None) -> list:
+        """Get column of values for all collection elements with a single script call"""
+        actual = self.__cached__
+        steps = () if actual is not None else self._locator.steps()
+        if steps is None:  # locator chain can't be resolved in the browser
+            try:
+                actual, steps = self.get_actual(), ()
+            except NoSuchElementException:
+                return []
+        script, steps_arg = column_script(steps, column)
+        return self.browser.get_actual().execute_script(script, actual, steps_arg, argument)
+
+    def texts(self) -> list[str]:
+        """Texts of all collection elements"""
+        return self.__column("texts")
+
+    def attributes(self, name: str) -> list[str | None]:
+        """Attribute values of all collection elements, same as `Element.get_attribute` returns"""
+        return self.__column("attributes", name)
+
+    def properties(self, name: str) -> list[Any]:
+        """DOM property values of all collection elements"""
+        return self.__column("properties", name)
+
+    def rects(self) -> list[Rect]:
+        """Positions and sizes of all collection elements"""
+        return [Rect(**rect) for rect in self.__column("rects")]
+
+    def states(self) -> list[ElementState]:
+        """Visibility, enabled and selected states of all collection elements"""
+        return [ElementState(**state) for state in self.__column("states")]
+
+    def assure_all(self, condition, timeout=5, exception=TimeoutError, polling: PollingPolicy = None):
         """Assure condition matches for all elements"""
-        end_time = time.time() + timeout
-        full_length = len(self)
-        matching = None
-        while time.time() < end_time:
-            matching = self.filter(condition)
-            if len(matching) == full_length:
-                return
-        raise exception(f"{full_length - len(matching)} elements are not matching condition")
+        with wait_deadline(timeout, [self]):
+            full_length = len(self)
+            matching = 0
+            for _ in poll(polling, timeout):
+                matching = len(self.filter(condition))
+                if matching == full_length:
+                    return
+        raise exception(f"{full_length - matching} elements are not matching condition")
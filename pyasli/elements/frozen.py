@@ -0,0 +1,47 @@
+"""Memory of element lookups and reads for `BrowserSession.frozen` blocks"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from pyasli.elements.searchable import LocatorStrategy, Searchable
+
+
+def _locator_key(locator: LocatorStrategy) -> Hashable:
+    """Locators with the same browser-side steps find the same elements, others are compared by identity"""
+    steps = locator.steps()
+    return locator if steps is None else steps
+
+
+class FrozenState:
+    """First results of locator resolutions and property reads, pinned until the block exit"""
+
+    def __init__(self):
+        self._found: dict[Hashable, Any] = {}
+        self._reads: dict[tuple, Any] = {}
+        self._pinned: dict[int, Searchable] = {}
+
+    def resolve(self, searchable: Searchable, search: Callable[[], Any]) -> Any:
+        """Return first result found by the searchable locator, pinning it as searchable cached value"""
+        key = _locator_key(searchable.locator)
+        if key not in self._found:
+            self._found[key] = search()
+        self._pinned[id(searchable)] = searchable
+        return self._found[key]
+
+    def read(self, searchable: Searchable, name: str, args: tuple, reader: Callable[[], Any]) -> Any:
+        """Return first value read by the reader"""
+        key = (_locator_key(searchable.locator), name, args)
+        if key not in self._reads:
+            self._reads[key] = reader()
+        return self._reads[key]
+
+    def release(self):
+        """Forget all results and drop elements pinned to them"""
+        for searchable in self._pinned.values():
+            searchable.__cached__ = None
+        self._pinned.clear()
+        self._found.clear()
+        self._reads.clear()
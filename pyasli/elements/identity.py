@@ -0,0 +1,55 @@
+"""Sharing found web elements between wrappers of equal locators"""
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyasli.elements.searchable import Searchable, Wrapped
+
+
+class HandleCell:
+    """Cached web element(s) of the wrapper, can be shared by several wrappers"""
+
+    __slots__ = ("__weakref__", "actual")
+
+    def __init__(self):
+        self.actual: Wrapped = None
+
+
+class IdentityMap:
+    """Handle cells of the browser session keyed by locator chain IR
+
+    Cells are weakly referenced, so a cell lives while any wrapper using it is alive
+    """
+
+    def __init__(self):
+        self._cells: weakref.WeakValueDictionary[tuple, HandleCell] = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._cells)
+
+    def cell(self, searchable: Searchable) -> HandleCell:
+        """Return cell shared by wrappers of the same type having equal locator chain"""
+        key = (type(searchable), searchable.locator.ir)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = HandleCell()
+        return cell
+
+    def clear(self):
+        """Invalidate all cells, e.g. after navigation"""
+        for cell in self._cells.values():
+            cell.actual = None
+
+
+class SharesHandles:
+    """Mixin for wrappers sharing cached web elements through `BrowserSession.identity_map`"""
+
+    __slots__ = ()
+
+    def _new_cell(self) -> HandleCell:
+        browser = self.browser
+        if not browser.share_handles:
+            return super()._new_cell()
+        return browser.identity_map.cell(self)
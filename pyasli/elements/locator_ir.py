@@ -0,0 +1,53 @@
+"""Immutable representation of locator chains"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def _slice(start, stop, step) -> str:
+    sss = f"{'' if start is None else start}:{'' if stop is None else stop}"
+    if step:
+        sss = f"{sss}:{step}"
+    return f"[{sss}]"
+
+
+_FORMATS = {
+    "find": lambda by: f" -> {by}",
+    "findAll": lambda by: f" -> [{by}]",
+    "index": lambda index: f"[{index}]",
+    "slice": _slice,
+    "filter": lambda condition: f".filter({condition.__name__})",
+    "first": lambda condition: f".find({condition.__name__})",
+}
+
+
+@dataclass(frozen=True)
+class LocatorIR:
+    """Step of the locator chain together with all previous steps
+
+    Unlike locators, IR doesn't reference browser or elements, so it can be compared, hashed and pickled.
+    Chains using conditions can be pickled only if the conditions are importable functions.
+    """
+    kind: str  # "browser" for the root, otherwise one of browser-side step words, e.g. "findAll" or "first"
+    args: tuple[Any, ...]
+    parent: LocatorIR | None = None
+    _description: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def then(self, kind: str, *args) -> LocatorIR:
+        """Return chain extended with the step"""
+        return LocatorIR(kind, args, self)
+
+    @property
+    def description(self) -> str:
+        """Human-readable chain, e.g. `Chrome -> [('css selector', 'li')][1]`, built once"""
+        if self._description is None:
+            if self.parent is None:
+                description = str(self.args[0])
+            else:
+                description = f"{self.parent.description}{_FORMATS[self.kind](*self.args)}"
+            object.__setattr__(self, "_description", description)  # cache is not a part of the frozen value
+        return self._description
+
+    def __str__(self):
+        return self.description
@@ -1,16 +1,26 @@
 """Lazy locator wrappers"""
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Any
-from weakref import proxy
+from typing import TYPE_CHECKING, Any
 
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
-from selenium.webdriver.remote.webelement import WebElement
 
+from pyasli.elements.recovery import recover
+from pyasli.elements.scripts import compile_by, has_predicates, predicate_of, resolve_script
 from pyasli.elements.searchable import LocatorStrategy, Searchable
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from pyasli.elements.locator_ir import LocatorIR
+
 # pylint: disable=protected-access
 
+_MIN_FLATTENED_STEPS = 2
+
 
 def _search_in_context(context: Searchable, method: str, by: tuple, _retry=True) -> list[WebElement]:
     actual = context.get_actual()
@@ -24,8 +34,10 @@ def _search_in_context(context: Searchable, method: str, by: tuple, _retry=True)
         try:
             found = getattr(elem, method)(*by)
         except StaleElementReferenceException:  # element in which we search can be stale itself
-            context.__cached__ = None
-            found = _search_in_context(context, method, by, _retry=False)
+            if not _retry:
+                raise
+            recover(context)
+            return _search_in_context(context, method, by, _retry=False)
         except NoSuchElementException:
             continue
         if isinstance(found, list):
@@ -37,29 +49,98 @@ def _search_in_context(context: Searchable, method: str, by: tuple, _retry=True)
     return result
 
 
+def _chained(
+        parent: LocatorStrategy, step: tuple | None, use_cache, context: Searchable = None,
+) -> tuple[Any, tuple] | None:
+    if step is None:
+        return None
+    if use_cache and context is not None and context.__cached__ is not None:
+        return context.__cached__, (step,)
+    chain = parent.chain_steps(use_cache)
+    if chain is None:
+        return None
+    start, steps = chain
+    return start, (*steps, step)
+
+
+def _resolve_in_browser(browser, start: Any, steps: tuple) -> list[WebElement]:
+    """Find elements by steps with single script, using browser lookup cache for chains starting from the document
+
+    Chains with predicates are not cached: e.g. `value` property or visibility on hover change without DOM mutations
+    """
+    if start is None and browser.cache_lookups and not has_predicates(steps):
+        return browser.lookup_cache.lookup(browser.get_actual(), steps)
+    script, steps_arg = resolve_script(steps)
+    return browser.get_actual().execute_script(script, start, steps_arg)
+
+
+def _search_flattened(locator: LocatorStrategy) -> list[WebElement] | None:
+    """Find elements by locator chain of several steps (or any steps if lookups are cached) with single script
+
+    `None` is returned if the chain is a single step or can't be resolved in browser
+    """
+    browser = locator.context.browser
+    cached = browser.cache_lookups
+    if not (browser.flatten_chains or cached):
+        return None
+    chain = locator.chain_steps(use_cache=not cached)  # cache is shared by chains starting from the document
+    if chain is None or (not cached and len(chain[1]) < _MIN_FLATTENED_STEPS):  # single step is WebDriver search
+        return None
+    start, steps = chain
+    try:
+        return _resolve_in_browser(browser, start, steps)
+    except StaleElementReferenceException:  # cached element the chain starts from is stale
+        recover(locator.context)
+        return _resolve_in_browser(browser, *locator.chain_steps(use_cache=not cached))
+
+
+def _find_step(word: str, by: tuple) -> tuple | None:
+    compiled = compile_by(by)
+    if compiled is None:
+        return None
+    return (word, *compiled)
+
+
 class SingleElementLocator(LocatorStrategy):
     """Locator for returning single element"""
 
+    __slots__ = ()
+
     def get(self) -> WebElement:
         """Get single matching web element"""
-        result = _search_in_context(self.context, "find_element", self.by)
+        result = _search_flattened(self)
+        if result is None:
+            result = _search_in_context(self.context, "find_element", self.by)
+        if not result:
+            raise NoSuchElementException(f"Nothing found using locator {self.by}")
         return result[0]
 
-    def __repr__(self):
-        # recursive repr
-        return f"{repr(self.context.locator)} -> {self.by}"
+    def chain_steps(self, use_cache=True) -> tuple[Any, tuple] | None:
+        return _chained(self.context.locator, _find_step("find", self.by), use_cache, self.context)
+
+    def _build_ir(self) -> LocatorIR:
+        return self.context.locator.ir.then("find", self.by)
 
 
 class MultipleElementLocator(LocatorStrategy):
     """Locator strategy for multiple elements"""
 
+    __slots__ = ()
+
     def get(self) -> list[WebElement]:
         """Get list of matching web elements"""
-        return _search_in_context(self.context, "find_elements", self.by)
+        result = _search_flattened(self)
+        if result is None:
+            result = _search_in_context(self.context, "find_elements", self.by)
+        if not result:
+            raise NoSuchElementException(f"Nothing found using locator {self.by}")
+        return result
+
+    def chain_steps(self, use_cache=True) -> tuple[Any, tuple] | None:
+        return _chained(self.context.locator, _find_step("findAll", self.by), use_cache, self.context)
 
-    def __repr__(self):
-        # recursive repr
-        return f"{repr(self.context.locator)} -> [{self.by}]"
+    def _build_ir(self) -> LocatorIR:
+        return self.context.locator.ir.then("findAll", self.by)
 
 
 # SUB ELEMENTS
@@ -67,63 +148,100 @@ class MultipleElementLocator(LocatorStrategy):
 class SubElementLocator(LocatorStrategy):
     """Locator for elements extracted from element list"""
 
+    __slots__ = ("_sub", "_whole")
+
     def __init__(self, whole: MultipleElementLocator, sub: slice | int):
         super().__init__(whole.by, whole.context)
         self._whole = whole
         self._sub = sub
 
-    def get(self) -> list[WebElement]:
-        """Get slice from element collection (not going deeper)"""
-        elements = self._whole.get()
-        return elements[self._sub]
+    def chain_steps(self, use_cache=True) -> tuple[Any, tuple] | None:
+        if isinstance(self._sub, slice):
+            return _chained(self._whole, ("slice", self._sub.start, self._sub.stop, self._sub.step), use_cache)
+        return _chained(self._whole, ("index", self._sub), use_cache)
 
-    def __repr__(self):
-        # recursive repr
-        return f"{repr(self._whole)}[{self._sub}]"
+    def _build_ir(self) -> LocatorIR:
+        if isinstance(self._sub, slice):
+            return self._whole.ir.then("slice", self._sub.start, self._sub.stop, self._sub.step)
+        return self._whole.ir.then("index", self._sub)
 
 
 class SlicedElementLocator(SubElementLocator, MultipleElementLocator):
     """Locator for returning slice from element collection"""
 
+    __slots__ = ()
+
     def __init__(self, whole: MultipleElementLocator, slize: slice):
         super().__init__(whole, slize)
 
-    def __repr__(self):
-        # recursive repr
-        start = "" if self._sub.start is None else self._sub.start
-        stop = "" if self._sub.stop is None else self._sub.stop
-        sss = f"{start}:{stop}"
-        if self._sub.step:
-            sss = f"{sss}:{self._sub.step}"
-        return f"{repr(self._whole)}[{sss}]"
+    def get(self) -> list[WebElement]:
+        """Get slice of element collection, selecting it in the browser if possible"""
+        selected = _search_flattened(self)
+        if selected is None:
+            selected = self._whole.get()[self._sub]
+        return selected
 
 
 class IndexElementLocator(SubElementLocator, SingleElementLocator):
     """Locator for returning element by index from collection"""
 
+    __slots__ = ()
+
     def __init__(self, whole: MultipleElementLocator, index: int):
         super().__init__(whole, index)
 
+    def get(self) -> WebElement:
+        """Get element of element collection by index, selecting it in the browser if possible"""
+        selected = _search_flattened(self)
+        if selected is None:
+            elements = self._whole.get()
+            selected = [elements[self._sub]] if -len(elements) <= self._sub < len(elements) else []
+        if not selected:
+            raise NoSuchElementException(f"No element matching {self!r}")
+        return selected[0]
+
 
 # CONDITIONS
 
 
 class ConditionLocator(LocatorStrategy, ABC):
     """Filtering and finding element of collection locator"""
+
+    __slots__ = ("_collection", "_condition", "_whole")
     _condition: Callable[[Any], bool]
 
     def __init__(self, collection, condition: Callable[[Any], bool]):
-        self._whole = proxy(collection.locator)
+        self._whole = collection.locator
         super().__init__(self._whole.by, self._whole.context)
         self._collection = collection
         self._condition = condition
 
     @property
     @abstractmethod
-    def _word(self) -> str: ...  # pylint:disable=multiple-statements
-
-    def __repr__(self):
-        return f"{self._whole.__repr__()}.{self._word}({self._condition.__name__})"
+    def _step_word(self) -> str: ...  # pylint:disable=multiple-statements
+
+    def _build_ir(self) -> LocatorIR:
+        return self._whole.ir.then(self._step_word, self._condition)
+
+    def chain_steps(self, use_cache=True) -> tuple[Any, tuple] | None:
+        predicate = predicate_of(self._condition)
+        if predicate is None:
+            return None
+        return _chained(self._whole, (self._step_word, predicate), use_cache)
+
+    def _matching_in_browser(self) -> list[WebElement] | None:
+        """Find matching elements with single script, `None` if condition can't be checked in the browser
+
+        If the collection can't be found in the browser, it's found first and passed to the script
+        """
+        predicate = predicate_of(self._condition)
+        if predicate is None:
+            return None
+        browser = self._collection.browser
+        chain = self.chain_steps(use_cache=not browser.cache_lookups)
+        if chain is None:
+            chain = self._whole.get(), ((self._step_word, predicate),)
+        return _resolve_in_browser(browser, *chain)
 
     def get(self) -> list[WebElement]:
         """Get only web elements matching condition"""
@@ -133,25 +251,36 @@ class ConditionLocator(LocatorStrategy, ABC):
 class FilteredCollectionLocator(ConditionLocator, MultipleElementLocator):
     """Locator for returning only elements of collection matching condition"""
 
+    __slots__ = ()
+
     @property
-    def _word(self):
+    def _step_word(self):
         return "filter"
 
     def get(self) -> list[WebElement]:
         """Get only web elements matching condition"""
+        matching = self._matching_in_browser()
+        if matching is not None:
+            return matching
         return [elem.get_actual() for elem in self._collection if self._condition(elem)]
 
 
 class FindElementLocator(ConditionLocator, SingleElementLocator):
     """Locator for returning single element of collection matching condition"""
 
+    __slots__ = ()
+
     @property
-    def _word(self):
-        return "find"
+    def _step_word(self):
+        return "first"
 
     def get(self) -> WebElement:
         """Get only single element matching condition"""
-        for elem in self._collection:
-            if self._condition(elem):
-                return elem.get_actual()
+        matching = self._matching_in_browser()
+        if matching:
+            return matching[0]
+        if matching is None:
+            for elem in self._collection:
+                if self._condition(elem):
+                    return elem.get_actual()
         raise NoSuchElementException(f"No element matching {repr(self)}")
@@ -0,0 +1,48 @@
+"""Cache of browser-side lookups validated against DOM version"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyasli.elements.scripts import lookup_script
+
+if TYPE_CHECKING:
+    from collections import Counter
+
+    from selenium.webdriver import Remote
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from pyasli.elements.scripts import Steps
+
+
+class LookupCache:
+    """Elements found by locator steps, valid while the document is not changed
+
+    Every lookup is a single script, which reads DOM stamp (document id and mutation counter)
+    and finds elements only if the stamp differs from the one of cached result.
+    Only steps without predicates should be looked up, as predicates can change without DOM mutations
+    """
+
+    def __init__(self, events: Counter):
+        self._events = events
+        self._stamp: list | None = None
+        self._found: dict[Steps, list[WebElement]] = {}
+
+    def clear(self):
+        """Drop all cached results"""
+        self._stamp = None
+        self._found.clear()
+
+    def lookup(self, driver: Remote, steps: Steps) -> list[WebElement]:
+        """Find elements by steps, using cached result if DOM is not changed since it was found"""
+        cached = self._found.get(steps)
+        script, steps_arg = lookup_script(steps)
+        stamp, found = driver.execute_script(script, None if cached is None else self._stamp, steps_arg)
+        if found is None:
+            self._events["lookup_cache_hit"] += 1
+            return list(cached)
+        self._events["lookup_cache_miss"] += 1
+        if stamp != self._stamp:  # results found in other DOM state are not valid anymore
+            self._found.clear()
+            self._stamp = stamp
+        self._found[steps] = found
+        return found
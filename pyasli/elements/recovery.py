@@ -0,0 +1,55 @@
+"""Recovering element lookups from stale element references"""
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING, Any
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pyasli.elements.searchable import Searchable
+
+
+def _is_alive(actual: Any) -> bool:
+    """Check if cached web element is still attached to the page"""
+    if isinstance(actual, list):  # finding collection again costs the same as checking it
+        return False
+    try:
+        _ = actual.tag_name
+    except StaleElementReferenceException:
+        return False
+    return True
+
+
+def _contexts(searchable: Searchable) -> Iterator[Searchable]:
+    """Contexts of the locator chain from the nearest one to the browser (excluded)"""
+    context = searchable.locator.context
+    while not context.__is_browser__:
+        yield context
+        context = context.locator.context
+
+
+def _page_url(browser) -> str:
+    with contextlib.suppress(WebDriverException):
+        return browser.get_actual().current_url
+    return "unknown"
+
+
+def recover(searchable: Searchable):
+    """Drop stale cached web elements of the searchable and its locator chain
+
+    Contexts are checked from the nearest one, so following lookup starts from the deepest still valid
+    cached ancestor. Recovery is counted in browser `events` and `stale_recoveries` by page URL.
+    """
+    searchable.__cached__ = None
+    for context in _contexts(searchable):
+        if context.__cached__ is None:
+            continue
+        if _is_alive(context.__cached__):
+            break
+        context.__cached__ = None
+    browser = searchable.browser
+    browser.events["stale_recovery"] += 1
+    browser.stale_recoveries[_page_url(browser)] += 1
@@ -0,0 +1,539 @@
+"""Browser-side scripts for resolving locator chains and checking conditions
+
+Locator chains are described by *steps* — tuples which can be sent to the browser as a script argument:
+
+- ``("find", how, what)`` — first element found in any of current elements
+- ``("findAll", how, what)`` — all elements found in all of current elements
+- ``("index", index)`` — single element of current elements
+- ``("slice", start, stop, step)`` — slice of current elements
+- ``("filter", predicate)`` — current elements matching predicate
+- ``("first", predicate)`` — first of current elements matching predicate
+
+`how` is either ``css`` or ``xpath``, `predicate` is JS expression using ``el`` variable.
+"""
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import pkgutil
+from typing import TYPE_CHECKING, Any, NamedTuple, Tuple
+
+from selenium.webdriver.common.by import By
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+Step = tuple
+Steps = Tuple[Step, ...]
+
+_CSS_FORMATS = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+_PREDICATE_STEPS = ("filter", "first")
+
+_LIBRARY = r"""
+function __find(ctx, how, what) {
+  if (how === 'xpath') {
+    var doc = ctx.ownerDocument || ctx;
+    var snapshot = doc.evaluate(what, ctx, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var found = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+      var node = snapshot.snapshotItem(i);
+      if (node.nodeType === 1) found.push(node);
+    }
+    return found;
+  }
+  return Array.prototype.slice.call(ctx.querySelectorAll(what));
+}
+function __slice(nodes, start, stop, step) {
+  var len = nodes.length, result = [], i;
+  step = step === null ? 1 : step;
+  function bound(value, dflt, lower, upper) {
+    if (value === null) return dflt;
+    if (value < 0) value += len;
+    return Math.min(Math.max(value, lower), upper);
+  }
+  if (step > 0) {
+    for (i = bound(start, 0, 0, len); i < bound(stop, len, 0, len); i += step) result.push(nodes[i]);
+  } else {
+    for (i = bound(start, len - 1, -1, len - 1); i > bound(stop, -1, -1, len - 1); i += step) result.push(nodes[i]);
+  }
+  return result;
+}
+function __resolve(steps, start) {
+  var nodes = start === null ? [document] : (Array.isArray(start) ? start : [start]);
+  for (var s = 0; s < steps.length; s++) {
+    var step = steps[s], next = [], i, found;
+    switch (step[0]) {
+      case 'find':
+        for (i = 0; i < nodes.length && !next.length; i++) next = __find(nodes[i], step[1], step[2]).slice(0, 1);
+        break;
+      case 'findAll':
+        for (i = 0; i < nodes.length; i++) next = next.concat(__find(nodes[i], step[1], step[2]));
+        break;
+      case 'index':
+        i = step[1] < 0 ? step[1] + nodes.length : step[1];
+        next = i >= 0 && i < nodes.length ? [nodes[i]] : [];
+        break;
+      case 'slice':
+        next = __slice(nodes, step[1], step[2], step[3]);
+        break;
+      case 'filter':
+        next = nodes.filter(__preds[step[1]]);
+        break;
+      case 'first':
+        found = nodes.filter(__preds[step[1]]);
+        next = found.slice(0, 1);
+        break;
+    }
+    nodes = next;
+  }
+  return nodes;
+}
+function __enabled(el) {
+  return !el.matches(':disabled') && !el.hasAttribute('disabled') && !el.hasAttribute('aria-disabled');
+}
+function __selected(el) {
+  return !!(el.selected || el.checked);
+}
+function __rect(el) {
+  var box = el.getBoundingClientRect();
+  return {x: box.left + window.pageXOffset, y: box.top + window.pageYOffset, width: box.width, height: box.height};
+}
+function __setValue(el, value) {
+  var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+  if (descriptor && descriptor.set) descriptor.set.call(el, value); else el.value = value;  // works with React
+}
+function __fire(el, type) {
+  el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+function __text(el) {
+  if (!__isShown(el)) return '';
+  return el.innerText.replace(/\u00a0/g, ' ').replace(/[ \t]+\n/g, '\n').trim();
+}
+"""
+
+_WAIT_BODY = r"""
+var steps = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null, timer = null, interval = null;
+function check() {
+  try {
+    var nodes = __resolve(steps, null);
+    return !!__preds[__preds.length - 1](nodes.length ? nodes[0] : null);
+  } catch (e) {
+    return false;
+  }
+}
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  if (observer !== null) observer.disconnect();
+  clearTimeout(timer);
+  clearInterval(interval);
+  done(result);
+}
+function tick() {
+  if (!finished && check()) finish(true);
+}
+function frame() {
+  if (finished) return;
+  tick();
+  window.requestAnimationFrame(frame);
+}
+if (check()) {
+  finish(true);
+} else {
+  observer = new MutationObserver(tick);
+  observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  timer = setTimeout(function () { finish(check()); }, timeout * 1000);
+  interval = setInterval(tick, 100);  // rAF is paused in background tabs
+  window.requestAnimationFrame(frame);
+}
+"""
+
+_RESOLVE_BODY = "return __resolve(arguments[1], arguments[0]);"
+
+_LOOKUP_BODY = r"""
+var state = window.__pyasliDom;
+if (!state || state.document !== document) {  // observer is installed once per document
+  state = window.__pyasliDom = {document: document, id: Math.random().toString(36).slice(2), version: 0};
+  state.observer = new MutationObserver(function () { state.version++; });
+  state.observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+if (state.observer.takeRecords().length) state.version++;
+var stamp = [state.id, state.version], expected = arguments[0];
+if (expected !== null && expected[0] === stamp[0] && expected[1] === stamp[1]) return [stamp, null];
+return [stamp, __resolve(arguments[1], null)];
+"""
+
+_SNAPSHOT_BODY = r"""
+var nodes = arguments[0] === null ? __resolve(arguments[1], null) : [arguments[0]];
+if (!nodes.length) return null;
+var el = nodes[0], names = arguments[2], attributes = {};
+for (var i = 0; i < names.length; i++) attributes[names[i]] = __getAttribute(el, names[i]);
+return [el, {
+  text: __text(el),
+  tagName: el.tagName.toLowerCase(),
+  value: __getAttribute(el, 'value'),
+  selected: __selected(el),
+  enabled: __enabled(el),
+  ariaDisabled: el.getAttribute('aria-disabled'),
+  visible: __isShown(el),
+  rect: __rect(el),
+  attributes: attributes
+}];
+"""
+
+_COLUMN_BODY = r"""
+var nodes = arguments[0] === null ? __resolve(arguments[1], null) : arguments[0], name = arguments[2];
+return nodes.map(function (el) { return (%s); });
+"""
+
+_STREAM_BODY = r"""
+var nodes = __resolve(arguments[1], arguments[0]), columns = arguments[2];
+return nodes.map(function (el) { return [%s]; });
+"""
+
+_SCROLL_BODY = r"""
+var key = arguments[2], tokens = window.__pyasliSeen = window.__pyasliSeen || {};
+var seen = tokens[arguments[3]] = tokens[arguments[3]] || {}, fresh = [], values = [];
+__resolve(arguments[1], arguments[0]).forEach(function (el) {
+  var value = el.getAttribute(key);
+  if (value === null || Object.prototype.hasOwnProperty.call(seen, value)) return;
+  seen[value] = true;
+  fresh.push(el);
+  values.push(value);
+});
+return [fresh, values];
+"""
+
+_FORGET_BODY = r"""
+if (window.__pyasliSeen) delete window.__pyasliSeen[arguments[0]];
+"""
+
+_TABLE_BODY = r"""
+var nodes = arguments[0] === null ? __resolve(arguments[1], null) : [arguments[0]];
+if (!nodes.length) return null;
+var table = nodes[0], name = arguments[2], first = arguments[3], count = arguments[4], pending = arguments[5];
+function value(el) { return (%s); }
+function cellsOf(row) { return Array.prototype.slice.call(row.cells); }
+var rows = Array.prototype.slice.call(table.rows), head = [];
+if (table.tHead) {
+  head = Array.prototype.slice.call(table.tHead.rows);
+} else if (rows.length && cellsOf(rows[0]).every(function (cell) { return cell.tagName === 'TH'; })) {
+  head = [rows[0]];
+}
+var body = rows.filter(function (row) { return head.indexOf(row) < 0; }), headers = [], lines = [], spans = [];
+if (head.length) {
+  cellsOf(head[head.length - 1]).forEach(function (cell) {
+    for (var i = 0; i < Math.max(cell.colSpan, 1); i++) headers.push(__text(cell));
+  });
+}
+body.slice(first, count === null ? body.length : first + count).forEach(function (row, r) {
+  var line = [], taken = [], col = 0, c;
+  pending.forEach(function (span) {
+    for (c = span[0]; c < span[0] + span[2]; c++) { line[c] = span[3]; taken[c] = true; }
+    span[1]--;
+  });
+  pending = pending.filter(function (span) { return span[1] > 0; });
+  cellsOf(row).forEach(function (cell) {
+    while (taken[col]) col++;
+    var v = value(cell), rowSpan = Math.max(cell.rowSpan, 1), colSpan = Math.max(cell.colSpan, 1);
+    for (c = col; c < col + colSpan; c++) { line[c] = v; taken[c] = true; }
+    if (rowSpan > 1 || colSpan > 1) spans.push([first + r, col, rowSpan, colSpan]);
+    if (rowSpan > 1) pending.push([col, rowSpan - 1, colSpan, v]);
+    col += colSpan;
+  });
+  for (c = 0; c < line.length; c++) if (!taken[c]) line[c] = null;
+  lines.push(line);
+});
+return [table, {headers: headers, rows: lines, spans: spans, pending: pending, total: body.length}];
+"""
+
+_FILL_BODY = r"""
+function fill(el, value) {
+  var tag = el.tagName.toLowerCase(), type = (el.getAttribute('type') || '').toLowerCase(), wanted, matched;
+  if (type === 'checkbox') {
+    el.checked = !!value;
+  } else if (type === 'radio') {
+    if (typeof value !== 'boolean') {
+      matched = el.value === String(value) ? el : null;
+      if (el.name) {
+        Array.prototype.forEach.call((el.form || document).querySelectorAll('input[type="radio"]'), function (radio) {
+          if (radio.name === el.name && radio.value === String(value)) matched = radio;
+        });
+      }
+      if (matched === null) return false;  // no radio button with the value, reported as missing field
+      el = matched;
+    }
+    el.checked = value !== false;
+  } else if (tag === 'select') {
+    wanted = (Array.isArray(value) ? value : [value]).map(String);
+    Array.prototype.forEach.call(el.options, function (option) {
+      option.selected = wanted.indexOf(option.value) >= 0 || wanted.indexOf(option.text) >= 0;
+    });
+  } else {
+    __setValue(el, value === null ? '' : String(value));
+  }
+  __fire(el, 'input');
+  __fire(el, 'change');
+  return true;
+}
+var roots = __resolve(arguments[1], arguments[0]), missing = [];
+arguments[2].forEach(function (field, i) {
+  var found = roots.length ? __resolve([field[0]], roots[0]) : [];
+  if (!found.length || !fill(found[0], field[1])) missing.push(i);
+});
+return missing;
+"""
+
+_ENTRY_BODY = r"""
+var el = arguments[0], part = arguments[1], append = arguments[2];
+if ('value' in el) __setValue(el, append ? el.value + part : part);
+else el.textContent = append ? el.textContent + part : part;
+if (arguments[3]) {
+  __fire(el, 'input');
+  __fire(el, 'change');
+}
+"""
+
+_EVALUATE_BODY = r"""
+var el = arguments[0];
+if (arguments[1] !== null) {
+  var nodes = __resolve(arguments[1], null);
+  el = nodes.length ? nodes[0] : null;
+}
+try {
+  return !!__preds[__preds.length - 1](el);
+} catch (e) {
+  return false;
+}
+"""
+
+_LOCATE_BODY = r"""
+return arguments[0].map(function (target) {
+  var found = __resolve(target[1], target[0]);
+  if (!found.length) return null;
+  if (target[2]) found[0].scrollIntoView({block: 'nearest', inline: 'nearest'});  // keeps other targets in view
+  return found[0];
+});
+"""
+
+# column name -> JS expression evaluated for every element, `name` is column argument
+_COLUMNS = {
+    "texts": "__text(el)",
+    "attributes": "__getAttribute(el, name)",
+    "properties": "el[name]",
+    "rects": "__rect(el)",
+    "states": "{visible: __isShown(el), enabled: __enabled(el), selected: __selected(el)}",
+}
+
+# selenium atoms: name used in scripts -> file of `selenium.webdriver.remote` package
+_ATOMS = {
+    "__isShown": "isDisplayed.js",
+    "__getAttribute": "getAttribute.js",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _atom(file_name: str) -> str:
+    """Selenium atom, the same one used by `WebElement` methods"""
+    return pkgutil.get_data("selenium.webdriver.remote", file_name).decode("utf8")
+
+
+def js_string(value: str) -> str:
+    """Return JS literal for given string"""
+    return json.dumps(value)
+
+
+def predicate_of(condition) -> str | None:
+    """Return JS predicate of the condition, `None` for conditions which can't be checked in browser"""
+    return getattr(condition, "js", None)
+
+
+def compile_by(by: tuple[str, str]) -> tuple[str, str] | None:
+    """Convert selenium locator to `(how, what)` pair, `None` for locators not supported in browser"""
+    how, what = by
+    if how == By.XPATH:
+        return "xpath", what
+    css_format = _CSS_FORMATS.get(how)
+    if css_format is None:
+        return None
+    return "css", css_format.format(what)
+
+
+class CompiledSteps(NamedTuple):
+    """Steps ready to be sent as script argument with predicates moved to script text"""
+    steps: list[list]
+    predicates: tuple[str, ...]
+
+
+def has_predicates(steps: Steps) -> bool:
+    """Check if steps filter elements by predicates, which can depend on state not changing the DOM"""
+    return any(step[0] in _PREDICATE_STEPS for step in steps)
+
+
+def compile_steps(steps: Steps, *predicates: str) -> CompiledSteps:
+    """Replace step predicates with their indexes in predicate list
+
+    Given `predicates` are appended to the end of predicate list, so they can be used by script body
+    """
+    collected = []
+    compiled = []
+    for step in steps:
+        if step[0] in _PREDICATE_STEPS:
+            if step[1] not in collected:
+                collected.append(step[1])
+            step = (step[0], collected.index(step[1]))  # noqa: PLW2901
+        compiled.append(list(step))
+    return CompiledSteps(compiled, (*collected, *predicates))
+
+
+def build_script(body: str, predicates: tuple[str, ...] = (), name: str = "script") -> str:
+    """Build script with locator resolving library and given predicates available for the body
+
+    Script starts with ``/* pyasli:<name> */`` comment, so it can be recognised in logs
+    """
+    functions = ",\n".join(f"function (el) {{ return ({predicate}); }}" for predicate in predicates)
+    script = f"var __preds = [{functions}];\n{body}"
+    used = {variable for variable in _ATOMS if f"{variable}(" in script}
+    if "__text(" in script:  # text of hidden elements is empty
+        used.add("__isShown")
+    atoms = "".join(f"var {name} = {_atom(file_name)};\n" for name, file_name in _ATOMS.items() if name in used)
+    return f"/* pyasli:{name} */\n{_LIBRARY}\n{atoms}{script}"
+
+
+def wait_script(steps: Steps, predicate: str) -> tuple[str, list[Any]]:
+    """Return async script waiting for the predicate matching element found by `steps` and its steps argument"""
+    compiled = compile_steps(steps, predicate)
+    return build_script(_WAIT_BODY, compiled.predicates, "wait"), compiled.steps
+
+
+def evaluate_script(steps: Steps | None, predicate: str) -> tuple[str, list[Any] | None]:
+    """Return script checking predicate for element found by `steps` and its steps argument
+
+    Script arguments are: element to be checked if `steps` is `None` (`null` for missing element) and steps
+    """
+    if steps is None:
+        return build_script(_EVALUATE_BODY, (predicate,), "evaluate"), None
+    compiled = compile_steps(steps, predicate)
+    return build_script(_EVALUATE_BODY, compiled.predicates, "evaluate"), compiled.steps
+
+
+def resolve_script(steps: Steps) -> tuple[str, list[Any]]:
+    """Return script finding all elements by `steps` and its steps argument
+
+    Script arguments are: element or element list to start from (`null` for the document) and steps
+    """
+    compiled = compile_steps(steps)
+    return build_script(_RESOLVE_BODY, compiled.predicates, "resolve"), compiled.steps
+
+
+def lookup_script(steps: Steps) -> tuple[str, list[Any]]:
+    """Return script finding all elements by `steps` unless DOM is not changed since given stamp
+
+    Script arguments are: expected DOM stamp (or `null`) and steps.
+    Script returns current DOM stamp and found elements, or `null` instead of elements if stamp is not changed.
+    """
+    compiled = compile_steps(steps)
+    return build_script(_LOOKUP_BODY, compiled.predicates, "lookup"), compiled.steps
+
+
+def snapshot_script(steps: Steps) -> tuple[str, list[Any]]:
+    """Return script capturing state of element found by `steps` and its steps argument
+
+    Script arguments are: cached element or `null`, steps and list of captured attribute names
+    """
+    compiled = compile_steps(steps)
+    return build_script(_SNAPSHOT_BODY, compiled.predicates, "snapshot"), compiled.steps
+
+
+def column_script(steps: Steps, column: str) -> tuple[str, list[Any]]:
+    """Return script getting given column of values for every element found by `steps` and its steps argument
+
+    Script arguments are: cached element list or `null`, steps and column argument (e.g. attribute name)
+    """
+    compiled = compile_steps(steps)
+    return build_script(_COLUMN_BODY % _COLUMNS[column], compiled.predicates, column), compiled.steps
+
+
+def stream_script(steps: Steps, columns: Sequence[str]) -> tuple[str, list[Any]]:
+    """Return script getting row of values of given columns for every element found by `steps` and its steps argument
+
+    Script arguments are: element list to start from (`null` for the document), steps
+    and list of ``[column, argument]`` pairs
+    """
+    compiled = compile_steps(steps)
+    values = ", ".join(
+        f"(function (name) {{ return ({_COLUMNS[column]}); }})(columns[{i}][1])" for i, column in enumerate(columns)
+    )
+    return build_script(_STREAM_BODY % values, compiled.predicates, "stream"), compiled.steps
+
+
+def scroll_script(steps: Steps) -> tuple[str, list[Any]]:
+    """Return script finding elements by `steps` not seen by previous calls with the same token
+
+    Script arguments are: element list to start from (`null` for the document), steps, name of the attribute
+    identifying elements and the token. Script returns new elements and their identifying attribute values,
+    elements without the attribute are skipped.
+    """
+    compiled = compile_steps(steps)
+    return build_script(_SCROLL_BODY, compiled.predicates, "scroll"), compiled.steps
+
+
+def forget_script() -> str:
+    """Return script dropping elements seen by scroll scripts with the token given as the script argument"""
+    return build_script(_FORGET_BODY, (), "forget")
+
+
+def table_script(steps: Steps, column: str) -> tuple[str, list[Any]]:
+    """Return script reading rows of table element found by `steps` and its steps argument
+
+    Cell values are taken as values of given column (`texts` or `attributes`).
+    Script arguments are: cached element or `null`, steps, column argument (e.g. attribute name),
+    index of the first read body row, number of read rows (`null` for all) and list of
+    ``[column, rows left, columns, value]`` of cells spanning into the first read row from previous ones
+    """
+    compiled = compile_steps(steps)
+    return build_script(_TABLE_BODY % _COLUMNS[column], compiled.predicates, "table"), compiled.steps
+
+
+def fill_script(steps: Steps) -> tuple[str, list[Any]]:
+    """Return script setting values of fields found in the element found by `steps` and its steps argument
+
+    Script arguments are: element to start from (`null` for the document), steps and list of
+    ``[step, value]`` pairs of fields. Input and change events are fired for every field.
+    Script returns indexes of fields which are not found.
+    """
+    compiled = compile_steps(steps)
+    return build_script(_FILL_BODY, compiled.predicates, "fill"), compiled.steps
+
+
+def entry_script() -> str:
+    """Return script setting text of the element or appending a part to it
+
+    Script arguments are: the element, text part, whether the part is appended and whether it's the last part.
+    Input and change events are fired after the last part.
+    """
+    return build_script(_ENTRY_BODY, (), "entry")
+
+
+def locate_script(chains: Sequence[Steps]) -> tuple[str, list[Any]]:
+    """Return script finding single element by each of `chains` of steps and steps argument of every chain
+
+    Script argument is list of ``[element to start from (`null` for the document), steps argument, scroll]``
+    targets, script returns found element or `null` for every target. Found element is scrolled into view
+    if `scroll` is true.
+    """
+    compiled = compile_steps(tuple(itertools.chain.from_iterable(chains)))
+    split, offset = [], 0
+    for steps in chains:
+        split.append(compiled.steps[offset:offset + len(steps)])
+        offset += len(steps)
+    return build_script(_LOCATE_BODY, compiled.predicates, "locate"), split
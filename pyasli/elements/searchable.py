@@ -2,24 +2,49 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, List, Union
 
 from selenium.webdriver import Remote
 from selenium.webdriver.remote.webelement import WebElement
 
-Wrapped = Union[WebElement, list[WebElement], Remote]
+from pyasli.elements.identity import HandleCell
+
+if TYPE_CHECKING:
+    from pyasli.elements.locator_ir import LocatorIR
+
+Wrapped = Union[WebElement, List[WebElement], Remote]
 BROWSER = "Browser"
 
 
 class Searchable(ABC):
     """Base class for objects that presents lazy-loading searchable elements"""
 
-    __cached__: Wrapped = None
+    __slots__ = ("__weakref__", "_cell", "_locator")
     __is_browser__ = False
     _locator: LocatorStrategy  # pylint: disable=used-before-assignment
+    _cell: HandleCell | None
 
     def __init__(self, locator: LocatorStrategy):
         self._locator = locator
+        self._cell = None
+
+    @property
+    def __cached__(self) -> Wrapped:
+        """Found web element(s), `None` if not found yet or invalidated"""
+        return self._handle_cell().actual
+
+    @__cached__.setter
+    def __cached__(self, actual: Wrapped):
+        self._handle_cell().actual = actual
+
+    def _handle_cell(self) -> HandleCell:
+        if self._cell is None:
+            self._cell = self._new_cell()
+        return self._cell
+
+    def _new_cell(self) -> HandleCell:
+        """Create cell holding found web element(s), not shared with other wrappers by default"""
+        return HandleCell()
 
     def get_actual(self):
         """Get actual instance of wrapped class"""
@@ -47,15 +72,41 @@ class Searchable(ABC):
 class LocatorStrategy(ABC):
     """Base class for locator containers"""
 
+    __slots__ = ("_ir", "by", "context")
     context: Searchable
+    _ir: LocatorIR | None
 
     def __init__(self, by: tuple[str, str], context: Searchable):
         self.context = context
         self.by = by
+        self._ir = None
 
     @abstractmethod
     def get(self) -> Any:
         """"Run locator and return object"""
 
+    def steps(self) -> tuple | None:
+        """Return browser-side steps of the whole locator chain, `None` if it can't be resolved in browser"""
+        chain = self.chain_steps(use_cache=False)
+        return None if chain is None else chain[1]
+
+    def chain_steps(self, use_cache=True) -> tuple[Any, tuple] | None:  # noqa: ARG002
+        """Return web element(s) to start resolving from and browser-side steps of the locator chain
+
+        Chain starts from the document (`None` start) or, if `use_cache` is set, from the nearest context
+        having cached web element(s). `None` is returned if the chain can't be resolved in browser.
+        """
+        return None
+
+    @property
+    def ir(self) -> LocatorIR:
+        """Immutable representation of the locator chain, built once"""
+        if self._ir is None:
+            self._ir = self._build_ir()
+        return self._ir
+
     @abstractmethod
-    def __repr__(self) -> str: ...  # pylint: disable=multiple-statements
+    def _build_ir(self) -> LocatorIR: ...  # pylint: disable=multiple-statements
+
+    def __repr__(self) -> str:
+        return self.ir.description
@@ -0,0 +1,88 @@
+"""Element state captured in a single round trip"""
+from __future__ import annotations
+
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class Rect(NamedTuple):
+    """Element position relative to the document and its size"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+class ElementState(NamedTuple):
+    """Visibility and interactivity flags of the element"""
+    visible: bool
+    enabled: bool
+    selected: bool
+
+
+class ElementSnapshot(NamedTuple):
+    """Immutable state of the element captured by :meth:`Element.snapshot`
+
+    Values follow ones of :class:`Element` properties, except `text`,
+    which is taken from rendered `innerText` and can differ from WebDriver text in whitespaces,
+    so `Element.text` is never read from the snapshot
+    """
+    text: str
+    tag_name: str
+    value: Any
+    selected: bool
+    enabled: bool
+    aria_disabled: str | None
+    visible: bool
+    rect: Rect
+    attributes: Mapping[str, str | None]
+    taken_at: float  # `time.monotonic()` value at the moment of capturing
+
+    @classmethod
+    def from_state(cls, state: dict) -> ElementSnapshot:
+        """Create snapshot from state returned by snapshot script"""
+        return cls(
+            text=state["text"],
+            tag_name=state["tagName"],
+            value=state["value"],
+            selected=state["selected"],
+            enabled=state["enabled"],
+            aria_disabled=state["ariaDisabled"],
+            visible=state["visible"],
+            rect=Rect(**state["rect"]),
+            attributes=MappingProxyType(dict(state["attributes"])),
+            taken_at=time.monotonic(),
+        )
+
+    @property
+    def disabled(self) -> bool:
+        """Element disabled state"""
+        return not self.enabled
+
+    @property
+    def hidden(self) -> bool:
+        """Element hidden state"""
+        return not self.visible
+
+    @property
+    def size(self) -> dict:
+        """Element size in the same format as `Element.size`"""
+        return {"height": self.rect.height, "width": self.rect.width}
+
+    @property
+    def age(self) -> float:
+        """Seconds passed since the snapshot is taken"""
+        return time.monotonic() - self.taken_at
+
+    def get_attribute(self, name: str) -> str | None:
+        """Captured attribute value
+
+        :raises KeyError: if the attribute was not captured
+        """
+        if name == "value" and name not in self.attributes:
+            return self.value
+        return self.attributes[name]
@@ -0,0 +1,45 @@
+"""Contents of HTML tables read in a single round trip"""
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+
+class CellSpan(NamedTuple):
+    """Cell spanning several rows or columns, positions are indexes in table body grid"""
+    row: int
+    column: int
+    rows: int
+    columns: int
+
+
+class Table(NamedTuple):
+    """Contents of HTML table read by :meth:`Element.table`
+
+    Body is stored by columns. Value of the cell spanning several rows or columns is repeated
+    in every grid position it covers, missing cells are `None`.
+    Headers are texts of the last header row: rows of `thead` or the first row if it has only `th` cells.
+    """
+    headers: tuple[str, ...]
+    columns: tuple[tuple[Any, ...], ...]
+    spans: tuple[CellSpan, ...]
+
+    @classmethod
+    def from_part(cls, part: dict) -> Table:
+        """Create table from result of table script"""
+        headers = tuple(part["headers"])
+        rows = part["rows"]
+        width = max([len(headers), *(len(row) for row in rows)])
+        columns = tuple(tuple(row[i] if i < len(row) else None for row in rows) for i in range(width))
+        return cls(headers, columns, tuple(CellSpan(*span) for span in part["spans"]))
+
+    @property
+    def rows(self) -> list[tuple[Any, ...]]:
+        """Body rows of the table"""
+        return list(zip(*self.columns))
+
+    def column(self, header: str) -> tuple[Any, ...]:
+        """Values of the first column with given header
+
+        :raises ValueError: if there's no such header
+        """
+        return self.columns[self.headers.index(header)]
@@ -18,9 +18,26 @@ class NoBrowserException(WebDriverException):
     """No operable browser is open"""
 
 
+class ConditionsTimeoutError(TimeoutError):
+    """Some of conditions waited together are not reached in time
+
+    `results` contain :class:`pyasli.wait.WaitResult` for every waited pair
+    """
+
+    def __init__(self, message, results=()):
+        super().__init__(message)
+        self.results = list(results)
+
+
+class FrozenPageError(RuntimeError):
+    """Page-changing action is used inside `BrowserSession.frozen` block"""
+
+
 class Screenshotable(abc.ABC):
     """Object instance provide screenshot functionality"""
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def log_path(self) -> str: ...
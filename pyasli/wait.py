@@ -1,18 +1,294 @@
 """Condition waiting"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
 import time
-from collections.abc import Callable
-from typing import TypeVar
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from selenium.common.exceptions import WebDriverException
+
+from pyasli.exceptions import ConditionsTimeoutError, NoBrowserException
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 
 T = TypeVar("T")
 
 
-def wait_for(element: T, condition: Callable[[T], bool], timeout=5, exception=None):
-    """Wait until condition for element is satisfied"""
-    end_time = time.time() + timeout
-    polling_time = 0.05
-    while time.time() < end_time:
-        if condition(element):
+class PollingPolicy(ABC):
+    """Strategy of pauses between consecutive condition checks
+
+    First check is always done immediately, policy defines only delays before re-checks
+    """
+
+    @abstractmethod
+    def delays(self) -> Iterator[float]:
+        """Return new infinite sequence of delays (in seconds) between checks"""
+
+
+class FixedPolling(PollingPolicy):
+    """Same delay between all checks"""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+
+    def delays(self) -> Iterator[float]:
+        while True:
+            yield self.interval
+
+    def __repr__(self):
+        return f"FixedPolling({self.interval})"
+
+
+class ExponentialBackoff(PollingPolicy):
+    """Delay growing with each check by `factor` until reaching `maximum`"""
+
+    def __init__(self, initial=0.05, factor=2.0, maximum=1.0):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial
+        while True:
+            yield min(delay, self.maximum)
+            delay *= self.factor
+
+    def __repr__(self):
+        return f"ExponentialBackoff({self.initial}, {self.factor}, {self.maximum})"
+
+
+class JitteredPolling(PollingPolicy):
+    """Delays of wrapped policy randomly spread by `jitter` fraction
+
+    Prevents many waits started at the same time from hitting the hub simultaneously
+    """
+
+    def __init__(self, policy: PollingPolicy = None, jitter=0.5):
+        self.policy = policy or ExponentialBackoff()
+        self.jitter = jitter
+
+    def delays(self) -> Iterator[float]:
+        for delay in self.policy.delays():
+            yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)  # noqa: S311
+
+    def __repr__(self):
+        return f"JitteredPolling({self.policy!r}, {self.jitter})"
+
+
+class ImmediateThenBackoff(PollingPolicy):
+    """Re-check `immediate` times without any delay, then back off using `backoff` policy
+
+    Useful for conditions which are usually reached right after the action
+    """
+
+    def __init__(self, immediate=1, backoff: PollingPolicy = None):
+        self.immediate = immediate
+        self.backoff = backoff or ExponentialBackoff()
+
+    def delays(self) -> Iterator[float]:
+        for _ in range(self.immediate):
+            yield 0
+        yield from self.backoff.delays()
+
+    def __repr__(self):
+        return f"ImmediateThenBackoff({self.immediate}, {self.backoff!r})"
+
+
+_DEFAULT_POLLING: PollingPolicy = FixedPolling()
+
+
+def set_default_polling(policy: PollingPolicy):
+    """Set polling policy used by all waits without explicitly given one"""
+    global _DEFAULT_POLLING  # noqa: PLW0603
+    _DEFAULT_POLLING = policy
+
+
+def get_default_polling() -> PollingPolicy:
+    """Return polling policy used by all waits without explicitly given one"""
+    return _DEFAULT_POLLING
+
+
+# monotonic time at which all waits of current `deadline` block end, `None` outside of the block
+_DEADLINE: ContextVar[float | None] = ContextVar("pyasli_deadline", default=None)
+
+
+def time_left(timeout: float) -> float:
+    """Return `timeout` bounded by time left before the end of current :func:`deadline` block"""
+    end_time = _DEADLINE.get()
+    if end_time is None:
+        return timeout
+    return max(0.0, min(timeout, end_time - time.monotonic()))
+
+
+def in_deadline() -> bool:
+    """Check if code is running inside :func:`deadline` block, e.g. in condition of another wait"""
+    return _DEADLINE.get() is not None
+
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> Iterator[float]:
+    """Block in which all waits end in `timeout` seconds at the latest, yields seconds given to the block
+
+    Every wait runs in such block, so waits nested in waited conditions use only the time left of the outer wait.
+    Nested blocks can only make the deadline closer. Deadline is kept per thread and asyncio task.
+    """
+    timeout = time_left(timeout)
+    token = _DEADLINE.set(time.monotonic() + timeout)
+    try:
+        yield timeout
+    finally:
+        _DEADLINE.reset(token)
+
+
+@contextlib.contextmanager
+def wait_deadline(timeout: float, targets: Iterable[Any] = ()) -> Iterator[float]:
+    """:func:`deadline` block of a wait for `targets`, yields seconds given to the wait
+
+    Outermost wait is also limited by wait budget of browser sessions of the targets
+    (see `BrowserSession.wait_budget`) and the time it takes is counted in their `waited`
+    """
+    if in_deadline():  # time of nested wait is counted by the outer one
+        with deadline(timeout) as left:
+            yield left
+        return
+    sessions = []
+    for target in targets:
+        session = getattr(target, "browser", None)
+        if hasattr(session, "waited") and all(session is not known for known in sessions):
+            sessions.append(session)
+    budgets = [session.wait_budget - session.waited for session in sessions if session.wait_budget is not None]
+    start = time.monotonic()
+    try:
+        with deadline(max(0.0, min([timeout, *budgets]))) as left:
+            yield left
+    finally:
+        for session in sessions:
+            session.waited += time.monotonic() - start
+
+
+def poll(polling: PollingPolicy = None, timeout=5) -> Iterator[float]:
+    """Yield time left before the deadline for each check, sleeping between checks
+
+    The last check is done right at the deadline. Deadline is based on monotonic clock
+    and is not later than the end of current :func:`deadline` block.
+    """
+    end_time = time.monotonic() + time_left(timeout)
+    delays = (polling or _DEFAULT_POLLING).delays()
+    while True:
+        remaining = end_time - time.monotonic()
+        yield remaining
+        if remaining <= 0:
             return
-        time.sleep(polling_time)
+        time.sleep(min(next(delays), remaining))
+
+
+async def async_poll(polling: PollingPolicy = None, timeout=5) -> AsyncIterator[float]:
+    """Asynchronous :func:`poll`, giving control to the event loop between checks"""
+    end_time = time.monotonic() + time_left(timeout)
+    delays = (polling or _DEFAULT_POLLING).delays()
+    while True:
+        remaining = end_time - time.monotonic()
+        yield remaining
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(next(delays), remaining))
+
+
+def wait_until(element: T, condition: Callable[[T], bool], timeout=5, polling: PollingPolicy = None) -> bool:
+    """Wait until condition for element is satisfied, return `False` if it's not satisfied in time"""
+    with wait_deadline(timeout, [element]):
+        return any(condition(element) for _ in poll(polling, timeout))
+
+
+def wait_for(element: T, condition: Callable[[T], bool], timeout=5, exception=None, polling: PollingPolicy = None):
+    """Wait until condition for element is satisfied"""
+    if wait_until(element, condition, timeout, polling):
+        return
     message = f"Wait time has expired for condition `{condition.__name__}`"
     raise exception or TimeoutError(message)
+
+
+class WaitResult(NamedTuple):
+    """Result of waiting for single `(target, condition)` pair"""
+    target: Any
+    condition: Callable[[Any], bool]
+    passed: bool = False
+    elapsed: float = None  # seconds from the start of the wait until the condition was reached
+    error: Exception = None  # last error raised by the condition
+
+    def __str__(self):
+        description = f"{self.target!r}: {self.condition.__name__}"
+        if self.passed:
+            return f"{description} reached in {self.elapsed:.3f} seconds"
+        if self.error is not None:
+            return f"{description} is not reached, last error: {self.error!r}"
+        return f"{description} is not reached"
+
+
+def _check_pending(results: list[WaitResult], start: float, stop_on_pass=False):
+    """Check not yet passed pairs once, updating their results in place"""
+    for i, result in enumerate(results):
+        if result.passed:
+            continue
+        try:
+            passed = result.condition(result.target)
+        except NoBrowserException:
+            raise
+        except (WebDriverException, AssertionError, TimeoutError) as error:
+            results[i] = result._replace(error=error)
+            continue
+        if passed:
+            results[i] = result._replace(passed=True, elapsed=time.monotonic() - start, error=None)
+            if stop_on_pass:
+                return
+
+
+def _raise_not_reached(results: list[WaitResult], timeout):
+    failed = [result for result in results if not result.passed]
+    details = "\n".join(f"  {result}" for result in results)
+    message = f"{len(failed)} of {len(results)} conditions are not reached in {timeout} seconds:\n{details}"
+    raise ConditionsTimeoutError(message, results)
+
+
+def wait_all(pairs: Iterable[tuple[T, Callable[[T], bool]]], timeout=5,
+             polling: PollingPolicy = None) -> list[WaitResult]:
+    """Wait until all conditions are satisfied for their targets in single polling loop
+
+    Targets can be any objects the conditions accept, e.g. `Element` or `ElementCollection`.
+    Conditions which are already reached are not checked again.
+
+    :raises ConditionsTimeoutError: with results for every pair if any condition is not reached in time
+    """
+    results = [WaitResult(target, condition) for target, condition in pairs]
+    start = time.monotonic()
+    with wait_deadline(timeout, [result.target for result in results]):
+        for _ in poll(polling, timeout):
+            _check_pending(results, start)
+            if all(result.passed for result in results):
+                return results
+    return _raise_not_reached(results, timeout)
+
+
+def wait_any(pairs: Iterable[tuple[T, Callable[[T], bool]]], timeout=5,
+             polling: PollingPolicy = None) -> WaitResult:
+    """Wait until any of conditions is satisfied for its target in single polling loop
+
+    Return result of the first reached pair. Pairs are checked in the given order.
+
+    :raises ConditionsTimeoutError: with results for every pair if no condition is reached in time
+    """
+    results = [WaitResult(target, condition) for target, condition in pairs]
+    start = time.monotonic()
+    with wait_deadline(timeout, [result.target for result in results]):
+        for _ in poll(polling, timeout):
+            _check_pending(results, start, stop_on_pass=True)
+            for result in results:
+                if result.passed:
+                    return result
+    return _raise_not_reached(results, timeout)
+
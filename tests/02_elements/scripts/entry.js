@@ -0,0 +1,11 @@
+/* pyasli:entry */
+<library>
+var __preds = [];
+
+var el = arguments[0], part = arguments[1], append = arguments[2];
+if ('value' in el) __setValue(el, append ? el.value + part : part);
+else el.textContent = append ? el.textContent + part : part;
+if (arguments[3]) {
+  __fire(el, 'input');
+  __fire(el, 'change');
+}
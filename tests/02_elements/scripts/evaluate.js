@@ -0,0 +1,17 @@
+/* pyasli:evaluate */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var el = arguments[0];
+if (arguments[1] !== null) {
+  var nodes = __resolve(arguments[1], null);
+  el = nodes.length ? nodes[0] : null;
+}
+try {
+  return !!__preds[__preds.length - 1](el);
+} catch (e) {
+  return false;
+}
@@ -0,0 +1,40 @@
+/* pyasli:fill */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+function fill(el, value) {
+  var tag = el.tagName.toLowerCase(), type = (el.getAttribute('type') || '').toLowerCase(), wanted, matched;
+  if (type === 'checkbox') {
+    el.checked = !!value;
+  } else if (type === 'radio') {
+    if (typeof value !== 'boolean') {
+      matched = el.value === String(value) ? el : null;
+      if (el.name) {
+        Array.prototype.forEach.call((el.form || document).querySelectorAll('input[type="radio"]'), function (radio) {
+          if (radio.name === el.name && radio.value === String(value)) matched = radio;
+        });
+      }
+      if (matched === null) return false;  // no radio button with the value, reported as missing field
+      el = matched;
+    }
+    el.checked = value !== false;
+  } else if (tag === 'select') {
+    wanted = (Array.isArray(value) ? value : [value]).map(String);
+    Array.prototype.forEach.call(el.options, function (option) {
+      option.selected = wanted.indexOf(option.value) >= 0 || wanted.indexOf(option.text) >= 0;
+    });
+  } else {
+    __setValue(el, value === null ? '' : String(value));
+  }
+  __fire(el, 'input');
+  __fire(el, 'change');
+  return true;
+}
+var roots = __resolve(arguments[1], arguments[0]), missing = [];
+arguments[2].forEach(function (field, i) {
+  var found = roots.length ? __resolve([field[0]], roots[0]) : [];
+  if (!found.length || !fill(found[0], field[1])) missing.push(i);
+});
+return missing;
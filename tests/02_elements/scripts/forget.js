@@ -0,0 +1,5 @@
+/* pyasli:forget */
+<library>
+var __preds = [];
+
+if (window.__pyasliSeen) delete window.__pyasliSeen[arguments[0]];
@@ -0,0 +1,80 @@
+
+function __find(ctx, how, what) {
+  if (how === 'xpath') {
+    var doc = ctx.ownerDocument || ctx;
+    var snapshot = doc.evaluate(what, ctx, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var found = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+      var node = snapshot.snapshotItem(i);
+      if (node.nodeType === 1) found.push(node);
+    }
+    return found;
+  }
+  return Array.prototype.slice.call(ctx.querySelectorAll(what));
+}
+function __slice(nodes, start, stop, step) {
+  var len = nodes.length, result = [], i;
+  step = step === null ? 1 : step;
+  function bound(value, dflt, lower, upper) {
+    if (value === null) return dflt;
+    if (value < 0) value += len;
+    return Math.min(Math.max(value, lower), upper);
+  }
+  if (step > 0) {
+    for (i = bound(start, 0, 0, len); i < bound(stop, len, 0, len); i += step) result.push(nodes[i]);
+  } else {
+    for (i = bound(start, len - 1, -1, len - 1); i > bound(stop, -1, -1, len - 1); i += step) result.push(nodes[i]);
+  }
+  return result;
+}
+function __resolve(steps, start) {
+  var nodes = start === null ? [document] : (Array.isArray(start) ? start : [start]);
+  for (var s = 0; s < steps.length; s++) {
+    var step = steps[s], next = [], i, found;
+    switch (step[0]) {
+      case 'find':
+        for (i = 0; i < nodes.length && !next.length; i++) next = __find(nodes[i], step[1], step[2]).slice(0, 1);
+        break;
+      case 'findAll':
+        for (i = 0; i < nodes.length; i++) next = next.concat(__find(nodes[i], step[1], step[2]));
+        break;
+      case 'index':
+        i = step[1] < 0 ? step[1] + nodes.length : step[1];
+        next = i >= 0 && i < nodes.length ? [nodes[i]] : [];
+        break;
+      case 'slice':
+        next = __slice(nodes, step[1], step[2], step[3]);
+        break;
+      case 'filter':
+        next = nodes.filter(__preds[step[1]]);
+        break;
+      case 'first':
+        found = nodes.filter(__preds[step[1]]);
+        next = found.slice(0, 1);
+        break;
+    }
+    nodes = next;
+  }
+  return nodes;
+}
+function __enabled(el) {
+  return !el.matches(':disabled') && !el.hasAttribute('disabled') && !el.hasAttribute('aria-disabled');
+}
+function __selected(el) {
+  return !!(el.selected || el.checked);
+}
+function __rect(el) {
+  var box = el.getBoundingClientRect();
+  return {x: box.left + window.pageXOffset, y: box.top + window.pageYOffset, width: box.width, height: box.height};
+}
+function __setValue(el, value) {
+  var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+  if (descriptor && descriptor.set) descriptor.set.call(el, value); else el.value = value;  // works with React
+}
+function __fire(el, type) {
+  el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+function __text(el) {
+  if (!__isShown(el)) return '';
+  return el.innerText.replace(/\u00a0/g, ' ').replace(/[ \t]+\n/g, '\n').trim();
+}
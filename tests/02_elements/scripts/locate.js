@@ -0,0 +1,12 @@
+/* pyasli:locate */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+return arguments[0].map(function (target) {
+  var found = __resolve(target[1], target[0]);
+  if (!found.length) return null;
+  if (target[2]) found[0].scrollIntoView({block: 'nearest', inline: 'nearest'});  // keeps other targets in view
+  return found[0];
+});
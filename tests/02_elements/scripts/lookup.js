@@ -0,0 +1,16 @@
+/* pyasli:lookup */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var state = window.__pyasliDom;
+if (!state || state.document !== document) {  // observer is installed once per document
+  state = window.__pyasliDom = {document: document, id: Math.random().toString(36).slice(2), version: 0};
+  state.observer = new MutationObserver(function () { state.version++; });
+  state.observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+if (state.observer.takeRecords().length) state.version++;
+var stamp = [state.id, state.version], expected = arguments[0];
+if (expected !== null && expected[0] === stamp[0] && expected[1] === stamp[1]) return [stamp, null];
+return [stamp, __resolve(arguments[1], null)];
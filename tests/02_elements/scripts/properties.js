@@ -0,0 +1,8 @@
+/* pyasli:properties */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var nodes = arguments[0] === null ? __resolve(arguments[1], null) : arguments[0], name = arguments[2];
+return nodes.map(function (el) { return (el[name]); });
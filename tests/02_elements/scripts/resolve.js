@@ -0,0 +1,6 @@
+/* pyasli:resolve */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+return __resolve(arguments[1], arguments[0]);
\ No newline at end of file
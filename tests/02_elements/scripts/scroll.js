@@ -0,0 +1,16 @@
+/* pyasli:scroll */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var key = arguments[2], tokens = window.__pyasliSeen = window.__pyasliSeen || {};
+var seen = tokens[arguments[3]] = tokens[arguments[3]] || {}, fresh = [], values = [];
+__resolve(arguments[1], arguments[0]).forEach(function (el) {
+  var value = el.getAttribute(key);
+  if (value === null || Object.prototype.hasOwnProperty.call(seen, value)) return;
+  seen[value] = true;
+  fresh.push(el);
+  values.push(value);
+});
+return [fresh, values];
@@ -0,0 +1,22 @@
+/* pyasli:snapshot */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __getAttribute = <selenium getAttribute.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var nodes = arguments[0] === null ? __resolve(arguments[1], null) : [arguments[0]];
+if (!nodes.length) return null;
+var el = nodes[0], names = arguments[2], attributes = {};
+for (var i = 0; i < names.length; i++) attributes[names[i]] = __getAttribute(el, names[i]);
+return [el, {
+  text: __text(el),
+  tagName: el.tagName.toLowerCase(),
+  value: __getAttribute(el, 'value'),
+  selected: __selected(el),
+  enabled: __enabled(el),
+  ariaDisabled: el.getAttribute('aria-disabled'),
+  visible: __isShown(el),
+  rect: __rect(el),
+  attributes: attributes
+}];
@@ -0,0 +1,9 @@
+/* pyasli:stream */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __getAttribute = <selenium getAttribute.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var nodes = __resolve(arguments[1], arguments[0]), columns = arguments[2];
+return nodes.map(function (el) { return [(function (name) { return (__text(el)); })(columns[0][1]), (function (name) { return (__getAttribute(el, name)); })(columns[1][1]), (function (name) { return ({visible: __isShown(el), enabled: __enabled(el), selected: __selected(el)}); })(columns[2][1])]; });
@@ -0,0 +1,42 @@
+/* pyasli:table */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); }];
+
+var nodes = arguments[0] === null ? __resolve(arguments[1], null) : [arguments[0]];
+if (!nodes.length) return null;
+var table = nodes[0], name = arguments[2], first = arguments[3], count = arguments[4], pending = arguments[5];
+function value(el) { return (__text(el)); }
+function cellsOf(row) { return Array.prototype.slice.call(row.cells); }
+var rows = Array.prototype.slice.call(table.rows), head = [];
+if (table.tHead) {
+  head = Array.prototype.slice.call(table.tHead.rows);
+} else if (rows.length && cellsOf(rows[0]).every(function (cell) { return cell.tagName === 'TH'; })) {
+  head = [rows[0]];
+}
+var body = rows.filter(function (row) { return head.indexOf(row) < 0; }), headers = [], lines = [], spans = [];
+if (head.length) {
+  cellsOf(head[head.length - 1]).forEach(function (cell) {
+    for (var i = 0; i < Math.max(cell.colSpan, 1); i++) headers.push(__text(cell));
+  });
+}
+body.slice(first, count === null ? body.length : first + count).forEach(function (row, r) {
+  var line = [], taken = [], col = 0, c;
+  pending.forEach(function (span) {
+    for (c = span[0]; c < span[0] + span[2]; c++) { line[c] = span[3]; taken[c] = true; }
+    span[1]--;
+  });
+  pending = pending.filter(function (span) { return span[1] > 0; });
+  cellsOf(row).forEach(function (cell) {
+    while (taken[col]) col++;
+    var v = value(cell), rowSpan = Math.max(cell.rowSpan, 1), colSpan = Math.max(cell.colSpan, 1);
+    for (c = col; c < col + colSpan; c++) { line[c] = v; taken[c] = true; }
+    if (rowSpan > 1 || colSpan > 1) spans.push([first + r, col, rowSpan, colSpan]);
+    if (rowSpan > 1) pending.push([col, rowSpan - 1, colSpan, v]);
+    col += colSpan;
+  });
+  for (c = 0; c < line.length; c++) if (!taken[c]) line[c] = null;
+  lines.push(line);
+});
+return [table, {headers: headers, rows: lines, spans: spans, pending: pending, total: body.length}];
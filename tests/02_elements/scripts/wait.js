@@ -0,0 +1,42 @@
+/* pyasli:wait */
+<library>
+var __isShown = <selenium isDisplayed.js>;
+var __preds = [function (el) { return (el !== null && __isShown(el)); },
+function (el) { return (el !== null && (__isShown(el)) && (__enabled(el))); },
+function (el) { return (el !== null && __isShown(el)); }];
+
+var steps = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null, timer = null, interval = null;
+function check() {
+  try {
+    var nodes = __resolve(steps, null);
+    return !!__preds[__preds.length - 1](nodes.length ? nodes[0] : null);
+  } catch (e) {
+    return false;
+  }
+}
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  if (observer !== null) observer.disconnect();
+  clearTimeout(timer);
+  clearInterval(interval);
+  done(result);
+}
+function tick() {
+  if (!finished && check()) finish(true);
+}
+function frame() {
+  if (finished) return;
+  tick();
+  window.requestAnimationFrame(frame);
+}
+if (check()) {
+  finish(true);
+} else {
+  observer = new MutationObserver(tick);
+  observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  timer = setTimeout(function () { finish(check()); }, timeout * 1000);
+  interval = setInterval(tick, 100);  // rAF is paused in background tabs
+  window.requestAnimationFrame(frame);
+}
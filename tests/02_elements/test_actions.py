@@ -0,0 +1,92 @@
+"""Element interactions performed as a single actions request"""
+import time
+
+import pytest
+from selenium.webdriver import Keys
+from selenium.webdriver.common.by import By
+
+from pyasli.exceptions import FrozenPageError
+from pyasli.wait import deadline
+
+
+def _origins(actions):
+    return [action["origin"] for source in actions for action in source["actions"] if "origin" in action]
+
+
+def test_single_actions_request(fake_browser, fake_executor):
+    username, password = fake_browser.element("#username"), fake_browser.element("#password")
+    fake_browser.round_trips.clear()
+    with fake_browser.batch_actions() as batch:
+        username.hover()
+        batch.key_down(Keys.CONTROL)
+        username.click()
+        password.click()
+        batch.key_up(Keys.CONTROL)
+        assert fake_browser.round_trips == {}
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1, "actions": 1}
+    assert fake_executor.commands["script:locate"] == 1
+    sources = {source["type"] for source in fake_executor.actions[-1]}
+    assert sources == {"pointer", "key"}
+    assert len(set(map(str, _origins(fake_executor.actions[-1])))) == 2
+
+
+def test_cached_elements_not_located(fake_browser):
+    username = fake_browser.element("#username")
+    username.get_actual()
+    fake_browser.round_trips.clear()
+    with fake_browser.batch_actions():
+        username.double_click()
+        username.right_click()
+    assert fake_browser.round_trips == {"actions": 1}
+
+
+def test_clicked_elements_scrolled(fake_browser, fake_executor):
+    username, password = fake_browser.element("#username"), fake_browser.element("#password")
+    password.get_actual()
+    fake_browser.round_trips.clear()
+    with fake_browser.batch_actions():
+        username.hover()
+        password.click()
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1, "actions": 1}
+    assert fake_executor.scrolled == [fake_executor.page.find("#password")]  # cached element is scrolled too
+
+
+def test_stale_element_located_again(fake_browser, fake_executor):
+    username = fake_browser.element("#username")
+    username.get_actual()
+    fake_executor.page.rerender(fake_executor.page.find("#username"))
+    with fake_browser.batch_actions():
+        username.click()
+    assert fake_executor.commands["script:locate"] == 2  # stale element passed to be scrolled is found again
+    assert fake_executor.commands["actions"] == 1
+
+
+def test_nothing_performed_on_error(fake_browser):
+    with pytest.raises(ValueError), fake_browser.batch_actions():  # noqa: PT012
+        fake_browser.element("#username").click()
+        raise ValueError
+    assert fake_browser.action_batch is None
+    assert fake_browser.round_trips["actions"] == 0
+
+
+def test_nested_blocks(fake_browser):
+    with fake_browser.batch_actions() as batch:
+        with fake_browser.batch_actions() as inner:
+            assert inner is batch
+            fake_browser.element("#username").click()
+        assert len(batch) == 1
+    assert fake_browser.round_trips["actions"] == 1
+
+
+def test_frozen_page(fake_browser):
+    with fake_browser.frozen(), pytest.raises(FrozenPageError), fake_browser.batch_actions():
+        fake_browser.element("#username").click()
+
+
+def test_unresolvable_element_waited(fake_browser):
+    link = fake_browser.element((By.LINK_TEXT, "Nowhere"))  # link text can't be resolved by script
+    start = time.monotonic()
+    with pytest.raises(TimeoutError), deadline(0.3), fake_browser.batch_actions():
+        link.click()
+    assert time.monotonic() - start >= 0.3
+    assert fake_browser.round_trips["actions"] == 0
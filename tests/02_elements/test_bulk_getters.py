@@ -0,0 +1,41 @@
+"""Getting values of all collection elements in a single round trip"""
+from pyasli.elements.snapshots import ElementState, Rect
+from tests.conftest import fake_page
+
+
+@fake_page("/table/1000")
+def test_texts(fake_browser):
+    fake_browser.round_trips.clear()
+    texts = fake_browser.element("#table").elements("tr.row").texts()
+    assert texts == [f"cell {i}" for i in range(1000)]
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1}
+
+
+@fake_page("/table/10")
+def test_attributes(fake_browser):
+    rows = fake_browser.elements("tr.row")
+    assert rows[2:5].attributes("id") == ["row-2", "row-3", "row-4"]
+    assert rows.attributes("missing") == [None] * 10
+
+
+def test_states_and_rects(fake_browser):
+    inputs = fake_browser.elements("#login input")
+    assert inputs.states() == [ElementState(visible=True, enabled=True, selected=False)] * 2
+    assert inputs.rects() == [Rect(0, 0, 10, 10)] * 2
+
+
+@fake_page("/table/10")
+def test_not_compilable_chain(fake_browser):
+    odd = fake_browser.elements("tr.row").filter(lambda row: int(row.id[4:]) % 2)
+    assert odd.texts() == ["cell 1", "cell 3", "cell 5", "cell 7", "cell 9"]
+    assert fake_browser.elements("tr.missing").filter(lambda row: True).texts() == []
+
+
+@fake_page("/table/10")
+def test_cached_collection(fake_browser, fake_executor):
+    rows = fake_browser.elements("tr.row")
+    rows.get_actual()
+    fake_executor.page.rerender(fake_executor.page.find("#row-0"))
+    assert rows.texts()[0] == "cell 0"
+    assert fake_executor.commands["script:texts"] == 2  # stale cache is dropped and elements are found in browser
+    assert fake_executor.commands["findElements"] == 1
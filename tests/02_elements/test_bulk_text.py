@@ -0,0 +1,24 @@
+"""Setting large texts by script"""
+
+
+def test_short_text_typed(fake_browser, fake_executor):
+    fake_browser.element("#username").text = "tomsmith"
+    assert fake_browser.round_trips["sendKeysToElement"] == 1
+    assert fake_executor.page.find("#username").attributes["value"] == "tomsmith"
+
+
+def test_long_text_by_script(fake_browser, fake_executor):
+    fake_browser.bulk_text_chunk = 1000
+    payload = "x" * 2500
+    fake_browser.element("#username").text = payload
+    assert fake_executor.commands["script:entry"] == 3
+    assert "sendKeysToElement" not in fake_executor.commands
+    assert fake_executor.page.find("#username").attributes["value"] == payload
+
+
+def test_forced_mode(fake_browser, fake_executor):
+    username = fake_browser.element("#username")
+    username.set_text("", typed=False)
+    username.set_text("x" * 2000, typed=True)
+    assert fake_executor.commands["script:entry"] == 1
+    assert fake_executor.commands["sendKeysToElement"] == 1
@@ -0,0 +1,55 @@
+"""Resolving locator chains with single script"""
+_SEARCHES = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+
+def _searches(browser):
+    return sum(browser.round_trips[command] for command in _SEARCHES)
+
+
+def test_deep_chain(fake_browser):
+    fake_browser.round_trips.clear()
+    inputs = fake_browser.element("#content").element("#login").elements("div.row").elements("input")
+    assert len(inputs) == 2
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1}
+
+
+def test_parent_and_relatives(fake_browser):
+    username = fake_browser.element("#login").element("#username")
+    fake_browser.round_trips.clear()
+    assert username.parent.get_attribute("class") == "row"
+    assert len(username.neighbours()) == 2
+    assert [ancestor.tag_name for ancestor in username.ancestors()] == ["html", "body", "div", "form", "div"]
+    # `parent` and `ancestors()` are single searches in found `username`,
+    # `neighbours()` are searched in found `parent`, which handle is shared with one of `neighbours()` chain
+    assert _searches(fake_browser) == 3
+
+
+def test_chain_from_cached_ancestor(fake_browser, fake_executor):
+    login = fake_browser.element("#login")
+    login.get_actual()
+    fake_executor.page.find("#login").attributes["id"] = "renamed"  # can be found only by cached element
+    fake_browser.round_trips.clear()
+    assert login.element("div.row").element("label").text == "Username"
+    assert _searches(fake_browser) == 0
+
+
+def test_chain_from_stale_ancestor(fake_browser, fake_executor):
+    login = fake_browser.element("#login")
+    login.get_actual()
+    fake_executor.page.rerender(fake_executor.page.find("#login"))
+    assert login.element("div.row").element("input").get_attribute("name") == "username"
+
+
+def test_flattening_disabled(fake_browser):
+    fake_browser.flatten_chains = False
+    fake_browser.round_trips.clear()
+    assert len(fake_browser.element("#login").elements("div.row").elements("input")) == 2
+    assert _searches(fake_browser) == 4
+    assert "w3cExecuteScript" not in fake_browser.round_trips
+
+
+def test_not_mergeable_chain(fake_browser, fake_executor):
+    inputs = fake_browser.element("#login").elements("div.row").filter(lambda row: True).elements("input")
+    assert len(inputs) == 2
+    assert fake_executor.commands["script:resolve"] == 1  # only rows are found by script, inputs searched in each
+    assert fake_executor.commands["findChildElements"] == 2
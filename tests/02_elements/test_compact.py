@@ -0,0 +1,22 @@
+"""Compact element and locator objects"""
+import copy
+
+import pytest
+
+from pyasli.conditions import visible
+
+
+def test_no_instance_dict(fake_browser):
+    rows = fake_browser.elements("div.row")
+    for obj in (rows, rows[0], rows[0].element("input"), rows[:1], rows.filter(visible), rows.find(visible)):
+        assert not hasattr(obj, "__dict__")
+        assert not hasattr(obj.locator, "__dict__")
+
+
+def test_attribute_fallback(fake_browser):
+    username = fake_browser.element("#username")
+    fake_browser.round_trips.clear()
+    with pytest.raises(AttributeError):
+        _ = username.__deepcopy__
+    assert copy.copy(username).name == "username"
+    assert fake_browser.round_trips == {"findElement": 1, "w3cExecuteScript": 1}  # no lookups for `__deepcopy__`
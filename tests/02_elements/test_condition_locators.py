@@ -0,0 +1,31 @@
+"""Filtering collections by built-in conditions inside the browser"""
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from pyasli.conditions import clickable, enabled, hidden, visible
+
+
+def test_filter_single_round_trip(fake_browser):
+    fake_browser.round_trips.clear()
+    shown = fake_browser.element("#login").elements("div").filter(visible)
+    assert [element.get_attribute("class") for element in shown] == ["row", "row"]
+    assert fake_browser.round_trips["w3cExecuteScript"] == 3  # filter script and 2 attribute reads
+    assert "findChildElements" not in fake_browser.round_trips
+
+
+def test_find_single_round_trip(fake_browser):
+    fake_browser.round_trips.clear()
+    assert fake_browser.elements("#login div").find(hidden).id == "hidden"
+    assert fake_browser.round_trips["w3cExecuteScript"] == 2
+    assert "findElements" not in fake_browser.round_trips
+
+
+def test_find_missing(fake_browser):
+    with pytest.raises(NoSuchElementException):
+        fake_browser.elements("#login label").find(hidden).get_actual()
+
+
+def test_filter_after_python_filter(fake_browser):
+    controls = fake_browser.elements("#login *").filter(lambda element: element.tag_name in ("input", "button"))
+    assert len(controls.filter(clickable)) == 3
+    assert controls.filter(enabled).find(visible).id == "username"
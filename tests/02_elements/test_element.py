@@ -4,7 +4,7 @@ import pytest
 
 from pyasli.browsers import BrowserSession
 from pyasli.bys import by_css
-from pyasli.conditions import exist, hidden, text_is, visible
+from pyasli.conditions import and_, exist, have_text, hidden, missing, text_is, visible
 from pyasli.elements.elements import Element
 
 
@@ -192,3 +192,107 @@ def test_element_move_to(browser):
     browser.open("/large")
     table = browser.element("#large-table")
     table.move_to()
+
+
+def test_snapshot(browser):
+    browser.open("/login")
+    username = browser.element("#username")
+    snapshot = username.snapshot(["name", "type"])
+    assert snapshot.tag_name == username.get_actual().tag_name
+    assert snapshot.visible is username.get_actual().is_displayed()
+    assert snapshot.enabled
+    assert snapshot.size == username.get_actual().size
+    assert snapshot.attributes == {"name": "username", "type": "text"}
+    assert browser.element("h2").snapshot().text == browser.element("h2").text
+
+
+def test_lookup_cache(browser):
+    browser.open("/dynamic_controls")
+    browser.cache_lookups = True
+    try:
+        checkbox = browser.element("#checkbox-example").element("#checkbox")
+        checkbox.should(exist)
+        hits = browser.events["lookup_cache_hit"]
+        checkbox.should(exist)
+        assert browser.events["lookup_cache_hit"] == hits + 1
+        browser.element("#checkbox-example button").click()
+        checkbox.should(missing, timeout=10)
+    finally:
+        browser.cache_lookups = False
+
+
+def test_table(browser):
+    browser.open("/tables")
+    table = browser.element("#table1").table()
+    assert table.headers == tuple(browser.elements("#table1 thead th").texts())
+    assert len(table.rows) == len(browser.elements("#table1 tbody tr"))
+    assert table.column("Last Name") == tuple(browser.elements("#table1 tbody td:nth-child(1)").texts())
+    assert table.spans == ()
+
+
+def test_fill(browser):
+    browser.open("/login")
+    browser.fill({"#username": "tomsmith", "#password": "SuperSecretPassword!"})
+    assert browser.element("#username").get_attribute("value") == "tomsmith"
+    assert browser.element("#password").get_attribute("value") == "SuperSecretPassword!"
+    browser.open("/checkboxes")
+    browser.element("#checkboxes").fill_form({"input:nth-of-type(1)": True, "input:nth-of-type(2)": False})
+    assert browser.element("#checkboxes input:nth-of-type(1)").selected
+    assert not browser.element("#checkboxes input:nth-of-type(2)").selected
+    browser.open("/dropdown")
+    browser.fill({"#dropdown": "Option 2"})
+    assert browser.element("#dropdown option:checked").text == "Option 2"
+
+
+def test_text_set_by_script(browser):
+    browser.open("/login")
+    browser.bulk_text_threshold, browser.bulk_text_chunk = 10, 16
+    try:
+        username = browser.element("#username")
+        username.text = "tomsmith" * 8
+        assert username.get_attribute("value") == "tomsmith" * 8
+        username.text = "short"  # typed
+        assert username.get_attribute("value") == "short"
+    finally:
+        del browser.bulk_text_threshold, browser.bulk_text_chunk  # back to class defaults
+
+
+def test_text_conditions_match_element_text(browser):
+    browser.open("/login")
+    heading = browser.element("h2")
+    browser.get_actual().execute_script(
+        "arguments[0].innerHTML = 'Login&nbsp;Page <br>   second  \\n  line  '", heading.get_actual(),
+    )
+    text = heading.text
+    for condition in (text_is(text), have_text(text[3:])):
+        heading.should(and_(visible, condition), timeout=1, in_browser=True)
+        assert len(browser.elements("h2").filter(and_(visible, condition))) == 1
+
+
+def test_batch_actions(browser):
+    browser.open("/checkboxes")
+    boxes = [browser.element("#checkboxes input:nth-of-type(1)"), browser.element("#checkboxes input:nth-of-type(2)")]
+    before = [box.selected for box in boxes]
+    for box in boxes:
+        box.__cached__ = None  # elements are found by locate script
+    actions = browser.round_trips["actions"]
+    with browser.batch_actions():
+        for box in boxes:
+            box.click()
+    assert browser.round_trips["actions"] == actions + 1
+    assert [box.selected for box in boxes] == [not selected for selected in before]
+
+
+def test_batch_actions_offscreen(browser):
+    browser.open("/checkboxes")
+    box = browser.element("#checkboxes input:nth-of-type(1)")
+    browser.get_actual().execute_script(
+        "arguments[0].parentNode.insertBefore(document.createElement('div'), arguments[0]).style.height = '5000px'",
+        browser.element("#checkboxes").get_actual(),
+    )
+    before = box.selected
+    box.__cached__ = None  # element is found and scrolled by locate script
+    with browser.batch_actions():
+        box.move_to()
+        box.click()
+    assert box.selected is not before
@@ -3,6 +3,7 @@ import pytest
 from selenium.common.exceptions import NoSuchElementException
 
 from pyasli.browsers import BrowserSession
+from pyasli.conditions import hidden, visible
 from pyasli.elements.elements import Element, ElementCollection
 
 
@@ -104,3 +105,34 @@ def test_negative_find(browser):
     nothing = form_elements.find(lambda e: False)  # dead filter
     with pytest.raises(NoSuchElementException):
         nothing.get_actual()
+
+
+def test_collection_texts(browser):
+    browser.open("/")
+    refs = browser.elements("#content ul > li")
+    assert refs[1:3].texts() == [ref.text for ref in refs[1:3]]
+    assert refs.attributes("class") == [None] * len(refs)
+    assert all(state.visible and state.enabled for state in refs.states())
+
+
+def test_collections_filter_in_browser(browser):
+    browser.open("/dynamic_loading/1")
+    divs = browser.elements("div.example > div")
+    assert len(divs.filter(hidden)) == len(divs.filter(lambda e: not e.visible))
+    assert divs.find(visible).id == "start"
+
+
+def test_collection_stream(browser):
+    browser.open("/")
+    links = browser.elements("#content ul > li a")
+    rows = list(links.stream(("text", "state"), size=10))
+    assert [row["text"] for row in rows] == links.texts()
+    assert all(row["state"].visible for row in rows)
+    assert sum(len(chunk) for chunk in links.iter_chunks(size=10)) == len(rows)
+
+
+def test_collection_scroll_through(browser):
+    browser.open("/")
+    links = browser.elements("#content ul > li a")
+    items = list(links.scroll_through(key="href", limit=5, timeout=0.5))
+    assert [item.text for item in items] == links.texts()[:5]
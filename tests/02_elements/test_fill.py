@@ -0,0 +1,58 @@
+"""Filling forms with a single script"""
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from tests.conftest import fake_page
+
+
+@pytest.fixture
+def form(fake_browser):
+    return fake_browser.element("#settings")
+
+
+def test_fill(fake_browser, fake_executor):
+    fake_browser.round_trips.clear()
+    fake_browser.fill({"#username": "tomsmith", "#password": 12345})
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1}
+    assert fake_executor.page.find("#username").attributes["value"] == "tomsmith"
+    assert fake_executor.page.find("#password").attributes["value"] == "12345"
+
+
+@fake_page("/form")
+def test_fill_form(form, fake_executor):
+    page = fake_executor.page
+    form.fill_form({"#nickname": "tom", "#news": False, "#light": "dark", "#language": "Deutsch"})
+    assert page.find("#nickname").attributes["value"] == "tom"
+    assert "checked" not in page.find("#news").attributes
+    assert "checked" in page.find("#dark").attributes
+    assert "selected" in page.find("option[value=\"de\"]").attributes
+    assert "selected" not in page.find("option[value=\"en\"]").attributes
+
+
+def test_typed_fields(fake_browser, fake_executor):
+    fake_browser.fill({"#username": "tomsmith", "#password": "secret"}, typed=["#password"])
+    assert fake_executor.commands["script:fill"] == 1
+    assert fake_executor.commands["sendKeysToElement"] == 1
+    assert fake_executor.page.find("#password").attributes["value"] == "secret"
+
+
+@fake_page("/form")
+@pytest.mark.parametrize("value", ["purple", None])
+def test_unknown_radio_value(form, fake_executor, value):
+    with pytest.raises(NoSuchElementException, match="light"):
+        form.fill_form({"#light": value})
+    assert "checked" in fake_executor.page.find("#light").attributes
+    assert "checked" not in fake_executor.page.find("#dark").attributes
+
+
+@fake_page("/form")
+def test_typed_checkbox_and_empty_field(form, fake_executor):
+    page = fake_executor.page
+    page.find("#nickname").attributes["value"] = "tom"
+    form.fill_form({"#news": False, "#dark": True, "#light": True, "#nickname": None},
+                   typed=["#news", "#dark", "#light", "#nickname"])
+    assert page.find("#news").clicks == 1
+    assert page.find("#dark").clicks == 1
+    assert page.find("#light").clicks == 0  # already checked
+    assert page.find("#nickname").attributes["value"] == ""
+    assert "sendKeysToElement" not in fake_executor.commands
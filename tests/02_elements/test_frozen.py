@@ -0,0 +1,56 @@
+"""Read-only blocks served from memory"""
+import pytest
+
+from pyasli.conditions import hidden, visible
+from pyasli.exceptions import FrozenPageError
+
+
+def test_reads_served_from_memory(fake_browser):
+    with fake_browser.frozen():
+        assert fake_browser.element("#username").name == "username"
+        fake_browser.round_trips.clear()
+        for _ in range(3):
+            username = fake_browser.element("#username")
+            username.should(visible)
+            assert username.name == "username"
+            assert username.visible
+            assert fake_browser.element("#hidden").text == ""
+        # visibility of `#username`, `#hidden` lookup and text are read once
+        assert fake_browser.round_trips == {"w3cExecuteScript": 1, "findElement": 1, "getElementText": 1}
+
+
+def test_released_on_exit(fake_browser):
+    username = fake_browser.element("#username")
+    with fake_browser.frozen():
+        assert username.tag_name == "input"
+        assert username.__cached__ is not None
+    assert username.__cached__ is None
+    assert fake_browser.frozen_state is None
+    fake_browser.round_trips.clear()
+    assert username.tag_name == "input"
+    assert fake_browser.round_trips == {"findElement": 1, "getElementTagName": 1}
+
+
+def test_nested_blocks(fake_browser):
+    with fake_browser.frozen():
+        state = fake_browser.frozen_state
+        with fake_browser.frozen():
+            assert fake_browser.frozen_state is state
+        assert fake_browser.frozen_state is state
+
+
+def test_waits_check_once(fake_browser):
+    with fake_browser.frozen(), pytest.raises(AssertionError):
+        fake_browser.element("#username").should(hidden, timeout=10)
+
+
+@pytest.mark.parametrize("action", [
+    lambda browser: browser.element("#username").click(),
+    lambda browser: browser.element("#username").clear(),
+    lambda browser: setattr(browser.element("#username"), "text", "user"),
+    lambda browser: browser.open("/table/3"),
+])
+def test_page_changing_actions(fake_browser, fake_executor, action):
+    with fake_browser.frozen(), pytest.raises(FrozenPageError):
+        action(fake_browser)
+    assert fake_executor.commands["clickElement"] == 0
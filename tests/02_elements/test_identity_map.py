@@ -0,0 +1,38 @@
+"""Sharing found web elements between wrappers of equal locators"""
+import gc
+
+from pyasli.bys import by_css
+
+
+def test_equal_locators_share_handle(fake_browser):
+    first = fake_browser.element("#login").element("#username")
+    first.get_actual()
+    fake_browser.round_trips.clear()
+    second = fake_browser.element("#login").element(by_css("#username"))
+    assert second.__cached__ is first.__cached__
+    second.__cached__ = None  # invalidated together
+    assert first.__cached__ is None
+    assert fake_browser.elements("#login input").__cached__ is None  # collections are not shared with elements
+    assert fake_browser.round_trips == {}
+
+
+def test_sharing_disabled(fake_browser):
+    fake_browser.share_handles = False
+    first = fake_browser.element("#username")
+    first.get_actual()
+    assert fake_browser.element("#username").__cached__ is None
+    assert len(fake_browser.identity_map) == 0
+
+
+def test_idle_wrappers_collected(fake_browser):
+    fake_browser.element("#username").get_actual()
+    gc.collect()
+    assert len(fake_browser.identity_map) == 0
+
+
+def test_cleared_on_navigation(fake_browser):
+    username = fake_browser.element("#username")
+    username.get_actual()
+    fake_browser.open("/login")
+    assert username.__cached__ is None
+    assert username.tag_name == "input"
@@ -0,0 +1,55 @@
+"""Selecting collection elements by index and slice inside the browser"""
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from tests.conftest import fake_page
+
+pytestmark = fake_page("/table/1000")
+
+
+@pytest.fixture
+def rows(fake_browser):
+    return fake_browser.elements("tr.row")
+
+
+def test_no_eager_length(rows):
+    rows.browser.round_trips.clear()
+    _ = rows[5000], rows[10:20]
+    assert not rows.browser.round_trips
+
+
+@pytest.mark.parametrize(("index", "row_id"), [(0, "row-0"), (999, "row-999"), (-1, "row-999"), (-1000, "row-0")])
+def test_index(rows, fake_executor, index, row_id):
+    fake_executor.found = 0
+    assert rows[index].get_actual().get_attribute("id") == row_id
+    assert fake_executor.found == 1  # only selected element reference is returned
+
+
+@pytest.mark.parametrize("index", [1000, -1001])
+def test_index_out_of_range(rows, index):
+    with pytest.raises(NoSuchElementException):
+        rows[index].get_actual()
+
+
+@pytest.mark.parametrize(("sub", "expected"), [
+    (slice(995, None), ["row-995", "row-996", "row-997", "row-998", "row-999"]),
+    (slice(None, None, -400), ["row-999", "row-599", "row-199"]),
+    (slice(-3, -1), ["row-997", "row-998"]),
+    (slice(2000, None), []),
+])
+def test_slice(rows, fake_executor, sub, expected):
+    fake_executor.found = 0
+    assert rows[sub].attributes("id") == expected
+    assert [element.get_attribute("id") for element in rows[sub].get_actual()] == expected
+    assert fake_executor.found == len(expected)
+
+
+def test_nested_selection(rows):
+    assert rows[10:20][::-1][0].get_actual().get_attribute("id") == "row-19"
+
+
+def test_not_pushed_down(rows):
+    odd = rows[:10].filter(lambda row: int(row.id[4:]) % 2)
+    assert odd[-1].id == "row-9"
+    with pytest.raises(NoSuchElementException):
+        odd[5].get_actual()
@@ -0,0 +1,41 @@
+"""Collection iteration resolves collection only once"""
+import pytest
+
+from tests.conftest import fake_page
+
+_LOOKUPS = ("findElement", "findElements", "findChildElement", "findChildElements", "script:resolve")
+
+
+def _lookups(executor):
+    return sum(executor.commands[command] for command in _LOOKUPS)
+
+
+@pytest.mark.parametrize(("fake_browser", "size"), [(f"/table/{size}", size) for size in (10, 100, 1000)],
+                         indirect=["fake_browser"])
+def test_iteration_lookups(fake_browser, fake_executor, size):
+    rows = fake_browser.element("#table").elements("tr.row")
+    before = _lookups(fake_executor)
+    assert [row.text for row in rows] == [f"cell {i}" for i in range(size)]
+    assert _lookups(fake_executor) - before == 1
+
+
+@fake_page("/table/100")
+def test_filter_lookups(fake_browser, fake_executor):
+    rows = fake_browser.elements("tr.row")
+    before = _lookups(fake_executor)
+    assert len(rows.filter(lambda row: row.visible)) == 100
+    assert rows.find(lambda row: row.text == "cell 42").id == "row-42"
+    assert _lookups(fake_executor) - before == 2
+
+
+@fake_page("/table/10")
+def test_stale_element_found_again(fake_browser, fake_executor):
+    rows = list(fake_browser.elements("tr.row"))
+    fake_executor.page.rerender(fake_executor.page.find("#row-3"))
+    assert rows[3].text == "cell 3"
+    assert rows[4].text == "cell 4"
+
+
+@fake_page("/table/3")
+def test_reversed(fake_browser):
+    assert [row.id for row in reversed(fake_browser.elements("tr.row"))] == ["row-2", "row-1", "row-0"]
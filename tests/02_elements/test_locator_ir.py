@@ -0,0 +1,43 @@
+"""Immutable representation of locator chains"""
+import pickle
+
+from pyasli.conditions import visible
+from pyasli.elements.locator_ir import LocatorIR
+
+
+def _my_cond(element):
+    return bool(element)
+
+
+def test_description(fake_browser):
+    rows = fake_browser.element("#login").elements("div.row")
+    assert str(rows[1:3].filter(_my_cond)[0].locator.ir) == (
+        "Remote -> ('css selector', '#login') -> [('css selector', 'div.row')][1:3].filter(_my_cond)[0]"
+    )
+    assert repr(rows.find(visible)) == "Element by: Remote -> ('css selector', '#login') -> " \
+                                       "[('css selector', 'div.row')].find(visible)"
+    even = rows[::2]
+    ir = even.locator.ir
+    assert ir.description is ir.description
+    assert even.locator.ir is ir  # built once per locator
+
+
+def test_equal_chains(fake_browser):
+    first = fake_browser.elements("div.row").filter(visible)[1].locator.ir
+    second = fake_browser.elements("div.row").filter(visible)[1].locator.ir
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != fake_browser.elements("div.row").filter(visible)[0].locator.ir
+    assert len({first, second}) == 1
+
+
+def test_pickling(fake_browser):
+    ir = fake_browser.elements("div.row").find(visible).element("input").locator.ir
+    restored = pickle.loads(pickle.dumps(ir))  # noqa: S301
+    assert restored == ir
+    assert restored.description == ir.description
+
+
+def test_then():
+    root = LocatorIR("browser", ("Firefox",))
+    assert str(root.then("findAll", ("xpath", "//li")).then("index", -1)) == "Firefox -> [('xpath', '//li')][-1]"
@@ -0,0 +1,47 @@
+"""Lookups cached while DOM is not changed"""
+import pytest
+
+from pyasli.conditions import visible
+
+
+@pytest.fixture
+def caching_browser(fake_browser):
+    fake_browser.cache_lookups = True
+    return fake_browser
+
+
+def test_lookup_reused(caching_browser, fake_executor):
+    assert caching_browser.element("#login").elements("input")[1].get_attribute("name") == "password"
+    fake_executor.found = 0
+    assert caching_browser.element("#login").elements("input")[1].get_attribute("name") == "password"
+    assert fake_executor.found == 0  # no element references are sent
+    assert caching_browser.events["lookup_cache_hit"] == 1  # existence check, action uses found element
+    assert "findElement" not in caching_browser.round_trips
+
+
+def test_invalidated_on_mutation(caching_browser, fake_executor):
+    username = caching_browser.element("#username")
+    username.text = "user"
+    fake_executor.page.rerender(fake_executor.page.find("#login"))
+    assert caching_browser.element("#username").value == "user"
+    assert caching_browser.events["lookup_cache_miss"] >= 2
+
+
+def test_invalidated_on_open(caching_browser):
+    caching_browser.elements("input").get_actual()
+    caching_browser.open("/table/3")
+    assert caching_browser.elements("tr.row").texts() == ["cell 0", "cell 1", "cell 2"]
+    assert caching_browser.events["lookup_cache_hit"] == 0
+
+
+def test_disabled_by_default(fake_browser):
+    _ = fake_browser.element("#username").tag_name
+    assert fake_browser.round_trips["findElement"] == 1
+    assert "lookup_cache_miss" not in fake_browser.events
+
+
+def test_predicates_not_cached(caching_browser, fake_executor):
+    assert len(caching_browser.elements("#login div").filter(visible)) == 2
+    fake_executor.page.find("#hidden").displayed = True  # e.g. shown on hover, no DOM mutation
+    assert len(caching_browser.elements("#login div").filter(visible)) == 3
+    assert caching_browser.events["lookup_cache_hit"] == 0
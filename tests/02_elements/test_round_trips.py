@@ -0,0 +1,76 @@
+"""WebDriver round trips made by element actions"""
+import pytest
+
+from pyasli.browsers.browser_session import BrowserSession
+from pyasli.conditions import exist, visible
+
+
+@pytest.fixture
+def trusting_browser(fake_browser):
+    fake_browser.trust_cache = True
+    return fake_browser
+
+
+def test_round_trips_counted(fake_browser):
+    fake_browser.round_trips.clear()
+    assert fake_browser.element("#username").tag_name == "input"
+    assert fake_browser.round_trips == {"findElement": 1, "getElementTagName": 1}
+
+
+def test_driver_set_again_counted_once(fake_browser):
+    driver = fake_browser.get_actual()
+    with pytest.warns(DeprecationWarning):
+        fake_browser.set_driver(driver)
+    fake_browser.round_trips.clear()
+    assert fake_browser.element("#username").tag_name == "input"
+    assert fake_browser.round_trips == {"findElement": 1, "getElementTagName": 1}
+
+
+def test_driver_counted_by_last_session(fake_browser):
+    other = BrowserSession(log_level=None)
+    with pytest.warns(DeprecationWarning):
+        other.set_driver(fake_browser.get_actual())
+    fake_browser.round_trips.clear()
+    assert other.element("#username").tag_name == "input"
+    assert other.round_trips == {"findElement": 1, "getElementTagName": 1}
+    assert not fake_browser.round_trips
+
+
+def test_existence_checked_by_default(fake_browser):
+    username = fake_browser.element("#username")
+    username.should(exist)
+    fake_browser.round_trips.clear()
+    _ = username.tag_name
+    assert fake_browser.round_trips["findElement"] == 1
+
+
+def test_trusted_cache(trusting_browser):
+    username = trusting_browser.element("#username")
+    username.should(exist)
+    trusting_browser.round_trips.clear()
+    _ = username.tag_name
+    _ = username.text
+    username.click()
+    assert trusting_browser.round_trips["findElement"] == 0
+    assert trusting_browser.events["trusted_cache_hit"] == 3
+
+
+def test_trusted_cache_stale(trusting_browser, fake_executor):
+    username = trusting_browser.element("#username")
+    username.should(exist)
+    fake_executor.page.rerender(fake_executor.page.find("#username"))
+    trusting_browser.round_trips.clear()
+    assert username.tag_name == "input"
+    assert trusting_browser.round_trips["findElement"] == 1
+    assert trusting_browser.events["trusted_cache_miss"] == 1
+
+
+def test_script_timeout_restored(fake_browser, fake_executor):
+    fake_executor.timeouts["script"] = 1000
+    fake_browser.element("#username").should(visible, timeout=2, in_browser=True)
+    assert fake_executor.commands["script:wait"] == 1
+    assert fake_executor.commands["setTimeouts"] == 2  # raised for the wait and restored
+    assert fake_executor.timeouts["script"] == 1000
+    fake_executor.timeouts["script"] = 60000
+    fake_browser.element("#username").should(visible, timeout=2, in_browser=True)
+    assert fake_executor.commands["setTimeouts"] == 2  # long enough already
@@ -0,0 +1,70 @@
+"""Text of browser scripts
+
+Offline tests run scripts with Python emulation of the fake driver, and tests against the test site run them
+in a real browser. Here scripts are checked to be valid JavaScript and compared with snapshots in ``scripts``
+directory, so every change of script text is reviewed. Snapshots are written again with
+``PYASLI_UPDATE_SNAPSHOTS=1 pytest tests/02_elements/test_scripts.py``
+"""
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from pyasli.conditions import clickable, visible
+from pyasli.elements import scripts
+
+SNAPSHOTS = os.path.join(os.path.dirname(__file__), "scripts")
+NODE = shutil.which("node")
+STEPS = (("findAll", "css", "tr"), ("slice", 1, None, 2), ("filter", visible.js), ("first", clickable.js))
+
+SCRIPTS = {
+    "wait": lambda: scripts.wait_script(STEPS, visible.js)[0],
+    "evaluate": lambda: scripts.evaluate_script(STEPS, clickable.js)[0],
+    "resolve": lambda: scripts.resolve_script(STEPS)[0],
+    "lookup": lambda: scripts.lookup_script(STEPS)[0],
+    "snapshot": lambda: scripts.snapshot_script(STEPS)[0],
+    **{column: lambda column=column: scripts.column_script(STEPS, column)[0] for column in scripts._COLUMNS},  # noqa: SLF001
+    "stream": lambda: scripts.stream_script(STEPS, ["texts", "attributes", "states"])[0],
+    "scroll": lambda: scripts.scroll_script(STEPS)[0],
+    "forget": scripts.forget_script,
+    "table": lambda: scripts.table_script(STEPS, "texts")[0],
+    "fill": lambda: scripts.fill_script(STEPS)[0],
+    "entry": scripts.entry_script,
+    "locate": lambda: scripts.locate_script([STEPS, (("find", "xpath", "./.."),)])[0],
+}
+
+
+def _snapshot_text(script: str) -> str:
+    """Script text with shared library and selenium atoms replaced by their names, they have snapshots of their own"""
+    script = script.replace(scripts._LIBRARY, "<library>")  # noqa: SLF001
+    for file_name in scripts._ATOMS.values():  # noqa: SLF001
+        script = script.replace(scripts._atom(file_name), f"<selenium {file_name}>")  # noqa: SLF001
+    return script
+
+
+def _check_snapshot(name: str, text: str):
+    path = os.path.join(SNAPSHOTS, f"{name}.js")
+    if os.getenv("PYASLI_UPDATE_SNAPSHOTS"):
+        with open(path, "w", encoding="utf8") as file:
+            file.write(text)
+    with open(path, encoding="utf8") as file:
+        assert text == file.read(), f"Script {name} differs from its snapshot"
+
+
+@pytest.mark.parametrize("name", SCRIPTS)
+def test_script_snapshot(name):
+    _check_snapshot(name, _snapshot_text(SCRIPTS[name]()))
+
+
+def test_library_snapshot():
+    _check_snapshot("library", scripts._LIBRARY)  # noqa: SLF001
+
+
+@pytest.mark.skipif(NODE is None, reason="Node.js is not installed")
+@pytest.mark.parametrize("name", SCRIPTS)
+def test_valid_javascript(name, tmp_path):
+    path = tmp_path / f"{name}.js"
+    path.write_text(f"function script() {{\n{SCRIPTS[name]()}\n}}\n", encoding="utf8")  # scripts are function bodies
+    result = subprocess.run([NODE, "--check", str(path)], capture_output=True, text=True, check=False)  # noqa: S603
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,50 @@
+"""Iterating over virtualised lists"""
+import pytest
+
+from tests.conftest import fake_page
+
+pytestmark = fake_page("/virtual")
+
+
+@pytest.fixture
+def items(fake_browser):
+    return fake_browser.element("#list").elements("div.item")
+
+
+def test_all_items(items, fake_executor):
+    seen = [(item.get_attribute("data-id"), item.text) for item in items.scroll_through(key="data-id", timeout=0)]
+    assert seen == [(str(i), f"item {i}") for i in range(95)]
+    assert fake_executor.commands["script:scroll"] == 6  # 5 windows with new items and the last one without
+    assert fake_executor.found == 95  # only new items are transferred
+
+
+def test_limit(items, fake_executor):
+    found = list(items.scroll_through(key="data-id", limit=30, timeout=0))
+    assert len(found) == 30
+    assert repr(found[-1]).endswith(".find(data-id='29')")
+    assert fake_executor.commands["script:scroll"] == 2
+
+
+def test_items_without_key(items):
+    assert list(items.scroll_through(key="data-missing", timeout=0)) == []
+
+
+def test_no_scroll_after_limit(items, fake_executor):
+    found = list(items.scroll_through(key="data-id", limit=20, timeout=0))
+    assert len(found) == 20
+    assert fake_executor.commands["script:scroll"] == 1
+    assert fake_executor.actions == []  # the last item is not scrolled to when the limit is reached
+
+
+@pytest.mark.parametrize("limit", [None, 5])
+def test_seen_items_forgotten(items, fake_executor, limit):
+    assert list(items.scroll_through(key="data-id", limit=limit, timeout=0))
+    assert fake_executor.page.seen == {}
+
+
+def test_seen_items_forgotten_on_close(items, fake_executor):
+    iterator = items.scroll_through(key="data-id", timeout=0)
+    next(iterator)
+    assert fake_executor.page.seen
+    iterator.close()
+    assert fake_executor.page.seen == {}
@@ -0,0 +1,66 @@
+"""Element state snapshots"""
+import pytest
+
+from pyasli.conditions import visible
+
+
+def test_snapshot_single_round_trip(fake_browser):
+    fake_browser.round_trips.clear()
+    snapshot = fake_browser.element("#login").element("#username").snapshot(["name"])
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1}
+    assert snapshot.tag_name == "input"
+    assert snapshot.visible
+    assert snapshot.enabled
+    assert snapshot.attributes == {"name": "username"}
+    assert snapshot.get_attribute("value") is None
+
+
+def test_snapshot_immutable(fake_browser):
+    snapshot = fake_browser.element("#username").snapshot(["name"])
+    with pytest.raises(AttributeError):
+        snapshot.text = "changed"
+    with pytest.raises(TypeError):
+        snapshot.attributes["name"] = "changed"
+
+
+def test_properties_read_fresh_snapshot(fake_browser):
+    hidden = fake_browser.element("#hidden")
+    hidden.snapshot(["id"])
+    fake_browser.round_trips.clear()
+    assert not hidden.visible
+    assert hidden.id == "hidden"
+    assert sum(fake_browser.round_trips.values()) == 0
+
+
+def test_text_not_read_from_snapshot(fake_browser):
+    username = fake_browser.element("#username")
+    username.snapshot()
+    fake_browser.round_trips.clear()
+    assert username.text == ""
+    assert fake_browser.round_trips["getElementText"] == 1
+
+
+def test_snapshot_outdated(fake_browser):
+    username = fake_browser.element("#username")
+    username.snapshot()
+    username.text = "user"
+    fake_browser.round_trips.clear()
+    assert username.value == "user"
+    assert fake_browser.round_trips["w3cExecuteScript"] == 1  # getAttribute atom
+
+
+def test_snapshot_expired(fake_browser):
+    fake_browser.snapshot_ttl = 0
+    username = fake_browser.element("#username")
+    username.snapshot()
+    fake_browser.round_trips.clear()
+    username.should(visible)
+    assert fake_browser.round_trips["w3cExecuteScript"] == 1  # isDisplayed atom
+
+
+def test_snapshot_uses_cache(fake_browser, fake_executor):
+    username = fake_browser.element("#username")
+    username.get_actual()
+    username.snapshot()
+    assert fake_executor.commands["findElement"] == 1
+
@@ -0,0 +1,41 @@
+"""Recovering from stale elements starting from the deepest valid cached ancestor"""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from tests.fake_driver import W3CError
+
+
+def test_recovers_from_deepest_valid_ancestor(fake_browser, fake_executor):
+    form = fake_browser.element("#login")
+    row = form.element("div.row")
+    username = row.element("input")
+    for searchable in (form, row, username):
+        searchable.get_actual()
+    form_actual = form.__cached__
+    fake_executor.page.rerender(fake_executor.page.find("div.row"))
+
+    fake_browser.round_trips.clear()
+    assert username.text == ""
+    assert form.__cached__ is form_actual
+    assert row.__cached__ is not None
+    # stale search in the row, the form is checked and is alive, the row and the input are found again
+    assert fake_browser.round_trips == {
+        "findChildElement": 3,
+        "getElementTagName": 1,
+        "getCurrentUrl": 1,
+        "getElementText": 1,
+    }
+    assert fake_browser.events["stale_recovery"] == 1
+    assert fake_browser.stale_recoveries == {"/login": 1}
+
+
+def test_retries_budget(fake_browser, fake_executor):
+    def _stale_text(params):
+        raise W3CError("stale element reference", f"Element {params['id']} is stale")
+
+    fake_browser.stale_retries = 2
+    fake_executor._getElementText = _stale_text  # noqa: SLF001
+    with pytest.raises(StaleElementReferenceException):
+        _ = fake_browser.element("button").text
+    assert fake_executor.commands["getElementText"] == 3
+    assert fake_browser.stale_recoveries == {"/login": 2}
@@ -0,0 +1,37 @@
+"""Browser-side locator steps tests"""
+import pytest
+from selenium.webdriver.common.by import By
+
+from pyasli.browsers import BrowserSession
+from pyasli.bys import by_xpath
+from pyasli.conditions import visible
+
+
+@pytest.fixture
+def session():
+    return BrowserSession()
+
+
+def test_single_steps(session):
+    assert session.element("#id").element(by_xpath("./..")).locator.steps() == (
+        ("find", "css", "#id"),
+        ("find", "xpath", "./.."),
+    )
+
+
+def test_collection_steps(session):
+    rows = session.elements("tr")
+    assert rows[1:5:2].filter(visible).find(visible).locator.steps() == (
+        ("findAll", "css", "tr"),
+        ("slice", 1, 5, 2),
+        ("filter", visible.js),
+        ("first", visible.js),
+    )
+
+
+def test_not_compilable_condition(session):
+    assert session.elements("tr").filter(lambda e: e.visible).element("td").locator.steps() is None
+
+
+def test_not_compilable_by(session):
+    assert session.element((By.LINK_TEXT, "Home")).locator.steps() is None
@@ -0,0 +1,53 @@
+"""Reading huge collections by chunks"""
+import pytest
+
+from pyasli.elements.snapshots import ElementState
+from tests.conftest import fake_page
+
+pytestmark = fake_page("/table/1000")
+
+
+@pytest.fixture
+def rows(fake_browser):
+    return fake_browser.element("#table").elements("tr.row")
+
+
+def test_iter_chunks(rows, fake_executor):
+    chunks = list(rows.iter_chunks(size=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    assert fake_executor.commands["script:resolve"] == 4
+    assert fake_executor.found == 1000
+    assert chunks[3][99].id == "row-999"
+    assert chunks[1][0].text == rows[300].text == "cell 300"
+
+
+def test_iter_chunks_exact_size(rows, fake_executor):
+    assert [len(chunk) for chunk in rows.iter_chunks(size=500)] == [500, 500]
+    assert fake_executor.commands["script:resolve"] == 3  # the last one finds nothing
+
+
+def test_stream(rows, fake_executor):
+    streamed = list(rows.stream(("text", "id", "state"), size=400))
+    assert len(streamed) == 1000
+    assert streamed[999] == {"text": "cell 999", "id": "row-999", "state": ElementState(True, True, False)}
+    assert fake_executor.commands["script:stream"] == 3
+    assert fake_executor.found == 0  # no element references are transferred
+
+
+def test_stream_lazily(rows, fake_executor):
+    stream = rows.stream(size=10)
+    assert next(stream) == {"text": "cell 0"}
+    assert fake_executor.commands["script:stream"] == 1
+
+
+def test_stream_python_filtered(rows, fake_executor):
+    odd = rows.filter(lambda row: int(row.id.split("-")[1]) % 2)
+    fake_executor.commands.clear()
+    ids = [row["id"] for row in odd.stream(("id",), size=100)]
+    assert ids == [f"row-{i}" for i in range(1, 1000, 2)]
+    assert fake_executor.commands["script:stream"] == 5
+
+
+def test_invalid_size(rows):
+    with pytest.raises(ValueError, match="positive"):
+        next(rows.iter_chunks(size=0))
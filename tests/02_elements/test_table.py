@@ -0,0 +1,39 @@
+"""Reading tables with a single script"""
+import pytest
+
+from pyasli.elements.tables import CellSpan, Table
+from tests.conftest import fake_page
+
+pytestmark = fake_page("/grid")
+
+
+@pytest.fixture
+def grid(fake_browser):
+    return fake_browser.element("#grid")
+
+
+def test_table(grid):
+    grid.browser.round_trips.clear()
+    table = grid.table()
+    assert table == Table(
+        headers=("Name", "Contacts", "Contacts"),
+        columns=(
+            ("Alice", "Alice", "Bob"),
+            ("alice@example.com", "alice@example.org", "none"),
+            ("123", "456", "none"),
+        ),
+        spans=(CellSpan(0, 0, 2, 1), CellSpan(2, 1, 1, 2)),
+    )
+    assert table.rows[1] == ("Alice", "alice@example.org", "456")
+    assert table.column("Name") == ("Alice", "Alice", "Bob")
+    assert grid.browser.round_trips == {"w3cExecuteScript": 1}
+
+
+def test_table_attributes(grid):
+    assert grid.table("data-id").column("Name") == ("alice", "alice", "bob")
+
+
+def test_table_rows(grid, fake_executor):
+    assert list(grid.table_rows(size=1)) == grid.table().rows  # spanned cells are carried between chunks
+    assert fake_executor.commands["script:table"] == 4
+
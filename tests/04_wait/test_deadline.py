@@ -0,0 +1,107 @@
+"""Waits limited by the deadline of outer wait and by session wait budget"""
+import asyncio
+import time
+
+import pytest
+
+from pyasli.conditions import have_text, visible
+from pyasli.exceptions import ConditionsTimeoutError
+from pyasli.wait import FixedPolling, async_poll, deadline, in_deadline, time_left, wait_all, wait_any, wait_until
+from tests.conftest import fake_page
+
+POLLING = FixedPolling(0.01)
+
+
+def _never(_):
+    return False
+
+
+def test_nested_blocks_only_shorten():
+    assert not in_deadline()
+    with deadline(0.5) as outer:
+        assert in_deadline()
+        with deadline(10) as inner:
+            assert inner <= outer <= 0.5
+        assert time_left(10) <= 0.5
+    assert time_left(10) == 10
+    assert not in_deadline()
+
+
+def test_nested_wait_uses_time_left():
+    def _nested(_):
+        return wait_until(None, _never, timeout=5, polling=POLLING)
+
+    start = time.monotonic()
+    assert not wait_until(None, _nested, timeout=0.2, polling=POLLING)
+    assert time.monotonic() - start < 1
+
+
+def test_wait_all_is_deadline():
+    deadlines = []
+
+    def _record(_):
+        deadlines.append(time_left(10))
+        return True
+
+    wait_all([(None, _record)], timeout=0.5, polling=POLLING)
+    assert deadlines[0] <= 0.5
+
+
+def test_async_poll():
+    async def _checks():
+        with deadline(0.1):
+            return [remaining async for remaining in async_poll(POLLING, timeout=5)]
+
+    start = time.monotonic()
+    checks = asyncio.run(_checks())
+    assert time.monotonic() - start < 1
+    assert checks[0] <= 0.1
+
+
+def test_nested_element_waits(fake_browser):
+    # text of missing element waits for its existence, which is limited by the outer wait
+    start = time.monotonic()
+    with pytest.raises((AssertionError, TimeoutError)):
+        fake_browser.element("#missing").should(have_text("text"), timeout=0.3, polling=POLLING)
+    assert time.monotonic() - start < 2
+
+
+def test_wait_budget(fake_browser):
+    fake_browser.wait_budget = 0.3
+    missing = fake_browser.element("#missing")
+    start = time.monotonic()
+    with pytest.raises(AssertionError, match="seconds wait budget"):
+        missing.should(visible, timeout=5, polling=POLLING)
+    with pytest.raises(AssertionError, match="0.000 seconds were left"):
+        missing.should(visible, timeout=5, polling=POLLING)
+    assert time.monotonic() - start < 2
+    assert fake_browser.waited >= 0.3
+    fake_browser.waited = 0
+    fake_browser.element("#username").should(visible, polling=POLLING)
+
+
+@fake_page("/table/3")
+def test_nested_filter_waits(fake_browser):
+    rows = fake_browser.elements("tr.row")
+    start = time.monotonic()
+    with pytest.raises((AssertionError, TimeoutError)):
+        rows.assure_all(lambda row: row.element("span.missing").text == "x", timeout=0.3, polling=POLLING)
+    assert time.monotonic() - start < 2
+
+
+@pytest.mark.parametrize("wait", [wait_all, wait_any])
+def test_wait_budget_of_pairs(fake_browser, wait):
+    fake_browser.wait_budget = 0.2
+    start = time.monotonic()
+    with pytest.raises(ConditionsTimeoutError):
+        wait([(fake_browser.element("#username"), _never)], timeout=5, polling=POLLING)
+    assert time.monotonic() - start < 1
+    assert fake_browser.waited >= 0.2
+
+
+def test_wait_budget_of_assure_all(fake_browser):
+    fake_browser.wait_budget = 0.2
+    inputs = fake_browser.elements("input")
+    with pytest.raises(TimeoutError, match=f"^{len(inputs)} elements are not matching"):
+        inputs.assure_all(_never, timeout=5, polling=POLLING)
+    assert 0.2 <= fake_browser.waited < 1
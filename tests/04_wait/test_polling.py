@@ -0,0 +1,140 @@
+"""Polling policies tests"""
+import itertools
+import time
+
+import pytest
+
+from pyasli.exceptions import ConditionsTimeoutError
+from pyasli.wait import (
+    ExponentialBackoff,
+    FixedPolling,
+    ImmediateThenBackoff,
+    JitteredPolling,
+    get_default_polling,
+    set_default_polling,
+    wait_all,
+    wait_any,
+    wait_for,
+    wait_until,
+)
+
+
+def _first(policy, count=5):
+    return list(itertools.islice(policy.delays(), count))
+
+
+def test_fixed():
+    assert _first(FixedPolling(0.1)) == [0.1] * 5
+
+
+def test_backoff():
+    assert _first(ExponentialBackoff(0.1, 2, 0.5)) == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+def test_jitter():
+    delays = _first(JitteredPolling(FixedPolling(1), 0.25), 100)
+    assert all(0.75 <= delay <= 1.25 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_immediate_then_backoff():
+    assert _first(ImmediateThenBackoff(2, FixedPolling(0.3))) == [0, 0, 0.3, 0.3, 0.3]
+
+
+@pytest.fixture
+def _reset_default():
+    default = get_default_polling()
+    yield
+    set_default_polling(default)
+
+
+class _CountingCondition:
+    __name__ = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, _):
+        self.calls += 1
+        return False
+
+
+@pytest.mark.usefixtures("_reset_default")
+def test_default_polling():
+    set_default_polling(FixedPolling(0.2))
+    condition = _CountingCondition()
+    with pytest.raises(TimeoutError):
+        wait_for(None, condition, 0.5)
+    assert condition.calls == 4  # immediately, 0.2, 0.4 and right at the deadline
+
+
+def test_per_call_polling():
+    condition = _CountingCondition()
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        wait_for(None, condition, 0.3, polling=FixedPolling(1))
+    assert time.monotonic() - start < 0.5  # sleep is limited by deadline
+    assert condition.calls == 2
+
+
+def test_custom_exception():
+    with pytest.raises(AssertionError):
+        wait_for(None, _CountingCondition(), 0, AssertionError("fail"))
+
+
+def test_wait_until():
+    assert not wait_until(None, _CountingCondition(), 0)
+    assert wait_until(_Target(1), _ready, 1, FixedPolling(0.01))
+
+
+class _Target:
+
+    def __init__(self, ready_after):
+        self.ready_after = ready_after
+        self.checks = 0
+
+    def __repr__(self):
+        return f"Target({self.ready_after})"
+
+
+def _ready(target):
+    target.checks += 1
+    return target.checks > target.ready_after
+
+
+def test_wait_all():
+    targets = [_Target(0), _Target(2), _Target(4)]
+    results = wait_all([(target, _ready) for target in targets], 1, FixedPolling(0.01))
+    assert all(result.passed for result in results)
+    assert [target.checks for target in targets] == [1, 3, 5]  # passed pairs are not checked again
+
+
+def test_wait_all_negative():
+    with pytest.raises(ConditionsTimeoutError) as exc_info:
+        wait_all([(_Target(0), _ready), (_Target(1000), _ready)], 0.1, FixedPolling(0.01))
+    passed, failed = exc_info.value.results
+    assert passed.passed
+    assert not failed.passed
+    assert "1 of 2 conditions are not reached" in str(exc_info.value)
+    assert "Target(1000): _ready is not reached" in str(exc_info.value)
+
+
+def test_wait_all_errors():
+    def _broken(_):
+        raise AssertionError("broken")
+
+    with pytest.raises(ConditionsTimeoutError) as exc_info:
+        wait_all([(_Target(0), _broken)], 0.05, FixedPolling(0.01))
+    assert isinstance(exc_info.value.results[0].error, AssertionError)
+
+
+def test_wait_any():
+    slow, fast = _Target(1000), _Target(2)
+    result = wait_any([(slow, _ready), (fast, _ready)], 1, FixedPolling(0.01))
+    assert result.target is fast
+    assert slow.checks == fast.checks == 3
+
+
+def test_wait_any_negative():
+    with pytest.raises(ConditionsTimeoutError):
+        wait_any([(_Target(1000), _ready)], 0.05, FixedPolling(0.01))
@@ -2,7 +2,7 @@ import os
 
 import pytest
 
-from pyasli.conditions import visible
+from pyasli.conditions import have_text, visible
 
 
 def test_negative_wait(browser, log_dir):
@@ -32,3 +32,23 @@ def _check_screenshot(path):
         assert len(files) == 1
         screenshot = files[0]
         assert screenshot.endswith(".png")
+
+
+def test_wait_in_browser(browser):
+    browser.open("/dynamic_loading/1")
+    browser.element("div#start > button").click()
+    finish = browser.element("div#finish")
+    finish.should(visible, timeout=10, in_browser=True)
+    finish.should(have_text("Hello World!"))
+
+
+def test_negative_wait_in_browser(browser):
+    browser.open("/disappearing_elements")
+
+    with pytest.raises(AssertionError):
+        browser.element("div#id").should_be(visible, 0.1, in_browser=True)
+
+
+def test_wait_in_browser_fallback(browser):
+    browser.open("/dynamic_loading/1")
+    browser.element("div#start > button").should(lambda e: e.visible, in_browser=True)
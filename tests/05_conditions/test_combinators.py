@@ -0,0 +1,108 @@
+"""Combined conditions checked with a single script"""
+import asyncio
+
+import pytest
+
+from pyasli.conditions import (
+    and_, clickable, enabled, have_attribute, have_css_class,
+    have_size, have_text, missing, not_, or_, text_is, visible,
+)
+from pyasli.aio.elements import check
+from pyasli.elements.scripts import predicate_of
+from pyasli.wait import wait_for
+from tests.fake_driver import add_predicate
+
+
+def _named(name):
+    def _condition(element):
+        return element.tag_name == "button"
+
+    _condition.__name__ = name
+    return _condition
+
+
+def test_names():
+    condition = not_(and_(visible, or_(have_text("a"), have_css_class("b"))))
+    assert condition.__name__ == "not (visible and (has_text 'a' or have_css_class 'b'))"
+    assert not_(clickable).__name__ == "not clickable"
+    condition = and_(not_(visible), have_attribute("type", "submit"))
+    assert condition.__name__ == "(not visible) and have_attribute 'type'='submit'"
+
+
+def test_composed_predicate():
+    assert clickable.js == and_(visible, enabled).js == "el !== null && (__isShown(el)) && (__enabled(el))"
+    assert not_(missing).js == "!(el === null)"
+    assert or_(visible, missing).js == "(el !== null && __isShown(el)) || (el === null)"
+    assert getattr(and_(visible, _named("button")), "js", None) is None
+
+
+def test_single_script_per_check(fake_browser, fake_executor):
+    condition = and_(clickable, have_css_class("radius"), have_attribute("type", "submit"))
+    add_predicate(condition, lambda node: node is not None and node.displayed and "radius" in node.attributes["class"])
+    button = fake_browser.element("button")
+    fake_browser.round_trips.clear()
+    button.should(condition)
+    assert fake_browser.round_trips == {"w3cExecuteScript": 1}
+    assert fake_executor.commands["script:evaluate"] == 1
+
+
+def test_error_message(fake_browser):
+    condition = not_(or_(visible, missing))
+    add_predicate(condition, lambda node: not (node is None or node.displayed))
+    with pytest.raises(AssertionError, match=r"Condition not \(visible or missing\) is not reached"):
+        fake_browser.element("button").should(condition, timeout=0.1)
+
+
+def test_python_conditions(fake_browser):
+    button = fake_browser.element("button")
+    assert and_(visible, _named("button"))(button)
+    assert not or_(not_(_named("button")), missing)(button)
+    assert have_attribute("type")(button)
+    assert not have_attribute("type", "reset")(button)
+    assert have_css_class("radius")(button)
+
+
+def test_have_size(fake_browser):
+    wait_for(fake_browser.elements("input"), have_size(2), timeout=0.1)
+    with pytest.raises(TimeoutError, match="have_size 3"):
+        wait_for(fake_browser.elements("input"), have_size(3), timeout=0.1)
+
+
+def test_snapshot_used(fake_browser):
+    username = fake_browser.element("#username")
+    username.snapshot()
+    fake_browser.round_trips.clear()
+    username.should(clickable)
+    assert sum(fake_browser.round_trips.values()) == 0
+
+
+@pytest.mark.parametrize("text", ["Log\u00a0in", "Log\n  in \n"])
+def test_text_conditions_use_element_text(fake_browser, fake_executor, text):
+    fake_executor.page.find("button").text = text
+    button = fake_browser.element("button")
+    for condition in (text_is(text), have_text(text[2:])):
+        assert predicate_of(condition) is None
+        assert predicate_of(and_(visible, condition)) is None  # browser text differs from WebDriver one
+        assert and_(visible, condition)(button)
+        button.should(and_(clickable, condition), timeout=0.1, in_browser=True)
+        assert len(fake_browser.elements("button").filter(and_(visible, condition))) == 1
+
+
+async def _async_false(_):
+    return False
+
+
+async def _async_true(_):
+    return True
+
+
+@pytest.mark.parametrize(("condition", "expected"), [
+    (and_(lambda _: True, _async_false), False),
+    (and_(_async_true, _async_true), True),
+    (or_(_async_false, lambda _: False), False),
+    (or_(_async_false, _async_true), True),
+    (not_(_async_false), True),
+    (not_(and_(_async_true, _async_false)), True),
+])
+def test_async_parts(condition, expected):
+    assert asyncio.run(check(condition, object())) is expected
@@ -0,0 +1,241 @@
+"""Asyncio session tests against local stub WebDriver server"""
+import asyncio
+import json
+import re
+import time
+import uuid
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from pyasli.aio import AsyncBrowserSession, AsyncElement
+from pyasli.aio.webdriver import ELEMENT_KEY
+from pyasli.conditions import exist, visible
+from pyasli.wait import FixedPolling
+
+PAGE = {  # id: (tag, parent id, classes, text)
+    "title": ("h1", None, ("header",), "Hello"),
+    "list": ("ul", None, (), ""),
+    "first": ("li", "list", ("item",), "One"),
+    "second": ("li", "list", ("item", "odd"), "Two"),
+    "third": ("li", "list", ("item",), "Three"),
+    "loading": ("div", None, (), "Loading..."),
+}
+HIDDEN_CHECKS = {"loading": 2}  # element is shown after given number of visibility checks
+
+_ID_SELECTOR = re.compile(r'^\[id="(.+)"]$')
+
+
+def _matches(element_id, selector):
+    tag, _, classes, _ = PAGE[element_id]
+    id_match = _ID_SELECTOR.match(selector)
+    if id_match:
+        return element_id == id_match.group(1)
+    if selector.startswith("#"):
+        return element_id == selector[1:]
+    if selector.startswith("."):
+        return selector[1:] in classes
+    return tag == selector
+
+
+def _is_descendant(element_id, ancestor_id):
+    parent = PAGE[element_id][1]
+    while parent is not None:
+        if parent == ancestor_id:
+            return True
+        parent = PAGE[parent][1]
+    return False
+
+
+class StubWebDriver:
+    """W3C WebDriver remote end serving static page"""
+
+    def __init__(self):
+        self.server = None
+        self.url = None
+        self.sessions = set()
+        self.visibility_checks = {}
+        self.clicks = []
+        self.requests = 0
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/wd/hub"
+        return self
+
+    async def __aexit__(self, *_):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode().split(" ", 2)
+            length = 0
+            line = await reader.readline()
+            while line not in (b"\r\n", b""):
+                name, value = line.decode().split(":", 1)
+                if name.lower() == "content-length":
+                    length = int(value)
+                line = await reader.readline()
+            body = json.loads(await reader.readexactly(length)) if length else None
+            self.requests += 1
+            status, value = self._route(method, path[len("/wd/hub"):] if path.startswith("/wd/hub") else path, body)
+            data = json.dumps({"value": value}).encode()
+            writer.write(f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+            await writer.drain()
+        writer.close()
+
+    def _route(self, method, path, body):
+        if path == "/session":
+            session_id = uuid.uuid4().hex
+            self.sessions.add(session_id)
+            return 200, {"sessionId": session_id, "capabilities": body["capabilities"]["alwaysMatch"]}
+        parts = path.strip("/").split("/")
+        if parts[1] not in self.sessions:
+            return 404, {"error": "invalid session id", "message": "No session", "stacktrace": ""}
+        command = parts[2:]
+        if not command:
+            self.sessions.discard(parts[1])
+            return 200, None
+        if command == ["url"]:
+            return 200, None if method == "POST" else "http://stub/page"
+        if command[0] in ("element", "elements") and len(command) == 1:
+            return self._find(command[0], None, body)
+        if command[0] == "element" and len(command) == 3 and command[2] in ("element", "elements"):
+            return self._find(command[2], command[1], body)
+        if command[0] == "element" and command[2] == "text":
+            return 200, PAGE[command[1]][3]
+        if command[0] == "element" and command[2] == "click":
+            self.clicks.append(command[1])
+            return 200, None
+        if command == ["execute", "sync"]:
+            return 200, self._predicate(body["script"], body["args"][0])
+        return 404, {"error": "unknown command", "message": path, "stacktrace": ""}
+
+    @staticmethod
+    def _find(word, context, body):
+        found = [
+            {ELEMENT_KEY: element_id} for element_id in PAGE
+            if _matches(element_id, body["value"]) and (context is None or _is_descendant(element_id, context))
+        ]
+        if word == "elements":
+            return 200, found
+        if not found:
+            return 404, {"error": "no such element", "message": f"No {body['value']}", "stacktrace": ""}
+        return 200, found[0]
+
+    def _predicate(self, script, element):
+        """Evaluate visibility and existence predicates"""
+        if element is None:
+            return "el === null" in script
+        if "__isShown" not in script:
+            return True
+        element_id = element[ELEMENT_KEY]
+        self.visibility_checks[element_id] = self.visibility_checks.get(element_id, 0) + 1
+        return self.visibility_checks[element_id] > HIDDEN_CHECKS.get(element_id, 0)
+
+
+def _run(test):
+    async def _with_stub():
+        async with StubWebDriver() as stub, AsyncBrowserSession(stub.url) as session:
+            await session.open("/page")
+            await test(session, stub)
+
+    asyncio.run(_with_stub())
+
+
+def test_element_text():
+    async def _test(session, _):
+        assert await session.element("h1").text == "Hello"
+        assert await session.element("#list").element(".odd").text == "Two"
+
+    _run(_test)
+
+
+def test_collection():
+    async def _test(session, _):
+        items = session.element("#list").elements("li")
+        assert await items.length() == 3
+        assert await items[-1].text == "Three"
+        assert await items[1:].length() == 2
+        texts = [await item.text async for item in items]
+        assert texts == ["One", "Two", "Three"]
+
+    _run(_test)
+
+
+def test_filter():
+    async def _test(session, _):
+        async def _not_two(element):
+            return await element.text != "Two"
+
+        items = session.elements("li")
+        assert await items.filter(_not_two).length() == 2
+        assert await items.find(_not_two).text == "One"
+        assert isinstance(items.find(_not_two), AsyncElement)
+
+    _run(_test)
+
+
+def test_click():
+    async def _test(session, stub):
+        await session.element("#list").element("li").click()
+        assert stub.clicks == ["first"]
+
+    _run(_test)
+
+
+def test_missing():
+    async def _test(session, _):
+        missing = session.element("#missing")
+        assert not await missing.exists
+        with pytest.raises(NoSuchElementException):
+            await missing.get_actual()
+        with pytest.raises(TimeoutError):
+            await missing.assure(exist, 0.05, FixedPolling(0.01))
+
+    _run(_test)
+
+
+def test_should_visible():
+    async def _test(session, _):
+        loading = session.element("#loading")
+        await loading.should(visible, 1, FixedPolling(0.01))
+        with pytest.raises(AssertionError):
+            await session.element("#missing").should(visible, 0.05, FixedPolling(0.01))
+
+    _run(_test)
+
+
+def test_assure_all_is_deadline():
+    async def _test(session, _):
+        async def _has_child(element):
+            await element.element("span").assure(exist, 5, FixedPolling(0.01))
+            return True
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            await session.elements("li").assure_all(_has_child, 0.2, polling=FixedPolling(0.01))
+        assert time.monotonic() - start < 2  # nested waits use only the time left
+
+    _run(_test)
+
+
+def test_concurrent_sessions():
+    async def _session_text(url):
+        async with AsyncBrowserSession(url) as session:
+            await session.open("/page")
+            return await session.element(".header").text
+
+    async def _test():
+        async with StubWebDriver() as stub:
+            texts = await asyncio.gather(*(_session_text(stub.url) for _ in range(20)))
+            assert texts == ["Hello"] * 20
+            assert not stub.sessions  # all sessions are deleted
+
+    asyncio.run(_test())
@@ -7,9 +7,11 @@ import time
 import pytest
 import requests
 
+from pyasli import conditions
 from pyasli.browsers import BrowserSession
 from pyasli.elements.elements import Element
 from pyasli.exceptions import NoBrowserException
+from tests.fake_driver import FakeExecutor, VirtualListPage, table_page
 
 
 @pytest.fixture(scope="session")
@@ -121,8 +123,7 @@ class ElementMock(Element):
     """Element mocking checks"""
 
     def __init__(self):
-        self.timeout = 0.01
-        self._locator = None
+        self.timeout = 0.05
         self._visible = TimeoutCondition(self.timeout)
         self._text = TimeoutCondition(self.timeout, ("before", "after"))
         self._exists = TimeoutCondition(self.timeout)
@@ -154,6 +155,24 @@ class ElementMock(Element):
     def enabled(self):
         return self._enabled()
 
+    @property
+    def fresh_snapshot(self):
+        return None
+
+    def evaluate(self, predicate):
+        """Check browser-side predicate of condition with mocked properties"""
+        return _MOCK_PREDICATES[predicate](self)
+
+
+_MOCK_PREDICATES = {
+    conditions.visible.js: lambda element: element.visible,
+    conditions.exist.js: lambda element: element.exists,
+    conditions.missing.js: lambda element: not element.exists,
+    conditions.enabled.js: lambda element: element.enabled,
+    conditions.disabled.js: lambda element: not element.enabled,
+    conditions.clickable.js: lambda element: element.visible and element.enabled,
+}
+
 
 @pytest.fixture
 def element() -> ElementMock:
@@ -165,3 +184,85 @@ def element() -> ElementMock:
 def random_string():
     """Generate 10 char random string"""
     return "".join(random.choice(string.ascii_letters) for _ in range(10))
+
+
+FAKE_PAGES = {
+    "/login": ("html", {}, [("body", {}, [
+        ("div", {"id": "content"}, [
+            ("form", {"id": "login"}, [
+                ("div", {"class": "row"}, [
+                    ("label", {"for": "username"}, "Username"),
+                    ("input", {"id": "username", "name": "username", "type": "text"}, []),
+                ]),
+                ("div", {"class": "row"}, [
+                    ("label", {"for": "password"}, "Password"),
+                    ("input", {"id": "password", "name": "password", "type": "password"}, []),
+                ]),
+                ("button", {"class": "radius", "type": "submit"}, "Login"),
+                ("div", {"id": "hidden", "displayed": False}, "Hidden text"),
+            ]),
+        ]),
+    ])]),
+    **{f"/table/{rows}": table_page(rows) for rows in (3, 10, 100, 1000)},
+    "/virtual": lambda: VirtualListPage(95),
+    "/form": ("html", {}, [("body", {}, [
+        ("form", {"id": "settings"}, [
+            ("input", {"id": "nickname", "type": "text"}, []),
+            ("input", {"id": "news", "type": "checkbox", "checked": "checked"}, []),
+            ("input", {"id": "light", "name": "theme", "type": "radio", "value": "light", "checked": "checked"}, []),
+            ("input", {"id": "dark", "name": "theme", "type": "radio", "value": "dark"}, []),
+            ("select", {"id": "language"}, [
+                ("option", {"value": "en", "selected": "selected"}, "English"),
+                ("option", {"value": "de"}, "Deutsch"),
+            ]),
+        ]),
+    ])]),
+    "/grid": ("html", {}, [("body", {}, [
+        ("table", {"id": "grid"}, [
+            ("thead", {}, [("tr", {}, [
+                ("th", {}, "Name"),
+                ("th", {"colspan": "2"}, "Contacts"),
+            ])]),
+            ("tbody", {}, [
+                ("tr", {}, [
+                    ("td", {"rowspan": "2", "data-id": "alice"}, "Alice"),
+                    ("td", {}, "alice@example.com"),
+                    ("td", {}, "123"),
+                ]),
+                ("tr", {}, [
+                    ("td", {}, "alice@example.org"),
+                    ("td", {}, "456"),
+                ]),
+                ("tr", {}, [
+                    ("td", {"data-id": "bob"}, "Bob"),
+                    ("td", {"colspan": "2"}, "none"),
+                ]),
+            ]),
+        ]),
+    ])]),
+}
+
+
+@pytest.fixture
+def fake_browser(request):
+    """Browser session using in-memory fake WebDriver, see :mod:`tests.fake_driver`
+
+    Session is opened at ``/login`` of `FAKE_PAGES`, other page is set with indirect parametrisation:
+    ``@pytest.mark.parametrize("fake_browser", ["/form"], indirect=True)``
+    """
+    session = BrowserSession(log_level=None)
+    session.setup_browser("chrome", remote=True, command_executor=FakeExecutor(FAKE_PAGES))
+    session.open(getattr(request, "param", "/login"))
+    yield session
+    session.close_all_windows()
+
+
+@pytest.fixture
+def fake_executor(fake_browser) -> FakeExecutor:
+    """Fake remote end of `fake_browser`, counting received commands and holding the current page"""
+    return fake_browser.get_actual().command_executor
+
+
+def fake_page(*paths: str):
+    """Run tests with `fake_browser` opened at each of given `FAKE_PAGES`"""
+    return pytest.mark.parametrize("fake_browser", paths, indirect=True)
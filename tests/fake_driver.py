@@ -0,0 +1,568 @@
+"""In-memory WebDriver remote end for tests not requiring real browser
+
+`FakeExecutor` replaces selenium `RemoteConnection`, so real `Remote` and `WebElement` classes are used.
+Page is described with nested ``(tag, attributes, children_or_text)`` tuples.
+Only simple CSS selectors (tags, ids, classes, attributes, descendant and child combinators)
+and a few XPath expressions used by pyasli are supported.
+Scripts are not executed: selenium atoms and pyasli scripts are recognised by marker comments and emulated,
+pyasli script ``/* pyasli:<name> */`` is handled by ``_script_<name>`` method.
+Only predicates of built-in conditions are supported in scripts.
+"""
+import base64
+import json
+import re
+from collections import Counter
+
+from pyasli import conditions
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+_SCRIPT_MARKER = re.compile(r"/\* pyasli:(\w+) \*/")
+_PREDICATE = re.compile(r"function \(el\) \{ return \((.*)\); }(?:,|];)$", re.MULTILINE)
+_COMPOUND = re.compile(r"([a-zA-Z][\w-]*)|#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:=\"([^\"]*)\")?]")
+
+
+def table_page(rows):
+    """Page with table of given number of rows, row `i` is ``tr.row#row-i`` with single ``cell i`` cell"""
+    return ("html", {}, [("body", {}, [
+        ("table", {"id": "table"}, [
+            ("tr", {"class": "row", "id": f"row-{i}"}, [("td", {}, f"cell {i}")]) for i in range(rows)
+        ]),
+    ])])
+
+
+class FakeNode:
+    """Single element of fake page"""
+
+    def __init__(self, index, tag, attributes, parent=None):
+        self.index = index
+        self.tag = tag
+        self.attributes = dict(attributes)
+        self.displayed = self.attributes.pop("displayed", True)
+        self.parent = parent
+        self.children = []
+        self.text = ""
+        self.generation = 0
+        self.clicks = 0
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def matches_compound(self, selector):
+        for tag, node_id, cls, attr, value in _COMPOUND.findall(selector):
+            if tag and tag != self.tag:
+                return False
+            if node_id and self.attributes.get("id") != node_id:
+                return False
+            if cls and cls not in self.attributes.get("class", "").split():
+                return False
+            if attr and (attr not in self.attributes or (value and self.attributes[attr] != value)):
+                return False
+        return True
+
+    def matches(self, selector):
+        parts = selector.replace(">", " > ").split()
+        if not self.matches_compound(parts[-1]):
+            return False
+        node, index = self, len(parts) - 2
+        while index >= 0:
+            if parts[index] == ">":
+                node = node.parent
+                if node is None or not node.matches_compound(parts[index - 1]):
+                    return False
+                index -= 2
+                continue
+            node = next((anc for anc in node.ancestors() if anc.matches_compound(parts[index])), None)
+            if node is None:
+                return False
+            index -= 1
+        return True
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attributes}>"
+
+
+class FakePage:
+    """Tree of fake nodes"""
+
+    def __init__(self, spec=("html", {}, [])):
+        self.nodes = []
+        self.version = 0  # DOM mutation counter
+        self.seen = {}  # keys of elements seen by scroll scripts, by token
+        self.root = self._build(("#document", {}, [spec]), None)
+
+    def _build(self, spec, parent):
+        tag, attributes, content = spec
+        node = FakeNode(len(self.nodes), tag, attributes, parent)
+        self.nodes.append(node)
+        if isinstance(content, str):
+            node.text = content
+        else:
+            node.children = [self._build(child, node) for child in content]
+        return node
+
+    def find(self, selector) -> FakeNode:
+        """Find node by CSS selector"""
+        return next(node for node in self.root.descendants() if node.matches(selector))
+
+    def rerender(self, node):
+        """Make all references to node and its descendants stale"""
+        for stale in (node, *node.descendants()):
+            stale.generation += 1
+        self.version += 1
+
+    def scroll_to(self, node):
+        """Scroll node into view, static page doesn't change"""
+
+    def fill(self, node, value) -> bool:
+        """Set field value the same way pyasli fill script does, `False` if there's no radio button with the value"""
+        kind = node.attributes.get("type")
+        if kind == "radio" and not isinstance(value, bool):
+            name = node.attributes.get("name")
+            group = [node]
+            if name:
+                group = [radio for radio in self.root.descendants() if radio.attributes.get("name") == name]
+            node = next((radio for radio in group if radio.attributes.get("value") == str(value)), None)
+            if node is None:
+                return False
+        if kind in ("checkbox", "radio"):
+            if value is False:
+                node.attributes.pop("checked", None)
+            else:
+                node.attributes["checked"] = "checked"
+        elif node.tag == "select":
+            wanted = [str(option) for option in (value if isinstance(value, list) else [value])]
+            for option in node.children:
+                option.attributes.pop("selected", None)
+                if option.attributes["value"] in wanted or option.text in wanted:
+                    option.attributes["selected"] = "selected"
+        else:
+            node.attributes["value"] = "" if value is None else str(value)
+        self.version += 1
+        return True
+
+
+class VirtualListPage(FakePage):
+    """Virtualised list of `total` items ``div.item`` with `data-id` and text ``item <i>`` in ``div#list``
+
+    Only `window` items are rendered, scrolling item into view renders `window` items starting from it,
+    nodes of already rendered items are kept
+    """
+
+    def __init__(self, total, window=20):
+        super().__init__(("html", {}, [("body", {}, [("div", {"id": "list"}, [])])]))
+        self.total = total
+        self.window = window
+        self.list = self.find("#list")
+        self.render(0)
+
+    def render(self, first):
+        """Render window starting from `first` item, keeping nodes of items which stay rendered"""
+        ids = range(first, min(first + self.window, self.total))
+        kept = {}
+        for node in self.list.children:
+            if int(node.attributes["data-id"]) in ids:
+                kept[int(node.attributes["data-id"])] = node
+            else:
+                self.rerender(node)
+        self.list.children = [
+            kept.get(i) or self._build(("div", {"class": "item", "data-id": str(i)}, f"item {i}"), self.list)
+            for i in ids
+        ]
+        self.version += 1
+
+    def scroll_to(self, node):
+        if node.parent is self.list:
+            self.render(int(node.attributes["data-id"]))
+
+
+class FakeExecutor:
+    """Command executor emulating W3C remote end"""
+
+    def __init__(self, pages: dict):
+        self.pages = pages
+        self.page = FakePage()
+        self.url = "about:blank"
+        self.commands = Counter()
+        self.found = 0  # number of element references returned by search commands
+        self.predicates = []  # predicates of currently executed script
+        self.actions = []
+        self.scrolled = []  # nodes scrolled into view by scripts
+        self.timeouts = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+
+    def close(self):
+        """Close connection to remote end"""
+
+    def execute(self, command, params):
+        self.commands[command] += 1
+        try:
+            value = getattr(self, f"_{command}", self._unknown)(params)
+        except W3CError as error:
+            return {"status": 404, "value": json.dumps({"value": {"error": error.code, "message": str(error)}})}
+        return {"status": 0, "value": value}
+
+    def _unknown(self, params):
+        raise W3CError("unknown command", f"Command is not supported by fake driver: {params}")
+
+    # references
+
+    def ref(self, node):
+        return {ELEMENT_KEY: f"{node.index}:{node.generation}:{id(self.page)}"}
+
+    def node(self, params, key="id"):
+        ref = params[key]
+        if isinstance(ref, dict):
+            ref = ref[ELEMENT_KEY]
+        index, generation, page = ref.split(":")
+        node = self.page.nodes[int(index)] if page == str(id(self.page)) else None
+        if node is None or str(node.generation) != generation:
+            raise W3CError("stale element reference", f"Element {ref} is stale")
+        return node
+
+    # session
+
+    def _newSession(self, _):  # noqa: N802
+        return {"sessionId": "fake", "capabilities": {"browserName": "chrome"}}
+
+    def _get(self, params):
+        self.url = params["url"]
+        page = self.pages[self.url]
+        self.page = page() if callable(page) else FakePage(page)
+
+    def _getCurrentUrl(self, _):  # noqa: N802
+        return self.url
+
+    def _quit(self, _):
+        self.page = FakePage()
+
+    def _getTimeouts(self, _):  # noqa: N802
+        return dict(self.timeouts)
+
+    def _setTimeouts(self, params):  # noqa: N802
+        self.timeouts.update(params)
+
+    # search
+
+    def _search(self, context, params):
+        using, value = params["using"], params["value"]
+        if using == "xpath":
+            return {
+                "./..": [context.parent],
+                "./*": context.children,
+                "./ancestor::*": [node for node in reversed(list(context.ancestors())) if node is not self.page.root],
+            }[value]
+        return [node for node in context.descendants() if node.matches(value)]
+
+    def _single(self, found, params):
+        if not found:
+            raise W3CError("no such element", f"Nothing found by {params['value']}")
+        self.found += 1
+        return self.ref(found[0])
+
+    def _multiple(self, found):
+        self.found += len(found)
+        return [self.ref(node) for node in found]
+
+    def _findElement(self, params):  # noqa: N802
+        return self._single(self._search(self.page.root, params), params)
+
+    def _findElements(self, params):  # noqa: N802
+        return self._multiple(self._search(self.page.root, params))
+
+    def _findChildElement(self, params):  # noqa: N802
+        return self._single(self._search(self.node(params), params), params)
+
+    def _findChildElements(self, params):  # noqa: N802
+        return self._multiple(self._search(self.node(params), params))
+
+    # element state
+
+    def _getElementText(self, params):  # noqa: N802
+        return _text(self.node(params))
+
+    def _getElementTagName(self, params):  # noqa: N802
+        return self.node(params).tag
+
+    def _isElementSelected(self, params):  # noqa: N802
+        return "checked" in self.node(params).attributes
+
+    def _isElementEnabled(self, params):  # noqa: N802
+        return "disabled" not in self.node(params).attributes
+
+    def _getElementRect(self, params):  # noqa: N802
+        self.node(params)
+        return _RECT
+
+    # interactions
+
+    def _clickElement(self, params):  # noqa: N802
+        self.node(params).clicks += 1
+
+    def _clearElement(self, params):  # noqa: N802
+        self.node(params).attributes["value"] = ""
+        self.page.version += 1
+
+    def _sendKeysToElement(self, params):  # noqa: N802
+        node = self.node(params)
+        node.attributes["value"] = node.attributes.get("value", "") + params["text"]
+        self.page.version += 1
+
+    def _actions(self, params):
+        pointed = None
+        for source in params["actions"]:
+            for action in source["actions"]:
+                if isinstance(action.get("origin"), dict):
+                    pointed = self.node({"id": action["origin"]})
+                elif action["type"] == "pointerDown" and pointed is not None:
+                    pointed.clicks += 1
+        self.actions.append(params["actions"])
+
+    def _clearActionState(self, _):  # noqa: N802
+        return None
+
+    def _screenshot(self, _):
+        return _SCREENSHOT
+
+    def _elementScreenshot(self, params):  # noqa: N802
+        self.node(params)
+        return _SCREENSHOT
+
+    # scripts
+
+    def _w3cExecuteScript(self, params):  # noqa: N802
+        script, args = params["script"], params["args"]
+        if script.startswith("/* getAttribute */"):
+            return self.node(args, 0).attributes.get(args[1])
+        if script.startswith("/* isDisplayed */"):
+            return self.node(args, 0).displayed
+        if script.startswith("arguments[0].scrollIntoView(true)"):
+            self.page.scroll_to(self.node(args, 0))
+            return {"x": 0, "y": 0, "width": 10, "height": 10}
+        marker = _SCRIPT_MARKER.match(script)
+        handler = marker and getattr(self, f"_script_{marker.group(1)}", None)
+        if handler is None:
+            raise W3CError("javascript error", "Script is not supported by fake driver")
+        self.commands[f"script:{marker.group(1)}"] += 1
+        self.predicates = [_PREDICATES[predicate] for predicate in _PREDICATE.findall(script)]
+        return handler(args)
+
+    _w3cExecuteScriptAsync = _w3cExecuteScript  # noqa: N815
+
+    def resolve(self, steps, start=None):
+        """Emulate `__resolve` of pyasli scripts"""
+        nodes = [self.page.root] if start is None else start
+        for word, *params in steps:
+            if word in ("find", "findAll"):
+                search = {"using": params[0], "value": params[1]}
+                found = [result for node in nodes for result in self._search(node, search)]
+                nodes = found[:1] if word == "find" else found
+            elif word == "index":
+                index = params[0] + len(nodes) if params[0] < 0 else params[0]
+                nodes = nodes[index:index + 1] if index >= 0 else []
+            elif word == "slice":
+                nodes = nodes[slice(*params)]
+            elif word in ("filter", "first"):
+                nodes = [node for node in nodes if self.predicates[params[0]](node)]
+                nodes = nodes[:1] if word == "first" else nodes
+            else:
+                raise W3CError("javascript error", f"Step {word} is not supported by fake driver")
+        return nodes
+
+    def nodes(self, refs):
+        """Nodes by script argument: single reference, list of references or `None` for the page root"""
+        if refs is None:
+            return None
+        if isinstance(refs, list):
+            return [self.node({"id": ref}) for ref in refs]
+        return [self.node({"id": refs})]
+
+    def _script_resolve(self, args):
+        return self._multiple(self.resolve(args[1], self.nodes(args[0])))
+
+    def _script_wait(self, args):
+        """Browser-side wait, fake page is static so the predicate is checked once"""
+        nodes = self.resolve(args[0])
+        return bool(self.predicates[-1](nodes[0] if nodes else None))
+
+    def _script_evaluate(self, args):
+        if args[1] is None:
+            nodes = self.nodes(args[0]) or []
+        else:
+            nodes = self.resolve(args[1])
+        return bool(self.predicates[-1](nodes[0] if nodes else None))
+
+    def _script_locate(self, args):
+        found = [self.resolve(steps, self.nodes(start))[:1] for start, steps, _ in args[0]]
+        self.found += sum(map(len, found))
+        self.scrolled.extend(nodes[0] for nodes, (_, _, scroll) in zip(found, args[0]) if nodes and scroll)
+        return [self.ref(nodes[0]) if nodes else None for nodes in found]
+
+    def _script_lookup(self, args):
+        stamp = [str(id(self.page)), self.page.version]
+        if args[0] == stamp:
+            return [stamp, None]
+        return [stamp, self._script_resolve([None, args[1]])]
+
+    def _script_snapshot(self, args):
+        nodes = self.resolve(args[1], self.nodes(args[0]))
+        if not nodes:
+            return None
+        node = nodes[0]
+        return [self.ref(node), {
+            "text": _text(node),
+            "tagName": node.tag,
+            "value": node.attributes.get("value"),
+            "ariaDisabled": node.attributes.get("aria-disabled"),
+            "rect": _RECT,
+            "attributes": {name: node.attributes.get(name) for name in args[2]},
+            **_state(node),
+        }]
+
+    def _column(self, args, getter):
+        return [getter(node, args[2]) for node in self.resolve(args[1], self.nodes(args[0]))]
+
+    def _script_scroll(self, args):
+        key, seen = args[2], self.page.seen.setdefault(args[3], set())
+        fresh = []
+        for node in self.resolve(args[1], self.nodes(args[0])):
+            value = node.attributes.get(key)
+            if value is not None and value not in seen:
+                seen.add(value)
+                fresh.append(node)
+        return [self._multiple(fresh), [node.attributes[key] for node in fresh]]
+
+    def _script_forget(self, args):
+        self.page.seen.pop(args[0], None)
+
+    def _script_table(self, args):
+        nodes = self.resolve(args[1], self.nodes(args[0]))
+        if not nodes:
+            return None
+        table, name, first, count, pending = nodes[0], *args[2:6]
+        rows = [node for node in table.descendants() if node.tag == "tr"]
+        head = [row for row in rows if row.parent.tag == "thead"]
+        if not head and rows and all(cell.tag == "th" for cell in rows[0].children):
+            head = rows[:1]
+        body = [row for row in rows if row not in head]
+        headers = [_text(cell) for cell in (head[-1].children if head else []) for _ in range(_span(cell, "colspan"))]
+        lines, spans = [], []
+        for index, row in enumerate(body[first:len(body) if count is None else first + count], first):
+            line = {}
+            for column, _, columns, value in pending:
+                line.update(dict.fromkeys(range(column, column + columns), value))
+            pending = [[column, left - 1, columns, value] for column, left, columns, value in pending if left > 1]
+            column = 0
+            for cell in row.children:
+                while column in line:
+                    column += 1
+                value = _text(cell) if name is None else cell.attributes.get(name)
+                rows_spanned, columns_spanned = _span(cell, "rowspan"), _span(cell, "colspan")
+                line.update(dict.fromkeys(range(column, column + columns_spanned), value))
+                if rows_spanned > 1 or columns_spanned > 1:
+                    spans.append([index, column, rows_spanned, columns_spanned])
+                if rows_spanned > 1:
+                    pending.append([column, rows_spanned - 1, columns_spanned, value])
+                column += columns_spanned
+            lines.append([line.get(column) for column in range(max(line, default=-1) + 1)])
+        self.found += 1
+        return [self.ref(table), {"headers": headers, "rows": lines, "spans": spans, "pending": pending,
+                                  "total": len(body)}]
+
+    def _script_entry(self, args):
+        node = self.nodes(args[0])[0]
+        node.attributes["value"] = (node.attributes.get("value", "") if args[2] else "") + args[1]
+        self.page.version += 1
+
+    def _script_fill(self, args):
+        roots = self.resolve(args[1], self.nodes(args[0]))
+        missing = []
+        for index, (step, value) in enumerate(args[2]):
+            found = self.resolve([step], roots[:1]) if roots else []
+            if not found or not self.page.fill(found[0], value):
+                missing.append(index)
+        return missing
+
+    def _script_stream(self, args):
+        nodes = self.resolve(args[1], self.nodes(args[0]))
+        return [[_COLUMN_VALUES[column](node, name) for column, name in args[2]] for node in nodes]
+
+    def _script_texts(self, args):
+        return self._column(args, _COLUMN_VALUES["texts"])
+
+    def _script_attributes(self, args):
+        return self._column(args, _COLUMN_VALUES["attributes"])
+
+    _script_properties = _script_attributes
+
+    def _script_rects(self, args):
+        return self._column(args, _COLUMN_VALUES["rects"])
+
+    def _script_states(self, args):
+        return self._column(args, _COLUMN_VALUES["states"])
+
+
+# column of values read by scripts -> getter of the value of the node by column argument
+_COLUMN_VALUES = {
+    "texts": lambda node, _: _text(node),
+    "attributes": lambda node, name: node.attributes.get(name),
+    "rects": lambda node, _: _RECT,
+    "states": lambda node, _: _state(node),
+}
+
+
+def _span(cell, attribute):
+    return int(cell.attributes.get(attribute, 1))
+
+
+def _enabled(node):
+    return "disabled" not in node.attributes and "aria-disabled" not in node.attributes
+
+
+_PREDICATES = {
+    conditions.visible.js: lambda node: node is not None and node.displayed,
+    conditions.hidden.js: lambda node: node is None or not node.displayed,
+    conditions.exist.js: lambda node: node is not None,
+    conditions.missing.js: lambda node: node is None,
+    conditions.enabled.js: lambda node: node is not None and _enabled(node),
+    conditions.disabled.js: lambda node: node is not None and not _enabled(node),
+    conditions.clickable.js: lambda node: node is not None and node.displayed and _enabled(node),
+}
+
+
+def add_predicate(condition, check):
+    """Make browser-side predicate of the condition known to fake driver, `check` gets node or `None`"""
+    _PREDICATES[condition.js] = check
+
+_SCREENSHOT = base64.b64encode(b"\x89PNG\r\n\x1a\n").decode()
+
+_RECT = {"x": 0, "y": 0, "width": 10, "height": 10}
+
+
+def _text(node):
+    if not node.displayed:
+        return ""
+    return " ".join(text for text in (node.text, *(child.text for child in node.descendants())) if text)
+
+
+def _state(node):
+    return {
+        "visible": node.displayed,
+        "enabled": _enabled(node),
+        "selected": "checked" in node.attributes,
+    }
+
+
+class W3CError(Exception):
+    """Error response of the remote end"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code